@@ -1,8 +1,17 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
 import base58
 
 
-def decode_address(address: str) -> bytes:
-    """Decodes base58-encoded Ripple account ID"""
+# Number of addresses remembered by each direction of the codec. The same
+# accounts tend to appear over and over in ledgers and paths, so both
+# directions are cached.
+CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _decode_address(address: str) -> bytes:
     decoded = base58.b58decode_check(address, alphabet=base58.RIPPLE_ALPHABET)
     if decoded[0] == 0 and len(decoded) == 21:  # is an address
         return decoded[1:]
@@ -10,8 +19,60 @@ def decode_address(address: str) -> bytes:
         raise ValueError("Not an AccountID!")
 
 
-def encode_address(value: bytes) -> str:
-    """Encodes Ripple account ID using base58"""
+@lru_cache(maxsize=CACHE_SIZE)
+def _encode_address(value: bytes) -> str:
     return base58.b58encode_check(
         b''.join((b'\x00', value)), alphabet=base58.RIPPLE_ALPHABET
     ).decode()
+
+
+def decode_address(address: str) -> bytes:
+    """Decodes base58-encoded Ripple account ID"""
+    return _decode_address(address)
+
+
+def encode_address(value: bytes) -> str:
+    """Encodes Ripple account ID using base58"""
+    return _encode_address(bytes(value))
+
+
+def decode_addresses(addresses: Iterable[str]) -> List[bytes]:
+    """
+    Decodes multiple base58-encoded Ripple account IDs, each distinct
+    address is decoded once
+    """
+    addresses = list(addresses)
+    decoded = {
+        address: _decode_address(address)
+        for address in dict.fromkeys(addresses)
+    }
+    return [decoded[address] for address in addresses]
+
+
+def encode_addresses(values: Iterable[bytes]) -> List[str]:
+    """
+    Encodes multiple Ripple account IDs using base58, each distinct account
+    ID is encoded once
+    """
+    values = [bytes(value) for value in values]
+    encoded = {
+        value: _encode_address(value) for value in dict.fromkeys(values)
+    }
+    return [encoded[value] for value in values]
+
+
+def cache_info() -> Dict[str, Any]:
+    """
+    Returns hit and miss statistics of ``encode`` and ``decode`` caches, as
+    returned by ``functools.lru_cache``
+    """
+    return {
+        'encode': _encode_address.cache_info(),
+        'decode': _decode_address.cache_info()
+    }
+
+
+def cache_clear():
+    """Clears address caches"""
+    _encode_address.cache_clear()
+    _decode_address.cache_clear()
@@ -0,0 +1,695 @@
+"""
+Append-only archive of serialized transactions read through ``mmap``.
+
+An archive consists of these files:
+
+* ``<path>`` holds blobs stored back to back, so it can also be read with
+  :func:`aioxrpy.stream.iter_blobs`
+* ``<path>.idx`` holds a fixed-size record per blob with its hash, offset,
+  length and ledger index
+* ``<path>.hashes`` is a hash table of record numbers by blob hash
+* ``<path>.acct`` holds postings of account IDs found in top-level
+  ``AccountID`` fields of blobs, each linked to the previous posting of the
+  same account
+* ``<path>.heads`` is a hash table of the latest posting of each account
+
+A single :class:`ArchiveWriter` appends to an archive, while any number of
+:class:`Archive` readers, possibly in other processes, map the same files
+and share them through the page cache. Lookups probe the mapped indexes,
+so readers don't build any per-blob state in memory. Blobs are returned as
+``memoryview`` slices of the mapping, which can be passed straight to
+:func:`aioxrpy.serializer.deserialize` without copying.
+
+Blobs and their index entries are written before their records, so readers
+never see records of incomplete blobs, and index entries pointing past the
+last record are ignored. Ledger indexes must not decrease, which allows
+looking up ledgers by bisecting records.
+"""
+from binascii import unhexlify
+import bisect
+import mmap
+import os
+import struct
+from typing import (
+    Any, BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional,
+    Sequence, Tuple, Union, cast
+)
+
+from aioxrpy import serializer
+from aioxrpy.address import decode_address
+from aioxrpy.definitions import RippleType
+from aioxrpy.hash import transaction_id
+
+
+INDEX_SUFFIX = '.idx'
+HASHES_SUFFIX = '.hashes'
+ACCOUNTS_SUFFIX = '.acct'
+HEADS_SUFFIX = '.heads'
+
+_INDEX_MAGIC = b'AXRPIDX1'
+_ACCOUNTS_MAGIC = b'AXRPACT2'
+_TABLE_MAGIC = b'AXRPTBL1'
+# hash, offset, length, ledger index
+_RECORD = struct.Struct('<32sQII')
+# account ID, record number, previous posting of the account plus one
+_POSTING = struct.Struct('<20sII')
+_LEDGER_INDEX_OFFSET = 44
+
+# Hash tables use open addressing with linear probing. Slots hold a key
+# (empty for the hash table, which is checked against records instead)
+# followed by a value plus one, zero marks free slots. Tables are kept at
+# most half full and rebuilt at twice the size when they fill up.
+_TABLE_HEADER = struct.Struct('<8sQ')
+_VALUE = struct.Struct('<I')
+_MIN_SLOTS = 1024
+_HASH_KEY_SIZE = 0
+_ACCOUNT_KEY_SIZE = 20
+
+
+class ArchiveEntry(NamedTuple):
+    """Archived blob with its hash and ledger index"""
+    hash: bytes
+    ledger_index: int
+    blob: memoryview
+
+
+def blob_accounts(blob: serializer.Buffer) -> List[bytes]:
+    """
+    Returns distinct account IDs of top-level ``AccountID`` fields (e.g.
+    ``Account`` and ``Destination``) in serialized object
+    """
+    view = memoryview(blob)
+    accounts = []  # type: List[bytes]
+    cursor = 0
+    end = len(view)
+    while cursor < end:
+        length, field = serializer.lookup_field(view, cursor)
+        cursor += length
+        if field is serializer.OBJECT_END_MARKER:
+            break
+        if field.type_ is RippleType.AccountID:
+            # length prefixed, always 20 bytes long
+            account = bytes(view[cursor + 1:cursor + 21])
+            if account not in accounts:
+                accounts.append(account)
+        cursor += serializer.skip_field(field, view, cursor)
+    return accounts
+
+
+def _account_id(account: Union[bytes, str]) -> bytes:
+    if isinstance(account, str):
+        return decode_address(account)
+    return bytes(account)
+
+
+def _hash(tx_hash: Union[bytes, str]) -> bytes:
+    if isinstance(tx_hash, str):
+        return unhexlify(tx_hash)
+    return bytes(tx_hash)
+
+
+def _open_index(path: str, magic: bytes, record_size: int) -> BinaryIO:
+    """
+    Opens index file for appending, creating it if needed and dropping a
+    partially written record
+    """
+    fileobj = open(path, 'a+b')
+    fileobj.seek(0)
+    header = fileobj.read(len(magic))
+    if not header:
+        fileobj.write(magic)
+        fileobj.flush()
+    elif header != magic:
+        fileobj.close()
+        raise ValueError(f'{path} is not an archive index')
+    size = os.fstat(fileobj.fileno()).st_size
+    fileobj.truncate(size - (size - len(magic)) % record_size)
+    return fileobj
+
+
+def _slots(table: Any, key_size: int) -> int:
+    return (len(table) - _TABLE_HEADER.size) // (key_size + _VALUE.size)
+
+
+def _candidates(table: Any, tx_hash: bytes) -> Iterator[int]:
+    """
+    Yields record numbers in hash table slots probed for ``tx_hash``, which
+    may also belong to colliding hashes
+    """
+    mask = _slots(table, _HASH_KEY_SIZE) - 1
+    slot = int.from_bytes(tx_hash[:8], 'little') & mask
+    while True:
+        value, = _VALUE.unpack_from(
+            table, _TABLE_HEADER.size + slot * _VALUE.size
+        )
+        if not value:
+            return
+        yield value - 1
+        slot = (slot + 1) & mask
+
+
+def _find(table: Any, key_size: int, key: bytes) -> Tuple[int, int]:
+    """
+    Returns offset and value of the slot holding ``key``, or of the free
+    slot ending its probe with value ``-1``. Keys of hash table slots are
+    empty, so the free slot is always returned.
+    """
+    slot_size = key_size + _VALUE.size
+    mask = _slots(table, key_size) - 1
+    slot = int.from_bytes(key[:8], 'little') & mask
+    while True:
+        offset = _TABLE_HEADER.size + slot * slot_size
+        value, = _VALUE.unpack_from(table, offset + key_size)
+        if not value or table[offset:offset + key_size] == key:
+            return offset, value - 1
+        slot = (slot + 1) & mask
+
+
+def _write_table(
+    path: str, key_size: int, slots: int, items: Iterable[Tuple[bytes, int]]
+) -> None:
+    """
+    Writes hash table of ``(key, value)`` items, replacing the file
+    atomically so that readers never map a partially written table
+    """
+    table = bytearray(_TABLE_HEADER.size + slots * (key_size + _VALUE.size))
+    used = 0
+    for key, value in items:
+        offset, _ = _find(table, key_size, key)
+        table[offset:offset + key_size] = key[:key_size]
+        _VALUE.pack_into(table, offset + key_size, value + 1)
+        used += 1
+    _TABLE_HEADER.pack_into(table, 0, _TABLE_MAGIC, used)
+    temp_path = f'{path}.{os.getpid()}'
+    with open(temp_path, 'wb') as fileobj:
+        fileobj.write(table)
+    os.replace(temp_path, path)
+
+
+class _TableWriter:
+    """Hash table file of an archive, updated in place through ``mmap``"""
+
+    def __init__(self, path: str, key_size: int):
+        self.path = path
+        self.key_size = key_size
+        self._map = None  # type: Optional[mmap.mmap]
+        self.used = 0
+
+    def open(self) -> bool:
+        """Maps the table, returns ``False`` if it's missing or invalid"""
+        try:
+            fileobj = open(self.path, 'r+b')
+        except FileNotFoundError:
+            return False
+        with fileobj:
+            size = os.fstat(fileobj.fileno()).st_size
+            slots = (size - _TABLE_HEADER.size) // (
+                self.key_size + _VALUE.size
+            )
+            if slots < _MIN_SLOTS or slots & (slots - 1) or (
+                size != _TABLE_HEADER.size
+                + slots * (self.key_size + _VALUE.size)
+            ):
+                return False
+            mapping = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_WRITE)
+        magic, used = _TABLE_HEADER.unpack_from(mapping)
+        if magic != _TABLE_MAGIC:
+            mapping.close()
+            return False
+        self._map = mapping
+        self.used = used
+        return True
+
+    def rebuild(self, items: Iterable[Tuple[bytes, int]], count: int) -> None:
+        """
+        Replaces the table with one holding ``count`` items, which may be
+        read from the current table
+        """
+        slots = _MIN_SLOTS
+        while slots < count * 2 + 2:
+            slots *= 2
+        _write_table(self.path, self.key_size, slots, items)
+        self.close()
+        if not self.open():
+            raise ValueError(f'{self.path} is not an archive index')
+
+    def items(self) -> Iterator[Tuple[bytes, int]]:
+        """Yields ``(slot key, value)`` of occupied slots"""
+        mapping = self._map
+        assert mapping is not None
+        slot_size = self.key_size + _VALUE.size
+        for offset in range(_TABLE_HEADER.size, len(mapping), slot_size):
+            value, = _VALUE.unpack_from(mapping, offset + self.key_size)
+            if value:
+                yield bytes(mapping[offset:offset + self.key_size]), value - 1
+
+    def find(self, key: bytes) -> Tuple[int, int]:
+        """See :func:`_find`"""
+        return _find(self._map, self.key_size, key)
+
+    def insert(self, offset: int, key: bytes, value: int) -> None:
+        """Stores item in a free slot returned by :meth:`find`"""
+        mapping = self._map
+        assert mapping is not None
+        mapping[offset:offset + self.key_size] = key[:self.key_size]
+        self.set(offset, value)
+        self.used += 1
+        _TABLE_HEADER.pack_into(mapping, 0, _TABLE_MAGIC, self.used)
+
+    def set(self, offset: int, value: int) -> None:
+        """Replaces value of an occupied slot"""
+        assert self._map is not None
+        _VALUE.pack_into(self._map, offset + self.key_size, value + 1)
+
+    def is_full(self, added: int) -> bool:
+        """Checks whether adding items would fill more than half of slots"""
+        assert self._map is not None
+        return (self.used + added) * 2 > _slots(self._map, self.key_size)
+
+    def flush(self) -> None:
+        if self._map is not None:
+            self._map.flush()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class ArchiveWriter:
+    """
+    Appends blobs to an archive, creating it if it doesn't exist.
+
+    Only one writer may be open for an archive at a time. Blobs left
+    without records by an interrupted writer are discarded on open, and
+    missing or damaged hash tables are rebuilt. Raises ``ValueError`` if
+    the index is missing or doesn't match the data file.
+
+    :param path: path of the archive data file
+
+    Example:
+
+    .. code-block:: python
+
+        with ArchiveWriter('transactions.bin') as writer:
+            for tx in ledger['transactions']:
+                writer.append(tx['tx_blob'], ledger['ledger_index'])
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if not os.path.exists(path + INDEX_SUFFIX) and (
+            os.path.exists(path) and os.path.getsize(path)
+        ):
+            # without records, blobs of the data file can't be told apart
+            raise ValueError(f'{path} has no archive index')
+        self._index = _open_index(
+            path + INDEX_SUFFIX, _INDEX_MAGIC, _RECORD.size
+        )
+        self._postings = _open_index(
+            path + ACCOUNTS_SUFFIX, _ACCOUNTS_MAGIC, _POSTING.size
+        )
+        self._data = open(path, 'a+b')
+        self._hashes = _TableWriter(path + HASHES_SUFFIX, _HASH_KEY_SIZE)
+        self._heads = _TableWriter(path + HEADS_SUFFIX, _ACCOUNT_KEY_SIZE)
+
+        size = os.fstat(self._index.fileno()).st_size
+        self._count = (size - len(_INDEX_MAGIC)) // _RECORD.size
+        self._offset = 0
+        self._ledger_index = 0
+        if self._count:
+            self._index.seek(size - _RECORD.size)
+            _, offset, length, self._ledger_index = _RECORD.unpack(
+                self._index.read(_RECORD.size)
+            )
+            self._offset = offset + length
+        if os.fstat(self._data.fileno()).st_size < self._offset:
+            self.close()
+            raise ValueError(f'{path} is shorter than its archive index')
+        # only blobs past the last record are discarded
+        self._data.truncate(self._offset)
+
+        size = os.fstat(self._postings.fileno()).st_size
+        self._posting_count = (size - len(_ACCOUNTS_MAGIC)) // _POSTING.size
+        if not self._heads.open():
+            heads = self._scan_heads()
+            self._heads.rebuild(heads.items(), len(heads))
+        # postings of a record being written may be incomplete, heads of
+        # their accounts are moved back to previous postings
+        while self._posting_count:
+            position = self._posting_count - 1
+            account, number, previous = self._read_posting(position)
+            if number < self._count:
+                break
+            offset, head = self._heads.find(account)
+            if head == position:
+                self._heads.set(offset, previous - 1)
+            self._posting_count = position
+        self._postings.truncate(
+            len(_ACCOUNTS_MAGIC) + self._posting_count * _POSTING.size
+        )
+
+        if not self._hashes.open():
+            self._hashes.rebuild(self._scan_hashes(), self._count)
+
+    def _read_posting(self, position: int) -> Tuple[bytes, int, int]:
+        self._postings.seek(len(_ACCOUNTS_MAGIC) + position * _POSTING.size)
+        return _POSTING.unpack(self._postings.read(_POSTING.size))
+
+    def _scan_hashes(self) -> Iterator[Tuple[bytes, int]]:
+        """Yields ``(hash, record number)`` of all records"""
+        self._index.seek(len(_INDEX_MAGIC))
+        number = 0
+        while number < self._count:
+            chunk = self._index.read(
+                min(self._count - number, 65536) * _RECORD.size
+            )
+            for tx_hash, _, _, _ in _RECORD.iter_unpack(chunk):
+                yield tx_hash, number
+                number += 1
+
+    def _scan_heads(self) -> Dict[bytes, int]:
+        """Returns latest postings of all accounts"""
+        heads = {}  # type: Dict[bytes, int]
+        self._postings.seek(len(_ACCOUNTS_MAGIC))
+        position = 0
+        while position < self._posting_count:
+            chunk = self._postings.read(
+                min(self._posting_count - position, 65536) * _POSTING.size
+            )
+            for account, _, _ in _POSTING.iter_unpack(chunk):
+                heads[account] = position
+                position += 1
+        return heads
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _add_postings(self, accounts: List[bytes], number: int) -> None:
+        if self._heads.is_full(len(accounts)):
+            self._heads.rebuild(
+                self._heads.items(), self._heads.used + len(accounts)
+            )
+        self._postings.write(b''.join(
+            _POSTING.pack(account, number, self._heads.find(account)[1] + 1)
+            for account in accounts
+        ))
+        self._postings.flush()
+        # postings are written before heads refer to them
+        for position, account in enumerate(accounts, self._posting_count):
+            offset, head = self._heads.find(account)
+            if head < 0:
+                self._heads.insert(offset, account, position)
+            else:
+                self._heads.set(offset, position)
+        self._posting_count += len(accounts)
+
+    def append(
+        self,
+        blob: Union[bytes, str],
+        ledger_index: int,
+        tx_hash: Optional[bytes] = None
+    ) -> bytes:
+        """
+        Appends serialized object and returns its hash.
+
+        :param blob: serialized object (``bytes`` or hex string)
+        :param ledger_index: index of ledger containing the object, can't be
+                             lower than ledger index of the previous one
+        :param tx_hash: hash to index the object by, defaults to transaction
+                        ID of the blob
+        """
+        if isinstance(blob, str):
+            blob = unhexlify(blob)
+        if ledger_index < self._ledger_index:
+            raise ValueError(
+                f'Ledger index {ledger_index} is lower than '
+                f'{self._ledger_index} of the previous blob'
+            )
+        if tx_hash is None:
+            tx_hash = transaction_id(blob)
+        number = self._count
+        self._data.write(blob)
+        self._data.flush()
+        self._add_postings(blob_accounts(blob), number)
+        if self._hashes.is_full(1):
+            self._hashes.rebuild(self._scan_hashes(), self._count + 1)
+        offset, _ = self._hashes.find(tx_hash)
+        self._hashes.insert(offset, b'', number)
+        # the record is written last, committing the blob
+        self._index.write(
+            _RECORD.pack(tx_hash, self._offset, len(blob), ledger_index)
+        )
+        self._index.flush()
+        self._count += 1
+        self._offset += len(blob)
+        self._ledger_index = ledger_index
+        return tx_hash
+
+    def sync(self) -> None:
+        """Flushes appended blobs and records to disk"""
+        for table in (self._heads, self._hashes):
+            table.flush()
+        for fileobj in (self._data, self._postings, self._index):
+            fileobj.flush()
+            os.fsync(fileobj.fileno())
+
+    def close(self) -> None:
+        self._heads.close()
+        self._hashes.close()
+        for fileobj in (self._data, self._postings, self._index):
+            fileobj.close()
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _map(path: str) -> Optional[mmap.mmap]:
+    with open(path, 'rb') as fileobj:
+        if not os.fstat(fileobj.fileno()).st_size:
+            # empty files can't be mapped
+            return None
+        return mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _view(mapping: Optional[mmap.mmap]) -> memoryview:
+    if mapping is None:
+        return memoryview(b'')
+    return memoryview(cast(Any, mapping))
+
+
+def _release(mapping: Optional[mmap.mmap]) -> None:
+    if mapping is None:
+        return
+    try:
+        mapping.close()
+    except BufferError:
+        # blobs handed out still refer to it, it's unmapped once they're
+        # garbage collected
+        pass
+
+
+class _LedgerIndexes(Sequence):
+    """Ledger indexes of records, for bisecting"""
+
+    def __init__(self, index: memoryview, count: int):
+        self._index = index
+        self._count = count
+
+    def __getitem__(self, number):
+        offset = (
+            len(_INDEX_MAGIC) + number * _RECORD.size + _LEDGER_INDEX_OFFSET
+        )
+        return struct.unpack_from('<I', self._index, offset)[0]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class Archive:
+    """
+    Read-only view of an archive written by :class:`ArchiveWriter`.
+
+    Hash and account lookups probe hash tables mapped from the archive
+    files. Blobs appended after opening become visible after calling
+    :meth:`refresh`.
+
+    Blobs are slices of the file mapping, which stays mapped as long as any
+    of them exists, even if the archive is closed.
+
+    :param path: path of the archive data file
+
+    Example:
+
+    .. code-block:: python
+
+        with Archive('transactions.bin') as archive:
+            for blob in archive.by_account(address):
+                tx = deserialize(blob)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data_map = None  # type: Optional[mmap.mmap]
+        self._index_map = None  # type: Optional[mmap.mmap]
+        self._hashes_map = None  # type: Optional[mmap.mmap]
+        self._postings_map = None  # type: Optional[mmap.mmap]
+        self._heads_map = None  # type: Optional[mmap.mmap]
+        self._data = memoryview(b'')
+        self._index = memoryview(b'')
+        self._count = 0
+        self.refresh()
+
+    def _map_table(self, suffix: str, key_size: int) -> mmap.mmap:
+        try:
+            mapping = _map(self.path + suffix)
+        except FileNotFoundError:
+            mapping = None
+        if mapping is None or len(mapping) < _TABLE_HEADER.size or (
+            mapping[:len(_TABLE_MAGIC)] != _TABLE_MAGIC
+        ) or _slots(mapping, key_size) < _MIN_SLOTS:
+            _release(mapping)
+            raise ValueError(f'{self.path}{suffix} is not an archive index')
+        return mapping
+
+    def refresh(self) -> None:
+        """Maps the files again to pick up appended blobs"""
+        index_map = _map(self.path + INDEX_SUFFIX)
+        if index_map is not None and (
+            index_map[:len(_INDEX_MAGIC)] != _INDEX_MAGIC
+        ):
+            index_map.close()
+            raise ValueError(f'{self.path} is not an archive')
+        size = len(index_map) if index_map is not None else 0
+        count = max(size - len(_INDEX_MAGIC), 0) // _RECORD.size
+        if self._index_map is not None and count == self._count:
+            _release(index_map)
+            return
+
+        # blobs and index entries of all records are complete, as they're
+        # written first
+        try:
+            data_map = _map(self.path)
+            hashes_map = self._map_table(HASHES_SUFFIX, _HASH_KEY_SIZE)
+            heads_map = self._map_table(HEADS_SUFFIX, _ACCOUNT_KEY_SIZE)
+            postings_map = _map(self.path + ACCOUNTS_SUFFIX)
+        except Exception:
+            _release(index_map)
+            raise
+        self._release()
+        self._index_map = index_map
+        self._data_map = data_map
+        self._hashes_map = hashes_map
+        self._heads_map = heads_map
+        self._postings_map = postings_map
+        self._index = _view(index_map)
+        self._data = _view(data_map)
+        self._count = count
+
+    def _release(self) -> None:
+        self._index.release()
+        self._data.release()
+        for mapping in (
+            self._index_map, self._data_map, self._hashes_map,
+            self._heads_map, self._postings_map
+        ):
+            _release(mapping)
+
+    def close(self) -> None:
+        self._release()
+        self._index_map = self._data_map = None
+        self._hashes_map = self._heads_map = self._postings_map = None
+        self._index = self._data = memoryview(b'')
+        self._count = 0
+
+    def __enter__(self) -> 'Archive':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, number: int):
+        return _RECORD.unpack_from(
+            self._index, len(_INDEX_MAGIC) + number * _RECORD.size
+        )
+
+    def __getitem__(self, number: int) -> memoryview:
+        """Returns blob by its position in the archive"""
+        if number < 0:
+            number += self._count
+        if not 0 <= number < self._count:
+            raise IndexError('Archive index out of range')
+        _, offset, length, _ = self._record(number)
+        return self._data[offset:offset + length]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for number in range(self._count):
+            yield self[number]
+
+    def entry(self, number: int) -> ArchiveEntry:
+        """Returns blob by its position together with its hash and ledger"""
+        blob = self[number]
+        if number < 0:
+            number += self._count
+        tx_hash, _, _, ledger_index = self._record(number)
+        return ArchiveEntry(tx_hash, ledger_index, blob)
+
+    def get(self, tx_hash: Union[bytes, str]) -> Optional[memoryview]:
+        """
+        Returns blob by its hash or ``None`` if it's not archived. If the
+        hash was appended more than once, the first blob is returned.
+        """
+        if self._hashes_map is None:
+            return None
+        tx_hash = _hash(tx_hash)
+        for number in _candidates(self._hashes_map, tx_hash):
+            # records may not be written yet
+            if number < self._count and self._record(number)[0] == tx_hash:
+                return self[number]
+        return None
+
+    def _posting(self, position: int) -> Tuple[bytes, int, int]:
+        offset = len(_ACCOUNTS_MAGIC) + position * _POSTING.size
+        if self._postings_map is None or (
+            offset + _POSTING.size > len(self._postings_map)
+        ):
+            # the writer appended postings since the file was mapped
+            _release(self._postings_map)
+            self._postings_map = _map(self.path + ACCOUNTS_SUFFIX)
+        return _POSTING.unpack_from(cast(Any, self._postings_map), offset)
+
+    def by_account(self, account: Union[bytes, str]) -> List[memoryview]:
+        """
+        Returns blobs referring to account (address or account ID) in
+        top-level fields, in archive order
+        """
+        if self._heads_map is None:
+            return []
+        _, position = _find(
+            self._heads_map, _ACCOUNT_KEY_SIZE, _account_id(account)
+        )
+        numbers = []
+        while position >= 0:
+            _, number, previous = self._posting(position)
+            # postings of records not written yet are skipped
+            if number < self._count:
+                numbers.append(number)
+            position = previous - 1
+        return [self[number] for number in reversed(numbers)]
+
+    def ledger_range(self, start: int, stop: int) -> List[memoryview]:
+        """Returns blobs of ledgers from ``start`` to ``stop`` (excluded)"""
+        ledgers = _LedgerIndexes(self._index, self._count)
+        first = bisect.bisect_left(ledgers, start)
+        last = bisect.bisect_left(ledgers, stop, first)
+        return [self[number] for number in range(first, last)]
+
+    def by_ledger(self, ledger_index: int) -> List[memoryview]:
+        """Returns blobs of a ledger"""
+        return self.ledger_range(ledger_index, ledger_index + 1)
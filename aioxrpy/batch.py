@@ -0,0 +1,402 @@
+"""
+Batch serialization, deserialization, signature verification and key
+derivation.
+
+Items are processed in chunks, optionally spread across a process pool.
+Results are yielded in input order and only a bounded number of chunks is
+in flight at a time, so arbitrarily long iterables can be processed in
+constant memory.
+"""
+import asyncio
+from binascii import unhexlify
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from typing import (
+    Any, AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List,
+    NamedTuple, Optional, TextIO, Tuple, TypeVar, Union
+)
+
+from aioxrpy import serializer
+from aioxrpy.address import encode_address
+from aioxrpy.crypto import CryptoBackend, get_backend, KeyType
+from aioxrpy.definitions import RippleTransactionHashPrefix
+from aioxrpy.hash import first_half_of_sha512, signing_data
+from aioxrpy.keys import (
+    account_id, decode_seed, generate_seed, public_key_type, RippleKey,
+    secret_from_seed
+)
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Number of parsed public keys remembered by each process verifying
+# signatures. Signatures mostly come from a limited set of accounts, so
+# keys are parsed once rather than for every transaction.
+PUBLIC_KEY_CACHE_SIZE = 4096
+
+# (transaction, signature, public key)
+SignatureItem = Tuple[Union[Dict, bytes, str], bytes, bytes]
+
+# Names of backends used for each key type, resolved in the calling process
+Backends = Dict[KeyType, str]
+
+T = TypeVar('T')
+
+
+class KeyRecord(NamedTuple):
+    """Seed of a key with its compressed public key and address"""
+    seed: str
+    public_key: bytes
+    account: str
+
+
+def _serialize_chunk(chunk: List[Dict]) -> List[bytes]:
+    return [serializer.serialize(obj) for obj in chunk]
+
+
+def _deserialize_chunk(chunk: List[Union[bytes, str]]) -> List[Dict]:
+    return [serializer.deserialize(binary) for binary in chunk]
+
+
+def _backends(backend: Union[CryptoBackend, str, None]) -> Backends:
+    # secp256k1 keys use the passed backend, Ed25519 keys the default one
+    return {
+        KeyType.SECP256K1: get_backend(backend).name,
+        KeyType.ED25519: get_backend(None, KeyType.ED25519).name,
+    }
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _public_key(
+    backends: Tuple[str, str], public_key: bytes
+) -> Tuple[CryptoBackend, Any, bytes]:
+    """Returns backend of the key type, parsed public key and account ID"""
+    key_type = public_key_type(public_key)
+    crypto = get_backend(
+        backends[key_type is KeyType.ED25519], key_type
+    )
+    return (
+        crypto, crypto.load_public_key(public_key), account_id(public_key)
+    )
+
+
+def _verify_chunk(
+    chunk: List[SignatureItem], multi_sign: bool, backends: Backends
+) -> List[bool]:
+    names = (backends[KeyType.SECP256K1], backends[KeyType.ED25519])
+    prefix = (
+        RippleTransactionHashPrefix.HASH_TX_SIGN_MULTI if multi_sign
+        else RippleTransactionHashPrefix.HASH_TX_SIGN
+    )
+    results = []
+    for tx, signature, public_key in chunk:
+        if isinstance(public_key, str):
+            public_key = unhexlify(public_key)
+        try:
+            crypto, key, key_account_id = _public_key(
+                names, bytes(public_key)
+            )
+        except (ValueError, AssertionError):
+            # not a valid point, ecdsa raises MalformedPointError
+            results.append(False)
+            continue
+        suffix = key_account_id if multi_sign else b''
+        if crypto.key_type is KeyType.ED25519:
+            # Ed25519 signs the whole message rather than its hash
+            data = b''.join((prefix, signing_data(tx), suffix))
+        else:
+            data = first_half_of_sha512(prefix, signing_data(tx), suffix)
+        results.append(crypto.verify(key, data, signature))
+    return results
+
+
+def _derive_chunk(
+    seeds: List[str], backends: Backends
+) -> List[Tuple[str, bytes, bytes, str]]:
+    """Returns ``(seed, secret, public key, address)`` tuples"""
+    secp256k1 = get_backend(backends[KeyType.SECP256K1])
+    results = []
+    for seed in seeds:
+        key_type = decode_seed(seed)[1]
+        crypto = get_backend(backends[key_type], key_type)
+        secret = secret_from_seed(seed, secp256k1)
+        public_key = crypto.derive_public_key(secret)
+        results.append((
+            seed, secret, public_key, encode_address(account_id(public_key))
+        ))
+    return results
+
+
+def _generate_chunk(
+    chunk: List[int], backends: Backends, key_type: KeyType
+) -> List[Tuple[str, bytes, bytes, str]]:
+    return _derive_chunk(
+        [generate_seed(key_type) for _ in chunk], backends
+    )
+
+
+def _chunks(items: Iterable, chunk_size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_chunks(
+    func: Callable[[List], List],
+    items: Iterable,
+    *,
+    chunk_size: int,
+    max_workers: int,
+    executor: Optional[Executor],
+    max_pending: Optional[int]
+) -> Iterator[Any]:
+    assert chunk_size > 0, 'chunk_size must be positive'
+    if executor is None and not max_workers:
+        for chunk in _chunks(items, chunk_size):
+            yield from func(chunk)
+        return
+
+    own_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    if max_pending is None:
+        max_pending = 2 * (max_workers or 4)
+
+    pending = deque()  # type: Deque
+    try:
+        for chunk in _chunks(items, chunk_size):
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+
+def serialize_many(
+    objects: Iterable[Dict],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = 0,
+    executor: Optional[Executor] = None,
+    max_pending: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Serializes objects and yields results in input order.
+
+    :param chunk_size: number of objects processed by a single task
+    :param max_workers: number of worker processes, objects are serialized
+                        in the current process if ``0``
+    :param executor: executor to use instead of creating a process pool
+    :param max_pending: maximum number of chunks submitted to executor at
+                        a time, defaults to twice the number of workers
+    """
+    return _map_chunks(
+        _serialize_chunk,
+        objects,
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        executor=executor,
+        max_pending=max_pending
+    )
+
+
+def deserialize_many(
+    blobs: Iterable[Union[bytes, str]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = 0,
+    executor: Optional[Executor] = None,
+    max_pending: Optional[int] = None
+) -> Iterator[Dict]:
+    """
+    Deserializes blobs (``bytes`` or hex strings) and yields results in
+    input order.
+
+    Accepts the same keyword arguments as :func:`serialize_many`.
+    """
+    return _map_chunks(
+        _deserialize_chunk,
+        blobs,
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        executor=executor,
+        max_pending=max_pending
+    )
+
+
+def verify_many(
+    items: Iterable[SignatureItem],
+    *,
+    multi_sign: bool = False,
+    backend: Union[CryptoBackend, str, None] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = 0,
+    executor: Optional[Executor] = None,
+    max_pending: Optional[int] = None
+) -> Iterator[bool]:
+    """
+    Verifies transaction signatures and yields results in input order.
+
+    Items are ``(transaction, signature, public_key)`` tuples. Transactions
+    can be passed as dicts or signed blobs, ``TxnSignature`` and ``Signers``
+    are left out of signed data, so blobs are hashed without being
+    deserialized. Parsed public keys are cached in every process.
+
+    :param multi_sign: verify signatures of multi-signed transactions
+    :param backend: crypto backend name used for secp256k1 keys, see
+                    :func:`aioxrpy.crypto.get_backend`; Ed25519 keys
+                    (prefixed with ``0xED``) use the default Ed25519 backend
+
+    Accepts the same keyword arguments as :func:`serialize_many`.
+    """
+    return _map_chunks(
+        partial(
+            _verify_chunk,
+            multi_sign=multi_sign,
+            backends=_backends(backend)
+        ),
+        items,
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        executor=executor,
+        max_pending=max_pending
+    )
+
+
+def _key_results(
+    results: Iterator[Tuple[str, bytes, bytes, str]],
+    as_keys: bool,
+    backends: Backends
+) -> Iterator[Any]:
+    for seed, secret, public_key, account in results:
+        if as_keys:
+            key_type = public_key_type(public_key)
+            yield RippleKey(
+                private_key=secret,
+                backend=backends[key_type],
+                key_type=key_type
+            )
+        else:
+            yield KeyRecord(seed, public_key, account)
+
+
+def derive_keys_many(
+    seeds: Iterable[str],
+    *,
+    as_keys: bool = False,
+    backend: Union[CryptoBackend, str, None] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = 0,
+    executor: Optional[Executor] = None,
+    max_pending: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Derives keys from encoded seeds and yields :class:`KeyRecord` tuples
+    in input order, equal to values returned by ``RippleKey`` created
+    from the seed.
+
+    :param as_keys: yield ``RippleKey`` objects instead of records, which
+                    are created in the current process
+    :param backend: crypto backend name used for secp256k1 seeds, see
+                    :func:`aioxrpy.crypto.get_backend`; Ed25519 seeds use
+                    the default Ed25519 backend
+
+    Accepts the same keyword arguments as :func:`serialize_many`.
+    """
+    backends = _backends(backend)
+    return _key_results(_map_chunks(
+        partial(_derive_chunk, backends=backends),
+        seeds,
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        executor=executor,
+        max_pending=max_pending
+    ), as_keys, backends)
+
+
+def generate_keys_many(
+    count: int,
+    *,
+    key_type: Union[KeyType, str] = KeyType.SECP256K1,
+    as_keys: bool = False,
+    backend: Union[CryptoBackend, str, None] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = 0,
+    executor: Optional[Executor] = None,
+    max_pending: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Generates ``count`` new keys from random seeds, yields records as
+    :func:`derive_keys_many` does. Seeds are generated by workers.
+
+    :param key_type: ``secp256k1`` (default) or ``ed25519``
+    """
+    backends = _backends(backend)
+    return _key_results(_map_chunks(
+        partial(
+            _generate_chunk, backends=backends, key_type=KeyType(key_type)
+        ),
+        range(count),
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        executor=executor,
+        max_pending=max_pending
+    ), as_keys, backends)
+
+
+def write_key_records(records: Iterable[KeyRecord], fileobj: TextIO) -> int:
+    """
+    Writes records to a text file, one ``seed,public_key,account`` line
+    per record with public key hex-encoded. Returns number of records.
+    """
+    count = 0
+    for chunk in _chunks(records, DEFAULT_CHUNK_SIZE):
+        fileobj.write(''.join(
+            f'{seed},{public_key.hex().upper()},{account}\n'
+            for seed, public_key, account in chunk
+        ))
+        count += len(chunk)
+    return count
+
+
+async def aiter_many(
+    results: Iterable[T],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None
+) -> AsyncIterator[T]:
+    """
+    Iterates over results of a batch function (e.g.
+    :func:`generate_keys_many`) in an executor, chunk by chunk, so the
+    event loop isn't blocked while they're computed.
+
+    Example:
+
+    .. code-block:: python
+
+        async for record in aiter_many(generate_keys_many(100000)):
+            await store(record)
+
+    :param executor: executor waiting for results, the default executor of
+                     the loop if ``None``
+    """
+    loop = asyncio.get_running_loop()
+    chunks = _chunks(results, chunk_size)  # type: Iterator[List[T]]
+    while True:
+        chunk = await loop.run_in_executor(
+            executor, next, chunks, None
+        )  # type: Optional[List[T]]
+        if chunk is None:
+            return
+        for result in chunk:
+            yield result
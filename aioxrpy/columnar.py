@@ -0,0 +1,183 @@
+"""
+Columnar extraction of serialized objects into NumPy structured arrays.
+
+Blobs are walked with the field table and requested fields are copied
+straight into rows of a preallocated array, so no dicts or intermediate
+Python values are created for fields that aren't requested. Only
+top-level fixed-width fields can be extracted:
+
+* integers (``UInt8`` to ``UInt64``) become unsigned integer columns
+* ``AccountID`` and hashes become fixed-width byte columns (``uint8``
+  subarrays holding raw account IDs and hashes)
+* ``Amount`` becomes a signed ``int64`` column of XRP drops, issued
+  currency amounts are marked as null
+
+Requires ``numpy``, install ``aioxrpy[numpy]``.
+"""
+from binascii import unhexlify
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple, Union, cast
+
+import numpy
+
+from aioxrpy import serializer
+from aioxrpy.definitions import RippleType, RIPPLE_FIELDS
+
+
+# Integer types with (dtype, big-endian source format, native format)
+_INTEGER_TYPES = {
+    RippleType.UInt8: ('u1', '>B', '=B'),
+    RippleType.UInt16: ('u2', '>H', '=H'),
+    RippleType.UInt32: ('u4', '>I', '=I'),
+    RippleType.UInt64: ('u8', '>Q', '=Q'),
+}
+
+# Types copied verbatim, with their width in bytes
+_BYTES_TYPES = {
+    RippleType.AccountID: 20,
+    RippleType.Hash128: 16,
+    RippleType.Hash160: 20,
+    RippleType.Hash256: 32,
+}
+
+_AMOUNT_STRUCT = struct.Struct('>Q')
+_DROPS_STRUCT = struct.Struct('=q')
+
+# Column kinds
+_INTEGER, _BYTES, _ACCOUNT, _AMOUNT = range(4)
+
+
+def _column_dtype(name: str):
+    field = RIPPLE_FIELDS[name]
+    if field.type_ in _INTEGER_TYPES:
+        return _INTEGER_TYPES[field.type_][0]
+    if field.type_ in _BYTES_TYPES:
+        return 'u1', (_BYTES_TYPES[field.type_],)
+    if field.type_ == RippleType.Amount:
+        return 'i8'
+    raise ValueError(f'{name} is not a fixed-width field')
+
+
+def column_dtype(fields: Iterable[str]) -> numpy.dtype:
+    """Returns structured dtype of columns for the field names"""
+    return numpy.dtype([(name, _column_dtype(name)) for name in fields])
+
+
+def null_mask_dtype(fields: Iterable[str]) -> numpy.dtype:
+    """
+    Returns structured dtype of null mask for the field names, with a
+    boolean per column set if the value is missing
+    """
+    return numpy.dtype([(name, '?') for name in fields])
+
+
+def extract_columns(
+    blobs: Iterable[Union[bytes, str]],
+    fields: List[str],
+    *,
+    out: Optional[numpy.ndarray] = None,
+    null_mask: Optional[numpy.ndarray] = None
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Extracts fields from serialized objects into a structured array, one
+    row per blob. Returns a tuple containing arrays of values and null
+    mask, both trimmed to the number of blobs.
+
+    :param blobs: serialized objects (``bytes`` or hex strings)
+    :param fields: names of extracted fields, see :func:`column_dtype`
+    :param out: preallocated array of :func:`column_dtype`, its length
+                limits the number of blobs; values of missing fields are
+                left as they were
+    :param null_mask: preallocated array of :func:`null_mask_dtype`
+    """
+    dtype = column_dtype(fields)
+    if out is None:
+        blobs = list(blobs)
+        out = numpy.zeros(len(blobs), dtype)
+    elif out.dtype != dtype:
+        raise ValueError(f'out must have dtype {dtype}')
+    if null_mask is None:
+        null_mask = numpy.empty(len(out), null_mask_dtype(fields))
+    elif null_mask.dtype != null_mask_dtype(fields) or (
+        len(null_mask) < len(out)
+    ):
+        raise ValueError('null_mask must match out')
+    null_mask[:] = True
+
+    # (column index, offset of the value in row, kind, width, unpack, pack)
+    plan = {}  # type: Dict[str, Tuple]
+    dtype_fields = dtype.fields
+    assert dtype_fields is not None
+    for column, name in enumerate(fields):
+        field = RIPPLE_FIELDS[name]
+        offset = dtype_fields[name][1]
+        if field.type_ in _INTEGER_TYPES:
+            _, source, native = _INTEGER_TYPES[field.type_]
+            source_struct = struct.Struct(source)
+            plan[name] = (
+                column, offset, _INTEGER, source_struct.size,
+                source_struct.unpack_from, struct.Struct(native).pack_into
+            )
+        elif field.type_ in _BYTES_TYPES:
+            kind = _ACCOUNT if field.type_ == RippleType.AccountID else _BYTES
+            plan[name] = (
+                column, offset, kind, _BYTES_TYPES[field.type_], None, None
+            )
+        else:
+            plan[name] = (column, offset, _AMOUNT, None, None, None)
+
+    # rows are written through flat byte views of the arrays
+    data = cast(memoryview, out.view(numpy.uint8).data).cast('B')
+    mask = cast(memoryview, null_mask.view(numpy.uint8).data).cast('B')
+    row_size = dtype.itemsize
+    columns = len(fields)
+    lookup_field = serializer.lookup_field
+    skip_field = serializer.skip_field
+    end_marker = serializer.OBJECT_END_MARKER
+
+    count = 0
+    for row, blob in enumerate(blobs):
+        if row >= len(out):
+            raise ValueError('More blobs than rows in out')
+        if isinstance(blob, str):
+            blob = unhexlify(blob)
+        view = memoryview(blob)
+        row_offset = row * row_size
+        mask_offset = row * columns
+        cursor = 0
+        end = len(view)
+        while cursor < end:
+            length, field = lookup_field(view, cursor)
+            cursor += length
+            if field is end_marker:
+                break
+            spec = plan.get(field.name)
+            if spec is None:
+                cursor += skip_field(field, view, cursor)
+                continue
+            column, offset, kind, width, unpack, pack = spec
+            offset += row_offset
+            if kind == _INTEGER:
+                value, = unpack(view, cursor)
+                pack(data, offset, value)
+                cursor += width
+            elif kind == _ACCOUNT:
+                # length prefixed, always 20 bytes long
+                data[offset:offset + 20] = view[cursor + 1:cursor + 21]
+                cursor += 21
+            elif kind == _BYTES:
+                data[offset:offset + width] = view[cursor:cursor + width]
+                cursor += width
+            else:
+                value, = _AMOUNT_STRUCT.unpack_from(view, cursor)
+                cursor += field.codec.skip(view, cursor)
+                if value & 0x8000000000000000:
+                    # issued currency amount, not representable in drops
+                    continue
+                drops = value & 0x3fffffffffffffff
+                if not value & 0x4000000000000000:
+                    drops = -drops
+                _DROPS_STRUCT.pack_into(data, offset, drops)
+            mask[mask_offset + column] = 0
+        count = row + 1
+    return out[:count], null_mask[:count]
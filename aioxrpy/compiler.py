@@ -0,0 +1,214 @@
+"""
+Compiler generating specialised serializers for fixed transaction shapes.
+
+Generated functions have the canonical field order, field ID bytes and
+codec calls resolved ahead of time. Objects that don't match the compiled
+field set are handled by the generic :class:`ObjectSerializer`.
+
+Compiled codecs are opt-in, use :func:`register_codec` to make
+:func:`aioxrpy.serializer.serialize` and
+:func:`aioxrpy.serializer.deserialize` use them for a transaction type.
+"""
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from aioxrpy import serializer
+from aioxrpy.definitions import RippleTransactionType, RIPPLE_FIELDS
+from aioxrpy.exceptions import RippleSerializerUnsupportedTypeException
+
+
+COMMON_FIELDS = (
+    'TransactionType', 'Account', 'Fee', 'Flags', 'Sequence',
+    'LastLedgerSequence', 'SourceTag', 'SigningPubKey', 'TxnSignature',
+    'Memos'
+)
+
+# Default field sets for the most common transaction types
+TRANSACTION_FIELDS = {
+    RippleTransactionType.Payment: COMMON_FIELDS + (
+        'Amount', 'Destination', 'DestinationTag', 'InvoiceID', 'SendMax',
+        'DeliverMin', 'Paths'
+    ),
+    RippleTransactionType.OfferCreate: COMMON_FIELDS + (
+        'TakerGets', 'TakerPays', 'Expiration', 'OfferSequence'
+    ),
+    RippleTransactionType.TrustSet: COMMON_FIELDS + (
+        'LimitAmount', 'QualityIn', 'QualityOut'
+    ),
+    RippleTransactionType.EscrowFinish: COMMON_FIELDS + (
+        'Owner', 'OfferSequence', 'Condition', 'Fulfillment'
+    )
+}  # type: Dict[RippleTransactionType, Tuple[str, ...]]
+
+
+class CompiledCodec:
+    """
+    Serializer and deserializer compiled for a transaction type and a set of
+    fields.
+
+    :param transaction_type: transaction type
+    :param fields: names of fields, in canonical order
+    :param serialize: function serializing a transaction dict
+    :param deserialize: function deserializing a transaction blob
+    :param source: source code of generated functions
+    """
+
+    def __init__(
+        self,
+        transaction_type: RippleTransactionType,
+        fields: Tuple[str, ...],
+        serialize: Callable,
+        deserialize: Callable,
+        source: str
+    ):
+        self.transaction_type = transaction_type
+        self.fields = fields
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.source = source
+
+
+def _generate_source(fields) -> Tuple[str, Dict]:
+    namespace = {
+        'FIELD_NAMES': frozenset(field.name for field in fields),
+        'MISSING': object(),
+        'fallback_serialize': serializer.OBJECT.serialize,
+        'fallback_deserialize': serializer.OBJECT.deserialize
+    }
+
+    serialize_lines = [
+        'def serialize(tx):',
+        '    if not tx.keys() <= FIELD_NAMES:',
+        '        return fallback_serialize(tx)',
+        '    buffer = bytearray()'
+    ]
+    deserialize_lines = [
+        'def deserialize(binary):',
+        '    values = {}',
+        '    cursor = 0',
+        '    end = len(binary)'
+    ]
+
+    for index, field in enumerate(fields):
+        codec = field.codec
+        header = field.header
+        namespace[f'H{index}'] = header
+        namespace[f'W{index}'] = codec.write
+        namespace[f'R{index}'] = codec.deserialize
+        is_basic = isinstance(codec, serializer.BasicTypeSerializer)
+        if is_basic:
+            namespace[f'P{index}'] = codec._struct.pack
+            namespace[f'U{index}'] = codec._struct.unpack_from
+
+        serialize_lines += [
+            f'    value = tx.get({field.name!r}, MISSING)',
+            '    if value is not MISSING:',
+            f'        buffer += H{index}',
+            (
+                f'        buffer += P{index}(value)'
+                if is_basic else
+                f'        W{index}(buffer, value)'
+            )
+        ]
+
+        # Field IDs are prefix-free, so comparing them byte by byte tells
+        # which field comes next
+        condition = ' and '.join(
+            ['cursor < end'] + [
+                f'binary[cursor + {i}] == {byte}' if i else
+                f'binary[cursor] == {byte}'
+                for i, byte in enumerate(header)
+            ]
+        )
+        deserialize_lines += [
+            f'    if {condition}:',
+            f'        cursor += {len(header)}'
+        ]
+        if is_basic:
+            deserialize_lines += [
+                f'        values[{field.name!r}] = '
+                f'U{index}(binary, cursor)[0]',
+                f'        cursor += {codec._struct.size}'
+            ]
+        else:
+            deserialize_lines += [
+                f'        length, values[{field.name!r}] = '
+                f'R{index}(binary, cursor)',
+                '        cursor += length'
+            ]
+
+    serialize_lines += ['    return bytes(buffer)']
+    deserialize_lines += [
+        '    if cursor != end:',
+        '        return fallback_deserialize(binary)',
+        '    return cursor, values'
+    ]
+    return '\n'.join(serialize_lines + [''] + deserialize_lines), namespace
+
+
+@lru_cache(maxsize=None)
+def _compile(
+    transaction_type: RippleTransactionType, field_names: FrozenSet[str]
+) -> CompiledCodec:
+    fields = sorted(
+        (RIPPLE_FIELDS[name] for name in field_names),
+        key=serializer.SORT_KEY
+    )
+    for field in fields:
+        if field.codec is None:
+            raise RippleSerializerUnsupportedTypeException(field.type_)
+
+    source, namespace = _generate_source(fields)
+    code = compile(
+        source, f'<aioxrpy.compiler {transaction_type.name}>', 'exec'
+    )
+    exec(code, namespace)
+    return CompiledCodec(
+        transaction_type=transaction_type,
+        fields=tuple(field.name for field in fields),
+        serialize=namespace['serialize'],
+        deserialize=namespace['deserialize'],
+        source=source
+    )
+
+
+def compile_codec(
+    transaction_type: RippleTransactionType,
+    fields: Optional[Iterable[str]] = None
+) -> CompiledCodec:
+    """
+    Returns codec compiled for transaction type and set of fields.
+    Codecs are cached, so compiling the same field set twice returns the
+    same codec.
+
+    :param transaction_type: transaction type
+    :param fields: names of fields transactions may contain, defaults to
+                   ``TRANSACTION_FIELDS`` entry for the transaction type
+    """
+    transaction_type = RippleTransactionType(transaction_type)
+    if fields is None:
+        fields = TRANSACTION_FIELDS[transaction_type]
+    return _compile(
+        transaction_type, frozenset(fields) | {'TransactionType'}
+    )
+
+
+def register_codec(
+    transaction_type: RippleTransactionType,
+    fields: Optional[Iterable[str]] = None
+) -> CompiledCodec:
+    """
+    Compiles codec and makes :func:`aioxrpy.serializer.serialize` and
+    :func:`aioxrpy.serializer.deserialize` use it for the transaction type.
+    """
+    codec = compile_codec(transaction_type, fields)
+    serializer.COMPILED_CODECS[codec.transaction_type] = codec
+    return codec
+
+
+def unregister_codec(transaction_type: RippleTransactionType):
+    """
+    Makes serializer use generic ``ObjectSerializer`` for the transaction
+    type again
+    """
+    serializer.COMPILED_CODECS.pop(transaction_type, None)
@@ -0,0 +1,361 @@
+"""
+Crypto backends used by :class:`aioxrpy.keys.RippleKey`.
+
+Backends wrap a library implementing a key type behind a common interface.
+
+secp256k1: ``ecdsa`` is pure Python and always available, ``coincurve``
+binds libsecp256k1 and is much faster; it's used by default when installed.
+Both produce identical signatures: nonces are derived deterministically
+(RFC 6979 with SHA-256) and signatures are canonical (low S), DER encoded.
+
+Ed25519: ``ecdsa`` is always available, ``cryptography`` is used by default
+when installed. Ed25519 signatures are deterministic by design and sign
+whole messages rather than their digests.
+
+Backend key objects are opaque, keys are exchanged between backends as
+32-byte secrets and compressed public keys (prefixed with ``0xED`` for
+Ed25519).
+"""
+from abc import ABC, abstractmethod
+from enum import Enum
+from functools import lru_cache
+import hashlib
+from importlib.util import find_spec
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+
+# Order of the secp256k1 group
+SECP256K1_ORDER = int(
+    'FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141', 16
+)
+
+
+# Prefix of Ed25519 public keys, which have no compressed form
+ED25519_PREFIX = b'\xed'
+
+
+class KeyType(str, Enum):
+    SECP256K1 = 'secp256k1'
+    ED25519 = 'ed25519'
+
+
+def make_canonical(r, s, order):
+    """Makes ecdsa signature canonical"""
+    if s > order // 2:
+        s = order - s
+    return r, s, order
+
+
+class CryptoBackend(ABC):
+    """Interface of key type implementations"""
+
+    name = ''
+    key_type = KeyType.SECP256K1
+
+    @abstractmethod
+    def load_private_key(self, secret: bytes) -> Any:
+        """Returns private key object for 32-byte secret"""
+
+    @abstractmethod
+    def load_public_key(self, data: bytes) -> Any:
+        """
+        Returns public key object for compressed or uncompressed public key,
+        raises ``ValueError`` if it's not a valid point
+        """
+
+    @abstractmethod
+    def get_public_key(self, private_key: Any) -> Any:
+        """Returns public key object of private key object"""
+
+    @abstractmethod
+    def encode_public_key(self, public_key: Any) -> bytes:
+        """Returns public key object encoded in compressed format"""
+
+    @abstractmethod
+    def sign(self, private_key: Any, data: bytes) -> bytes:
+        """
+        Signs 32-byte digest with deterministic nonce, returns canonical DER
+        encoded signature. Ed25519 backends sign the whole message.
+        """
+
+    @abstractmethod
+    def verify(self, public_key: Any, data: bytes, signature: bytes) -> bool:
+        """
+        Checks signature of the digest (or message for Ed25519), returns
+        ``False`` if it's invalid or malformed
+        """
+
+    def derive_public_key(self, secret: bytes) -> bytes:
+        """Returns compressed public key of 32-byte secret"""
+        return self.encode_public_key(
+            self.get_public_key(self.load_private_key(secret))
+        )
+
+
+class Secp256k1Backend(CryptoBackend):
+    """Interface of secp256k1 implementations"""
+
+    @abstractmethod
+    def multiply(self, public_key: Any, scalar: int) -> Any:
+        """Returns public key object of point multiplied by scalar"""
+
+
+class EcdsaBackend(Secp256k1Backend):
+    """Backend using pure Python ``ecdsa`` package"""
+
+    name = 'ecdsa'
+
+    def __init__(self):
+        from ecdsa.curves import SECP256k1
+
+        self._curve = SECP256k1
+
+    def load_private_key(self, secret: bytes) -> Any:
+        from ecdsa.keys import SigningKey
+
+        return SigningKey.from_string(secret, curve=self._curve)
+
+    def load_public_key(self, data: bytes) -> Any:
+        from ecdsa.keys import VerifyingKey
+
+        return VerifyingKey.from_string(data, curve=self._curve)
+
+    def get_public_key(self, private_key: Any) -> Any:
+        return private_key.get_verifying_key()
+
+    def encode_public_key(self, public_key: Any) -> bytes:
+        return public_key.to_string(encoding='compressed')
+
+    def multiply(self, public_key: Any, scalar: int) -> Any:
+        from ecdsa.keys import VerifyingKey
+
+        return VerifyingKey.from_public_point(
+            public_key.pubkey.point * scalar, curve=self._curve
+        )
+
+    def sign(self, private_key: Any, digest: bytes) -> bytes:
+        from ecdsa.util import sigencode_der
+
+        return sigencode_der(*private_key.sign_digest_deterministic(
+            digest, hashfunc=hashlib.sha256, sigencode=make_canonical
+        ))
+
+    def verify(self, public_key: Any, digest: bytes, signature: bytes) -> bool:
+        from ecdsa.der import UnexpectedDER
+        from ecdsa.keys import BadSignatureError
+        from ecdsa.util import sigdecode_der
+
+        try:
+            return public_key.verify_digest(
+                signature, digest, sigdecode=sigdecode_der
+            )
+        except (BadSignatureError, UnexpectedDER):
+            return False
+
+
+class CoincurveBackend(Secp256k1Backend):
+    """Backend using ``coincurve``, bindings of libsecp256k1"""
+
+    name = 'coincurve'
+
+    def __init__(self):
+        import coincurve
+
+        self._coincurve = coincurve
+
+    def load_private_key(self, secret: bytes) -> Any:
+        return self._coincurve.PrivateKey(secret)
+
+    def load_public_key(self, data: bytes) -> Any:
+        return self._coincurve.PublicKey(data)
+
+    def get_public_key(self, private_key: Any) -> Any:
+        return private_key.public_key
+
+    def encode_public_key(self, public_key: Any) -> bytes:
+        return public_key.format(compressed=True)
+
+    def multiply(self, public_key: Any, scalar: int) -> Any:
+        return public_key.multiply(scalar.to_bytes(32, byteorder='big'))
+
+    def sign(self, private_key: Any, digest: bytes) -> bytes:
+        # libsecp256k1 uses RFC 6979 nonces and produces low S signatures
+        return private_key.sign(digest, hasher=None)
+
+    def verify(self, public_key: Any, digest: bytes, signature: bytes) -> bool:
+        try:
+            if public_key.verify(signature, digest, hasher=None):
+                return True
+            # libsecp256k1 rejects high S signatures, which ecdsa accepts
+            from ecdsa.util import sigdecode_der, sigencode_der
+
+            r, s = sigdecode_der(signature, SECP256K1_ORDER)
+            if s <= SECP256K1_ORDER // 2:
+                return False
+            return public_key.verify(
+                sigencode_der(r, SECP256K1_ORDER - s, SECP256K1_ORDER),
+                digest,
+                hasher=None
+            )
+        except ValueError:
+            # malformed signature, ecdsa.der.UnexpectedDER is a ValueError
+            return False
+
+
+class EcdsaEd25519Backend(CryptoBackend):
+    """Ed25519 backend using pure Python ``ecdsa`` package"""
+
+    name = 'ecdsa'
+    key_type = KeyType.ED25519
+
+    def __init__(self):
+        from ecdsa import eddsa
+
+        self._eddsa = eddsa
+
+    def load_private_key(self, secret: bytes) -> Any:
+        return self._eddsa.PrivateKey(self._eddsa.generator_ed25519, secret)
+
+    def load_public_key(self, data: bytes) -> Any:
+        if len(data) != 33 or data[:1] != ED25519_PREFIX:
+            raise ValueError('Not an Ed25519 public key')
+        return self._eddsa.PublicKey(self._eddsa.generator_ed25519, data[1:])
+
+    def get_public_key(self, private_key: Any) -> Any:
+        return private_key.public_key()
+
+    def encode_public_key(self, public_key: Any) -> bytes:
+        return ED25519_PREFIX + public_key.public_key()
+
+    def sign(self, private_key: Any, data: bytes) -> bytes:
+        return bytes(private_key.sign(data))
+
+    def verify(self, public_key: Any, data: bytes, signature: bytes) -> bool:
+        from ecdsa.errors import MalformedPointError
+        from ecdsa.keys import BadSignatureError
+
+        try:
+            return public_key.verify(data, signature)
+        except (BadSignatureError, MalformedPointError, ValueError):
+            return False
+
+
+class CryptographyEd25519Backend(CryptoBackend):
+    """Ed25519 backend using ``cryptography``, bindings of OpenSSL"""
+
+    name = 'cryptography'
+    key_type = KeyType.ED25519
+
+    def __init__(self):
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+
+        self._ed25519 = ed25519
+
+    def load_private_key(self, secret: bytes) -> Any:
+        return self._ed25519.Ed25519PrivateKey.from_private_bytes(secret)
+
+    def load_public_key(self, data: bytes) -> Any:
+        if len(data) != 33 or data[:1] != ED25519_PREFIX:
+            raise ValueError('Not an Ed25519 public key')
+        return self._ed25519.Ed25519PublicKey.from_public_bytes(data[1:])
+
+    def get_public_key(self, private_key: Any) -> Any:
+        return private_key.public_key()
+
+    def encode_public_key(self, public_key: Any) -> bytes:
+        from cryptography.hazmat.primitives.serialization import (
+            Encoding, PublicFormat
+        )
+
+        return ED25519_PREFIX + public_key.public_bytes(
+            Encoding.Raw, PublicFormat.Raw
+        )
+
+    def sign(self, private_key: Any, data: bytes) -> bytes:
+        return private_key.sign(data)
+
+    def verify(self, public_key: Any, data: bytes, signature: bytes) -> bool:
+        from cryptography.exceptions import InvalidSignature
+
+        try:
+            public_key.verify(signature, data)
+        except InvalidSignature:
+            return False
+        return True
+
+
+# Backends of each key type, in order of preference
+BACKENDS = {
+    KeyType.SECP256K1: {
+        CoincurveBackend.name: CoincurveBackend,
+        EcdsaBackend.name: EcdsaBackend,
+    },
+    KeyType.ED25519: {
+        CryptographyEd25519Backend.name: CryptographyEd25519Backend,
+        EcdsaEd25519Backend.name: EcdsaEd25519Backend,
+    },
+}  # type: Dict[KeyType, Dict[str, Type[CryptoBackend]]]
+
+_instances = {}  # type: Dict[Tuple[KeyType, str], CryptoBackend]
+_default_names = {}  # type: Dict[KeyType, str]
+
+
+def available_backends(
+    key_type: Union[KeyType, str] = KeyType.SECP256K1
+) -> List[str]:
+    """
+    Returns names of backends of the key type whose libraries are
+    installed, in order of preference
+    """
+    return [
+        name for name in BACKENDS[KeyType(key_type)]
+        if find_spec(name) is not None
+    ]
+
+
+@lru_cache(maxsize=None)
+def _automatic_backend(key_type: KeyType) -> str:
+    return available_backends(key_type)[0]
+
+
+def set_default_backend(
+    name: Optional[str], key_type: Union[KeyType, str] = KeyType.SECP256K1
+) -> None:
+    """
+    Sets backend used by keys of the type created without passing one,
+    ``None`` restores automatic choice
+    """
+    key_type = KeyType(key_type)
+    if name is None:
+        _default_names.pop(key_type, None)
+        return
+    if name not in BACKENDS[key_type]:
+        raise ValueError(f'Unknown crypto backend: {name}')
+    _default_names[key_type] = name
+
+
+def get_backend(
+    backend: Union[CryptoBackend, str, None] = None,
+    key_type: Union[KeyType, str] = KeyType.SECP256K1
+) -> CryptoBackend:
+    """
+    Returns backend of the key type by name, or the default one if ``None``
+    is passed: the first installed one of ``coincurve`` and ``ecdsa`` for
+    secp256k1, ``cryptography`` and ``ecdsa`` for Ed25519
+    """
+    key_type = KeyType(key_type)
+    if isinstance(backend, CryptoBackend):
+        if backend.key_type is not key_type:
+            raise ValueError(
+                f'{backend.name} is not a {key_type.value} backend'
+            )
+        return backend
+    name = (
+        backend or _default_names.get(key_type)
+        or _automatic_backend(key_type)
+    )
+    if (key_type, name) not in _instances:
+        if name not in BACKENDS[key_type]:
+            raise ValueError(f'Unknown crypto backend: {name}')
+        _instances[key_type, name] = BACKENDS[key_type][name]()
+    return _instances[key_type, name]
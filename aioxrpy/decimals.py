@@ -1,4 +1,14 @@
-from decimal import Decimal
+from decimal import (
+    Decimal, getcontext, ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR,
+    ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP
+)
+from functools import lru_cache
+import re
+import sys
+from typing import Any, Callable, Iterable, List, Tuple, Union
+
+
+DROPS_PER_XRP = 1000000
 
 
 def xrp_to_drops(amount):
@@ -7,3 +17,299 @@ def xrp_to_drops(amount):
 
 def drops_to_xrp(amount):
     return Decimal(amount) / Decimal(1000000)
+
+
+# Issued currency amounts have 16 significant digits
+MIN_MANTISSA = 10**15
+MAX_MANTISSA = 10**16 - 1
+MIN_EXPONENT = -96
+MAX_EXPONENT = 80
+
+_POWERS_OF_TEN = [10**i for i in range(64)]
+_NUMBER_RE = re.compile(
+    r'^\s*([+-])?(\d*)(?:\.(\d*))?(?:[eE]([+-]?\d+))?\s*$'
+)
+
+
+def _power_of_ten(exponent: int) -> int:
+    if exponent < len(_POWERS_OF_TEN):
+        return _POWERS_OF_TEN[exponent]
+    return 10**exponent
+
+
+@lru_cache(maxsize=4096)
+def _parse_value(value: str) -> Tuple[int, int, int]:
+    match = _NUMBER_RE.match(value)
+    if not match or not (match.group(2) or match.group(3)):
+        raise ValueError(f'Invalid amount value: {value!r}')
+    sign, integer, fraction, exponent = match.groups()
+    fraction = fraction or ''
+    return (
+        int((integer or '') + fraction or '0'),
+        int(exponent or 0) - len(fraction),
+        1 if sign == '-' else 0
+    )
+
+
+class IssuedCurrencyValue:
+    """
+    Exact value of an issued currency amount,
+    ``(-1) ** sign * mantissa * 10 ** exponent``.
+
+    Arithmetic is done on integers, use :meth:`to_decimal` to convert the
+    value to ``Decimal``. Compares equal to ``int`` and ``Decimal`` numbers
+    of the same value; floats are inexact and never compare equal, convert
+    the value with ``float()`` to compare it with them.
+
+    :param mantissa: non-negative integer
+    :param exponent: power of ten
+    :param sign: ``1`` for negative values, ``0`` otherwise
+    """
+    __slots__ = ('mantissa', 'exponent', 'sign')
+
+    def __init__(self, mantissa: int, exponent: int = 0, sign: int = 0):
+        assert mantissa >= 0, 'mantissa must be non-negative'
+        self.mantissa = mantissa
+        self.exponent = exponent
+        self.sign = sign
+
+    @classmethod
+    def from_value(
+        cls, value: Union['IssuedCurrencyValue', Decimal, str, int, float]
+    ) -> 'IssuedCurrencyValue':
+        """
+        Converts a number (or its string representation) to exact value.
+        Parsed strings are cached, as the same values tend to repeat.
+        """
+        if isinstance(value, IssuedCurrencyValue):
+            return value
+        if isinstance(value, str):
+            return cls(*_parse_value(value))
+        if isinstance(value, int):
+            return cls(abs(value), 0, 1 if value < 0 else 0)
+        if isinstance(value, float):
+            value = Decimal(value)
+        if isinstance(value, Decimal):
+            if not value.is_finite():
+                raise ValueError(f'Invalid amount value: {value!r}')
+            sign, digits, exponent = value.as_tuple()
+            mantissa = 0
+            for digit in digits:
+                mantissa = mantissa * 10 + digit
+            return cls(mantissa, int(exponent), sign)
+        raise ValueError(f'Invalid amount value: {value!r}')
+
+    def normalized(self) -> 'IssuedCurrencyValue':
+        """
+        Returns value with 16-digit mantissa, truncating digits that don't
+        fit. Values too small to be represented are rounded to zero.
+
+        Raises ``ValueError`` if the value is too large.
+        """
+        mantissa, exponent = self.mantissa, self.exponent
+        if mantissa == 0:
+            return IssuedCurrencyValue(0)
+
+        digits = len(str(mantissa))
+        if digits > 16:
+            mantissa //= _power_of_ten(digits - 16)
+            exponent += digits - 16
+        elif digits < 16:
+            mantissa *= _power_of_ten(16 - digits)
+            exponent -= 16 - digits
+
+        if exponent < MIN_EXPONENT:
+            return IssuedCurrencyValue(0)
+        if exponent > MAX_EXPONENT:
+            raise ValueError('Amount out of range')
+        return IssuedCurrencyValue(mantissa, exponent, self.sign)
+
+    def to_decimal(self) -> Decimal:
+        """Returns value as ``Decimal``"""
+        digits = tuple(map(int, str(self.mantissa)))
+        return Decimal((self.sign, digits, self.exponent))
+
+    def __float__(self) -> float:
+        return float(self.to_decimal())
+
+    def __bool__(self) -> bool:
+        return self.mantissa != 0
+
+    def __neg__(self) -> 'IssuedCurrencyValue':
+        return IssuedCurrencyValue(self.mantissa, self.exponent, 1 - self.sign)
+
+    def __eq__(self, other):
+        if isinstance(other, IssuedCurrencyValue):
+            return self.to_decimal() == other.to_decimal()
+        if isinstance(other, (int, Decimal)):
+            return self.to_decimal() == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.to_decimal())
+
+    def __str__(self) -> str:
+        return format(self.to_decimal().normalize(), 'f')
+
+    def __repr__(self) -> str:
+        return f'IssuedCurrencyValue({str(self)!r})'
+
+
+def _numpy_array(value: Any) -> Any:
+    """Returns the value if it's a NumPy array, ``None`` otherwise"""
+    # numpy is optional, arrays can only be passed once it's imported
+    numpy = sys.modules.get('numpy')  # type: Any
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return value
+    return None
+
+
+# Batch conversions work on integers in fixed point (drops), results are
+# identical to those of the scalar functions, including rounding in the
+# current decimal context. Values that the scalar functions would round
+# to context precision (or reject) are passed to them instead.
+_ROUNDING_MODES = {
+    ROUND_DOWN: lambda quotient, remainder, divisor, negative: False,
+    ROUND_UP: lambda quotient, remainder, divisor, negative: True,
+    ROUND_CEILING: lambda quotient, remainder, divisor, negative: (
+        not negative
+    ),
+    ROUND_FLOOR: lambda quotient, remainder, divisor, negative: negative,
+    ROUND_HALF_UP: lambda quotient, remainder, divisor, negative: (
+        2 * remainder >= divisor
+    ),
+    ROUND_HALF_DOWN: lambda quotient, remainder, divisor, negative: (
+        2 * remainder > divisor
+    ),
+    ROUND_HALF_EVEN: lambda quotient, remainder, divisor, negative: (
+        2 * remainder > divisor
+        or (2 * remainder == divisor and quotient & 1 == 1)
+    ),
+    ROUND_05UP: lambda quotient, remainder, divisor, negative: (
+        quotient % 5 == 0
+    ),
+}
+
+
+def xrp_to_drops_many(
+    amounts: Iterable[Union[Decimal, int]], *, as_array: bool = False
+) -> Any:
+    """
+    Converts XRP amounts to drops, rounding the same way as
+    :func:`xrp_to_drops`.
+
+    NumPy integer arrays are converted with a single vectorized
+    multiplication. Returns a list of ``int``, or ``int64`` NumPy array if
+    ``as_array`` is set or ``amounts`` is a NumPy array.
+    """
+    array = _numpy_array(amounts)
+    if array is not None:
+        import numpy
+        if array.dtype.kind in 'iu':
+            limit = numpy.iinfo(numpy.int64).max // DROPS_PER_XRP
+            # abs() of the lowest int64 overflows, bounds are compared as
+            # Python ints instead
+            if len(array) and not (
+                -limit <= int(array.min()) and int(array.max()) <= limit
+            ):
+                raise OverflowError('Amount does not fit in int64 drops')
+            return array.astype(numpy.int64) * DROPS_PER_XRP
+        amounts = array.tolist()
+        as_array = True
+
+    context = getcontext()
+    round_away = _ROUNDING_MODES[context.rounding]
+    # drops must fit in context precision, otherwise quantize() fails
+    limit = _power_of_ten(context.prec)
+    # amounts with more digits are rounded to context precision when
+    # multiplied, before they're rounded to drops
+    max_digits = context.prec - 6
+    drops = []
+    for amount in amounts:
+        if type(amount) is int:
+            value = amount * DROPS_PER_XRP
+        elif type(amount) is Decimal and amount.is_finite():
+            numerator, denominator = amount.as_integer_ratio()
+            value, remainder = divmod(
+                abs(numerator) * DROPS_PER_XRP, denominator
+            )
+            if remainder:
+                if len(amount.as_tuple().digits) > max_digits:
+                    drops.append(xrp_to_drops(amount))
+                    continue
+                if round_away(value, remainder, denominator, numerator < 0):
+                    value += 1
+            if numerator < 0:
+                value = -value
+        else:
+            drops.append(xrp_to_drops(amount))
+            continue
+        if not -limit < value < limit:
+            value = xrp_to_drops(amount)
+        drops.append(value)
+    if as_array:
+        import numpy
+        return numpy.array(drops, dtype=numpy.int64)
+    return drops
+
+
+def _format_drops(
+    drops: Iterable[Union[int, str]], fallback: Callable
+) -> List[Any]:
+    """
+    Returns drops formatted as XRP amounts, with results of ``fallback`` for
+    values with more digits than context precision
+    """
+    limit = _power_of_ten(getcontext().prec)
+    strings = []  # type: List[Any]
+    append = strings.append
+    for value in drops:
+        if type(value) is not int:
+            value = int(value)
+        if not -limit < value < limit:
+            append(fallback(value))
+            continue
+        # XRP amount has the same digits, split at the 6th decimal place
+        digits = str(value)
+        sign = ''
+        if value < 0:
+            sign, digits = '-', digits[1:]
+        if len(digits) > 6:
+            integer, fraction = digits[:-6], digits[-6:].rstrip('0')
+        else:
+            integer, fraction = '0', digits.rjust(6, '0').rstrip('0')
+        append(f'{sign}{integer}.{fraction}' if fraction else sign + integer)
+    return strings
+
+
+def drops_to_xrp_many(drops: Iterable[Union[int, str]]) -> List[Decimal]:
+    """
+    Converts integer drops to XRP amounts, equal to results of
+    :func:`drops_to_xrp` including their exponents. Accepts NumPy integer
+    arrays.
+    """
+    array = _numpy_array(drops)
+    if array is not None:
+        drops = array.tolist()
+    return [
+        value if isinstance(value, Decimal) else Decimal(value)
+        for value in _format_drops(drops, drops_to_xrp)
+    ]
+
+
+def drops_to_xrp_strings(drops: Iterable[Union[int, str]]) -> Any:
+    """
+    Formats integer drops as XRP amounts for display, the same way as
+    ``str(drops_to_xrp(value))``.
+
+    Returns a list of ``str``, or NumPy string array if ``drops`` is a NumPy
+    array.
+    """
+    array = _numpy_array(drops)
+    if array is not None:
+        drops = array.tolist()
+    strings = _format_drops(drops, lambda value: str(drops_to_xrp(value)))
+    if array is not None:
+        import numpy
+        return numpy.array(strings, dtype=str)
+    return strings
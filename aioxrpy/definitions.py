@@ -2,18 +2,54 @@
 Ripple type and field definitions
 """
 from collections import defaultdict
-from dataclasses import dataclass
 from enum import Enum, IntEnum
-import json
+import marshal
 import os
-from typing import Dict
+import sys
+from typing import Any, Dict, List, Optional
 
 
 DEFINITIONS_PATH = os.path.join(os.path.dirname(__file__), 'definitions.json')
 
+# Parsed definitions are cached in marshal format, the same way bytecode of
+# modules is cached, and parsed again when definitions.json changes
+DEFINITIONS_CACHE_PATH = os.path.join(
+    os.path.dirname(__file__), '__pycache__',
+    f'definitions.{sys.implementation.cache_tag}.marshal'
+)
+DEFINITIONS_CACHE_VERSION = 1
+
+
+def _load_definitions() -> Dict:
+    stat = os.stat(DEFINITIONS_PATH)
+    key = (DEFINITIONS_CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
+    try:
+        with open(DEFINITIONS_CACHE_PATH, 'rb') as cache:
+            cached_key, cached = marshal.load(cache)
+        if cached_key == key:
+            return cached
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    import json
+    with open(DEFINITIONS_PATH) as dfile:
+        parsed = json.load(dfile)
 
-with open(DEFINITIONS_PATH) as dfile:
-    definitions = json.load(dfile)
+    if not sys.dont_write_bytecode:
+        try:
+            os.makedirs(os.path.dirname(DEFINITIONS_CACHE_PATH), exist_ok=True)
+            # write to a temporary file first, so that concurrent imports
+            # never read a partially written cache
+            temp_path = f'{DEFINITIONS_CACHE_PATH}.{os.getpid()}'
+            with open(temp_path, 'wb') as cache:
+                marshal.dump((key, parsed), cache)
+            os.replace(temp_path, DEFINITIONS_CACHE_PATH)
+        except OSError:
+            pass  # read-only installation
+    return parsed
+
+
+definitions = _load_definitions()
 
 
 def _init_enum(name: str, key: str):
@@ -21,16 +57,23 @@ def _init_enum(name: str, key: str):
     return IntEnum(name, values)
 
 
-RippleLedgerEntryType = _init_enum(
-    'RippleLedgerEntryType', 'LEDGER_ENTRY_TYPES'
-)
-RippleTransactionResult = _init_enum(
-    'RippleTransactionResult', 'TRANSACTION_RESULTS'
-)
 RippleTransactionType = _init_enum(
     'RippleTransactionType', 'TRANSACTION_TYPES'
 )
 
+# Rarely used enums, built on first access
+_LAZY_ENUMS = {
+    'RippleLedgerEntryType': 'LEDGER_ENTRY_TYPES',
+    'RippleTransactionResult': 'TRANSACTION_RESULTS'
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ENUMS:
+        value = globals()[name] = _init_enum(name, _LAZY_ENUMS[name])
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 class RippleType(IntEnum):
     Validation = 10003
@@ -65,6 +108,12 @@ class RippleTransactionHashPrefix(bytes, Enum):
     HASH_TX_SIGN_MULTI = b'SMT\x00'
 
 
+class RippleSHAMapHashPrefix(bytes, Enum):
+    INNER_NODE = b'MIN\x00'
+    LEAF_NODE = b'MLN\x00'
+    TX_NODE = b'SND\x00'
+
+
 class RippleTransactionResultCategory(str, Enum):
     """
     Enum containing Ripple transaction categories.
@@ -87,14 +136,68 @@ class RippleTransactionResultCategory(str, Enum):
     Success = 'tes'
 
 
-@dataclass
 class RippleField:
+    """
+    Ripple field definition.
+
+    Serialized fields also carry precomputed ``header`` (field ID bytes),
+    ``sort_key`` (integer representing canonical order) and ``codec``
+    (serializer instance for field type, assigned by
+    :mod:`aioxrpy.serializer`).
+    """
+    __slots__ = (
+        'name', 'is_serialized', 'is_signing_field', 'is_vl_encoded', 'nth',
+        'type_', 'header', 'sort_key', 'codec'
+    )
+
     name: str
     is_serialized: bool
     is_signing_field: bool
     is_vl_encoded: bool
     nth: int
     type_: RippleType
+    header: bytes
+    sort_key: int
+    codec: Any
+
+    def __init__(
+        self,
+        name: str,
+        is_serialized: bool,
+        is_signing_field: bool,
+        is_vl_encoded: bool,
+        nth: int,
+        type_: RippleType
+    ):
+        self.name = name
+        self.is_serialized = is_serialized
+        self.is_signing_field = is_signing_field
+        self.is_vl_encoded = is_vl_encoded
+        self.nth = nth
+        self.type_ = type_
+        self.header = bytes(self.field_id) if is_serialized else b''
+        # fields are sorted by type code first, then by field code
+        self.sort_key = (type_ << 16) + nth
+        self.codec = None
+
+    def __repr__(self):
+        return (
+            f'RippleField(name={self.name!r}, nth={self.nth!r}, '
+            f'type_={self.type_!r})'
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, RippleField):
+            return NotImplemented
+        return (
+            self.name, self.is_serialized, self.is_signing_field,
+            self.is_vl_encoded, self.nth, self.type_
+        ) == (
+            other.name, other.is_serialized, other.is_signing_field,
+            other.is_vl_encoded, other.nth, other.type_
+        )
+
+    __hash__ = None  # type: ignore
 
     @property
     def field_id(self):
@@ -145,10 +248,19 @@ class RippleField:
         )
 
 
-RIPPLE_FIELDS = {}
-RIPPLE_FIELDS_LOOKUP = defaultdict(dict)  # type: Dict[str, Dict]
+def field_table_index(type_code: int, field_code: int) -> int:
+    """Returns index of a field in ``RIPPLE_FIELDS_TABLE``"""
+    return (type_code << 8) | field_code
+
+
+RIPPLE_FIELDS = {}  # type: Dict[str, RippleField]
+RIPPLE_FIELDS_LOOKUP = defaultdict(dict)  # type: Dict[RippleType, Dict]
+# Serialized fields indexed by type and field code, see field_table_index
+RIPPLE_FIELDS_TABLE = [None] * 65536  # type: List[Optional[RippleField]]
 
 for k, v in definitions['FIELDS']:
     field = RippleField.from_definition(k, v)
     RIPPLE_FIELDS[k] = field
     RIPPLE_FIELDS_LOOKUP[field.type_][field.nth] = field
+    if field.is_serialized:
+        RIPPLE_FIELDS_TABLE[field_table_index(field.type_, field.nth)] = field
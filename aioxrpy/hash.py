@@ -1,7 +1,17 @@
+from binascii import unhexlify
+from concurrent.futures import Executor, ThreadPoolExecutor
 import hashlib
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Union
 
 from aioxrpy import serializer
+from aioxrpy.definitions import RippleTransactionHashPrefix, RIPPLE_FIELDS
+
+
+# Blobs hashed by a single task of transaction_ids
+DEFAULT_CHUNK_SIZE = 1000
+
+# SHA512 state after hashing transaction ID prefix, copied for every blob
+_TX_ID_HASH = hashlib.sha512(RippleTransactionHashPrefix.HASH_TX_ID)
 
 
 def first_half_of_sha512(*data: bytes) -> bytes:
@@ -9,8 +19,99 @@ def first_half_of_sha512(*data: bytes) -> bytes:
     return hashlib.sha512(b''.join(data)).digest()[:32]  # 256 / 8
 
 
-def hash_transaction(prefix: bytes, tx: Dict, suffix: bytes) -> bytes:
+def hash_transaction(
+    prefix: bytes, tx: Union[Dict, bytes], suffix: bytes
+) -> bytes:
+    """
+    Serializes transaction object and returns first half of SHA512 hash.
+    Already serialized transactions can be passed as ``bytes``.
+    """
+    if isinstance(tx, dict):
+        tx = serializer.serialize(tx)
+    return first_half_of_sha512(prefix, tx, suffix)
+
+
+def signing_data(tx: Union[Dict, bytes, str]) -> bytes:
+    """
+    Returns serialized transaction without fields excluded from signing
+    (``TxnSignature`` and ``Signers``), which is the data its signatures
+    sign. Blobs (``bytes`` or hex strings) have the fields cut out without
+    being deserialized.
+    """
+    if isinstance(tx, dict):
+        return serializer.serialize({
+            name: value for name, value in tx.items()
+            if RIPPLE_FIELDS[name].is_signing_field
+        })
+    if isinstance(tx, str):
+        tx = unhexlify(tx)
+    view = memoryview(tx)
+    parts = []
+    # start of data not copied yet
+    start = cursor = 0
+    end = len(view)
+    while cursor < end:
+        length, field = serializer.lookup_field(view, cursor)
+        field_end = cursor + length
+        field_end += serializer.skip_field(field, view, field_end)
+        if not field.is_signing_field:
+            parts.append(view[start:cursor])
+            start = field_end
+        cursor = field_end
+    if not start:
+        return bytes(tx)
+    parts.append(view[start:])
+    return b''.join(parts)
+
+
+def transaction_id(blob: Union[bytes, str]) -> bytes:
+    """
+    Returns ID (hash) of signed transaction blob, passed as ``bytes`` or
+    hex string. The blob is hashed as is, without deserializing it.
+    """
+    if isinstance(blob, str):
+        blob = unhexlify(blob)
+    sha512 = _TX_ID_HASH.copy()
+    sha512.update(blob)
+    return sha512.digest()[:32]
+
+
+def _transaction_ids(blobs: List[Union[bytes, str]]) -> List[bytes]:
+    return [transaction_id(blob) for blob in blobs]
+
+
+def transaction_ids(
+    blobs: Iterable[Union[bytes, str]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = 0,
+    executor: Optional[Executor] = None
+) -> List[bytes]:
     """
-    Serializes transaction object and returns first half of SHA512 hash
+    Returns IDs of signed transaction blobs in input order.
+
+    Batches longer than ``chunk_size`` are split into chunks hashed in a
+    thread pool. ``hashlib`` releases the GIL while hashing, so chunks are
+    hashed in parallel, although only blobs longer than 2 KiB benefit from
+    it noticeably.
+
+    :param chunk_size: number of blobs hashed by a single task
+    :param max_workers: number of threads, blobs are hashed in the current
+                        thread if ``0``
+    :param executor: executor to use instead of creating a thread pool
     """
-    return first_half_of_sha512(prefix, serializer.serialize(tx), suffix)
+    assert chunk_size > 0, 'chunk_size must be positive'
+    blobs = list(blobs)
+    if (executor is None and not max_workers) or len(blobs) <= chunk_size:
+        return _transaction_ids(blobs)
+
+    chunks = [
+        blobs[start:start + chunk_size]
+        for start in range(0, len(blobs), chunk_size)
+    ]
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_transaction_ids, chunks))
+    else:
+        results = list(executor.map(_transaction_ids, chunks))
+    return [tx_id for chunk in results for tx_id in chunk]
@@ -1,37 +1,86 @@
+import asyncio
 import base58
-from typing import Callable, Dict, Optional, Union
+from concurrent.futures import Executor
+from functools import partial
+from operator import attrgetter
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING,
+    Union
+)
 
-from ecdsa.curves import SECP256k1
-from ecdsa.keys import SigningKey, VerifyingKey
-from ecdsa.util import sigencode_der, sigdecode_der, PRNG
 import hashlib
 import secrets
 
+from aioxrpy import serializer
 from aioxrpy.address import decode_address, encode_address
+from aioxrpy.crypto import (
+    CryptoBackend, ED25519_PREFIX, get_backend, KeyType, make_canonical,
+    SECP256K1_ORDER
+)
 from aioxrpy.definitions import RippleTransactionHashPrefix
 from aioxrpy.hash import first_half_of_sha512, hash_transaction
 
+# ecdsa is imported when keys are first used, so that modules depending on
+# this one (e.g. aioxrpy.rpc) can be imported without loading it
+if TYPE_CHECKING:
+    from ecdsa.keys import SigningKey
 
-def make_canonical(r, s, order):
-    """Makes ecdsa signature canonical"""
-    N = SECP256k1.order
-    if not N / 2 >= s:
-        s = N - s
-    return r, s, order
 
+# Prefixes of encoded seeds, secp256k1 seeds start with letter "s" and
+# Ed25519 seeds with "sEd"
+SEED_PREFIX = b'\x21'
+ED25519_SEED_PREFIX = b'\x01\xe1\x4b'
+_SEED_PREFIXES = {
+    KeyType.SECP256K1: SEED_PREFIX,
+    KeyType.ED25519: ED25519_SEED_PREFIX,
+}
 
-def signing_key_from_seed(encoded_seed: str) -> SigningKey:
+
+def encode_seed(
+    entropy: bytes, key_type: Union[KeyType, str] = KeyType.SECP256K1
+) -> str:
+    """Encodes 16 bytes of seed entropy of the key type using base58"""
+    assert len(entropy) == 16, 'Seed entropy must be 16 bytes long'
+    return base58.b58encode_check(
+        _SEED_PREFIXES[KeyType(key_type)] + entropy,
+        alphabet=base58.RIPPLE_ALPHABET
+    ).decode()
+
+
+def decode_seed(encoded_seed: str) -> Tuple[bytes, KeyType]:
+    """
+    Decodes base58-encoded seed, returns its entropy and key type. Raises
+    ``ValueError`` if it's not a seed.
+    """
+    decoded = base58.b58decode_check(
+        encoded_seed, alphabet=base58.RIPPLE_ALPHABET
+    )
+    for key_type, prefix in _SEED_PREFIXES.items():
+        if len(decoded) == len(prefix) + 16 and decoded.startswith(prefix):
+            return decoded[len(prefix):], key_type
+    raise ValueError('Not a seed')
+
+
+def generate_seed(key_type: Union[KeyType, str] = KeyType.SECP256K1) -> str:
+    """Returns random encoded seed of a new account"""
+    return encode_seed(secrets.token_bytes(16), key_type)
+
+
+def secret_from_seed(
+    encoded_seed: str, backend: Union[CryptoBackend, str, None] = None
+) -> bytes:
     """
-    Derives SigningKey from master seed.
+    Derives 32-byte secret of the account key from master seed, Ed25519
+    secrets are first halves of SHA512 hashes of seeds.
+
+    :param backend: secp256k1 backend deriving the public generator
 
     Reference:
     https://ripple.com/wiki/Account_Family#Root_Key_.28GenerateRootDeterministicKey.29
     """
-    # Ripple seeds are base58-encoded and prefixed with letter "s"
-    assert encoded_seed[0] == 's'
-    seed = base58.b58decode_check(
-        encoded_seed, alphabet=base58.RIPPLE_ALPHABET
-    )[1:]
+    seed, key_type = decode_seed(encoded_seed)
+    if key_type is KeyType.ED25519:
+        return first_half_of_sha512(seed)
 
     seq = 0
     while True:
@@ -40,18 +89,17 @@ def signing_key_from_seed(encoded_seed: str) -> SigningKey:
             byteorder='big'
         )
         seq += 1
-        if SECP256k1.order >= private_gen:
+        if SECP256K1_ORDER >= private_gen:
             break
 
-    public_key = VerifyingKey.from_public_point(
-        SECP256k1.generator * private_gen, curve=SECP256k1
+    public_gen_compressed = get_backend(backend).derive_public_key(
+        private_gen.to_bytes(32, byteorder='big')
     )
 
     # Now that we have the private and public generators, we apparently
     # have to calculate a secret from them that can be used as a ECDSA
     # signing key.
     secret = i = 0
-    public_gen_compressed = public_key.to_string(encoding='compressed')
     while True:
         secret = int.from_bytes(
             first_half_of_sha512(
@@ -60,11 +108,61 @@ def signing_key_from_seed(encoded_seed: str) -> SigningKey:
             byteorder='big'
         )
         i += 1
-        if SECP256k1.order >= secret:
+        if SECP256K1_ORDER >= secret:
             break
 
-    secret = (secret + private_gen) % SECP256k1.order
-    return SigningKey.from_secret_exponent(secret, curve=SECP256k1)
+    secret = (secret + private_gen) % SECP256K1_ORDER
+    return secret.to_bytes(32, byteorder='big')
+
+
+def signing_key_from_seed(encoded_seed: str) -> 'SigningKey':
+    """Derives ``ecdsa`` SigningKey from master seed"""
+    from ecdsa.curves import SECP256k1
+    from ecdsa.keys import SigningKey
+
+    return SigningKey.from_string(
+        secret_from_seed(encoded_seed), curve=SECP256k1
+    )
+
+
+def account_id(public_key: bytes) -> bytes:
+    """Returns account ID (RIPEMD-160 hash of SHA256 hash) of public key"""
+    ripemd160 = hashlib.new('ripemd160')
+    ripemd160.update(hashlib.sha256(public_key).digest())
+    return ripemd160.digest()
+
+
+def generate_secret(
+    key_type: Union[KeyType, str] = KeyType.SECP256K1
+) -> bytes:
+    """Returns random 32-byte secret of a new key"""
+    if KeyType(key_type) is KeyType.ED25519:
+        return secrets.token_bytes(32)
+    while True:
+        secret = secrets.token_bytes(32)
+        if 0 < int.from_bytes(secret, byteorder='big') < SECP256K1_ORDER:
+            return secret
+
+
+def public_key_type(public_key: bytes) -> KeyType:
+    """Returns key type of public key, Ed25519 keys are prefixed with 0xED"""
+    if len(public_key) == 33 and public_key[:1] == ED25519_PREFIX:
+        return KeyType.ED25519
+    return KeyType.SECP256K1
+
+
+def _load_key(
+    private_key: Optional[bytes],
+    public_key: Optional[bytes],
+    backend: str,
+    key_type: KeyType = KeyType.SECP256K1
+) -> 'RippleKey':
+    return RippleKey(
+        private_key=private_key,
+        public_key=public_key,
+        backend=backend,
+        key_type=key_type
+    )
 
 
 class RippleKey:
@@ -73,40 +171,100 @@ class RippleKey:
 
     :param private_key: private key or master seed,
     :param public_key: public key
+    :param backend: crypto backend or its name, see
+                    :func:`aioxrpy.crypto.get_backend`
+    :param key_type: ``secp256k1`` (default) or ``ed25519``, only needed
+                     for generated keys and raw private keys; types of
+                     seeds and public keys are recognized by their prefixes
 
     If no arguments are passed, new key will be generated.
+
+    Signatures are deterministic and identical for all backends. Passing
+    ``ecdsa`` signing options (e.g. ``k``) to :meth:`sign` and :meth:`verify`
+    uses ``ecdsa`` regardless of the backend, for secp256k1 keys only.
     """
 
     def __init__(
         self,
         *,
         private_key: Optional[Union[str, bytes]] = None,
-        public_key: Optional[bytes] = None
+        public_key: Optional[bytes] = None,
+        backend: Union[CryptoBackend, str, None] = None,
+        key_type: Union[KeyType, str, None] = None
     ):
         assert not (private_key and public_key), 'Pass only one key'
         if public_key:
+            detected = public_key_type(public_key)  # type: Optional[KeyType]
+        elif isinstance(private_key, str):
+            detected = decode_seed(private_key)[1]
+        else:
+            detected = None
+        if key_type is not None and detected not in (None, key_type):
+            raise ValueError(f'Not a {KeyType(key_type).value} key')
+        self._backend = get_backend(
+            backend, detected or key_type or KeyType.SECP256K1
+        )
+        # keys don't change, so derived values are computed once
+        self._public = None  # type: Optional[bytes]
+        self._account_id = None  # type: Optional[bytes]
+        self._account = None  # type: Optional[str]
+
+        if public_key:
+            self._secret = None  # type: Optional[bytes]
             self._sk = None
-            self._vk = VerifyingKey.from_string(public_key, curve=SECP256k1)
+            self._vk = self._backend.load_public_key(public_key)
             return
 
         if private_key:
             if isinstance(private_key, str):
-                self._sk = signing_key_from_seed(private_key)
+                self._secret = secret_from_seed(private_key, self._backend)
             else:
-                self._sk = SigningKey.from_string(private_key, curve=SECP256k1)
+                self._secret = private_key
         else:
-            entropy = PRNG(secrets.randbits(512))
-            self._sk = SigningKey.generate(
-                entropy=entropy, curve=SECP256k1
-            )
+            self._secret = generate_secret(self.key_type)
+
+        self._sk = self._backend.load_private_key(self._secret)
+        self._vk = self._backend.get_public_key(self._sk)
+
+    @property
+    def backend(self) -> CryptoBackend:
+        """Crypto backend used by the key"""
+        return self._backend
 
-        self._vk = self._sk.get_verifying_key()
+    @property
+    def key_type(self) -> KeyType:
+        """Key type, recognized from seed or public key prefix"""
+        return self._backend.key_type
+
+    def __reduce__(self):
+        # backend key objects can't be pickled, keys are passed to other
+        # processes (e.g. ProcessPoolExecutor workers) as raw keys
+        return _load_key, (
+            self._secret,
+            None if self._secret is not None else self.to_public(),
+            self._backend.name,
+            self.key_type
+        )
+
+    def to_private(self) -> bytes:
+        """Returns 32-byte private key"""
+        assert self._secret is not None, "Public key has no private key"
+        return self._secret
 
     def to_public(self) -> bytes:
         """
         Returns public key encoded in compressed format.
         """
-        return self._vk.to_string(encoding='compressed')
+        if self._public is None:
+            self._public = self._backend.encode_public_key(self._vk)
+        return self._public
+
+    @property
+    def account_id(self) -> bytes:
+        """Account ID of the key, see :func:`account_id`"""
+        if self._account_id is None:
+            self._account_id = account_id(self.to_public())
+        return self._account_id
 
     def to_account(self) -> str:
         """
@@ -115,10 +273,9 @@ class RippleKey:
 
         For example: ``rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh``
         """
-        pubkey = self.to_public()
-        ripemd160 = hashlib.new('ripemd160')
-        ripemd160.update(hashlib.sha256(pubkey).digest())
-        return encode_address(ripemd160.digest())
+        if self._account is None:
+            self._account = encode_address(self.account_id)
+        return self._account
 
     def _tx_prefix(self, multi_sign: bool) -> bytes:
         return (
@@ -128,41 +285,190 @@ class RippleKey:
         )
 
     def _tx_suffix(self, multi_sign: bool) -> bytes:
-        return b'' if not multi_sign else decode_address(self.to_account())
+        return b'' if not multi_sign else self.account_id
+
+    def _tx_signing_data(
+        self, tx: Union[Dict, bytes], multi_sign: bool
+    ) -> bytes:
+        # secp256k1 keys sign the hash, Ed25519 keys the whole message
+        prefix = self._tx_prefix(multi_sign)
+        suffix = self._tx_suffix(multi_sign)
+        if self.key_type is KeyType.ED25519:
+            if isinstance(tx, dict):
+                tx = serializer.serialize(tx)
+            return b''.join((prefix, tx, suffix))
+        return hash_transaction(prefix, tx, suffix)
 
-    def sign_tx(self, tx: Dict, *, multi_sign: bool = False, **kwargs) -> str:
-        tx_hash = hash_transaction(
-            self._tx_prefix(multi_sign), tx, self._tx_suffix(multi_sign)
+    def sign_tx(
+        self, tx: Union[Dict, bytes], *, multi_sign: bool = False, **kwargs
+    ) -> bytes:
+        """
+        Signs the transaction, which can be passed either as a dict or as
+        serialized ``bytes``
+        """
+        return self.sign(self._tx_signing_data(tx, multi_sign), **kwargs)
+
+    async def sign_tx_async(
+        self,
+        tx: Union[Dict, bytes],
+        *,
+        multi_sign: bool = False,
+        executor: Optional[Executor] = None
+    ) -> bytes:
+        """
+        Signs the transaction in an executor, so that the event loop isn't
+        blocked while signing. Uses the default executor of the loop unless
+        ``executor`` is passed; with ``ProcessPoolExecutor`` the key is sent
+        to worker processes.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(self.sign_tx, tx, multi_sign=multi_sign)
         )
-        return self.sign(tx_hash, **kwargs)
 
     def verify_tx(
-        self, tx: Dict, signature: str, *, multi_sign: bool = False, **kwargs
+        self,
+        tx: Union[Dict, bytes],
+        signature: bytes,
+        *,
+        multi_sign: bool = False,
+        **kwargs
     ) -> bool:
-        tx_hash = hash_transaction(
-            self._tx_prefix(multi_sign), tx, self._tx_suffix(multi_sign)
+        return self.verify(
+            self._tx_signing_data(tx, multi_sign), signature, **kwargs
         )
-        return self.verify(tx_hash, signature, **kwargs)
 
     def sign(
-        self, data: bytes, sigencode: Callable = sigencode_der, **kwargs
-    ) -> str:
+        self, data: bytes, sigencode: Optional[Callable] = None, **kwargs
+    ) -> bytes:
         """
-        Signs the provided data and returns a canonical signature
+        Signs the provided data and returns a canonical signature, DER
+        encoded unless ``sigencode`` is passed. Ed25519 keys sign the
+        message itself rather than its digest.
         """
         assert self._sk is not None, "Can't sign with a public key"
-        return sigencode(*self._sk.sign_digest(
+        if sigencode is None and not kwargs:
+            return self._backend.sign(self._sk, data)
+        assert self.key_type is KeyType.SECP256K1, (
+            'ecdsa options only apply to secp256k1 keys'
+        )
+
+        from ecdsa.util import sigencode_der
+        if sigencode is None:
+            sigencode = sigencode_der
+        sk = self._sk
+        if self._backend.name != 'ecdsa':
+            sk = get_backend('ecdsa').load_private_key(self.to_private())
+        return sigencode(*sk.sign_digest(
             data, sigencode=make_canonical, **kwargs
         ))
 
     def verify(
         self,
         data: bytes,
-        signature: str,
+        signature: bytes,
         *,
-        sigdecode: Callable = sigdecode_der,
+        sigdecode: Optional[Callable] = None,
         **kwargs
     ) -> bool:
-        return self._vk.verify_digest(
+        """
+        Checks signature of the provided data, DER encoded unless
+        ``sigdecode`` is passed
+        """
+        if sigdecode is None and not kwargs:
+            return self._backend.verify(self._vk, data, signature)
+        assert self.key_type is KeyType.SECP256K1, (
+            'ecdsa options only apply to secp256k1 keys'
+        )
+
+        from ecdsa.util import sigdecode_der
+        if sigdecode is None:
+            sigdecode = sigdecode_der
+        vk = self._vk
+        if self._backend.name != 'ecdsa':
+            vk = get_backend('ecdsa').load_public_key(self.to_public())
+        return vk.verify_digest(
             signature, data, sigdecode=sigdecode, **kwargs
         )
+
+
+class KeyRing:
+    """
+    Collection of keys indexed by account and public key.
+
+    Keys are kept in canonical signer order (sorted by account ID), which
+    is computed once after keys change, so a ring can be passed to
+    :meth:`aioxrpy.rpc.RippleJsonRpc.multisign_and_submit` as is.
+
+    :param keys: initial keys
+    """
+
+    def __init__(self, keys: Iterable[RippleKey] = ()):
+        self._by_account_id = {}  # type: Dict[bytes, RippleKey]
+        self._by_public_key = {}  # type: Dict[bytes, RippleKey]
+        self._signers = None  # type: Optional[List[RippleKey]]
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: RippleKey) -> None:
+        """Adds the key, replacing a key of the same account"""
+        self.discard(key.account_id)
+        self._by_account_id[key.account_id] = key
+        self._by_public_key[key.to_public()] = key
+        self._signers = None
+
+    def discard(self, account: Union[str, bytes]) -> None:
+        """Removes key of the account (address or account ID) if present"""
+        key = self._by_account_id.pop(_account_id(account), None)
+        if key is not None:
+            del self._by_public_key[key.to_public()]
+            self._signers = None
+
+    def get(
+        self, account: Union[str, bytes], default: Optional[RippleKey] = None
+    ) -> Optional[RippleKey]:
+        """Returns key of the account (address or account ID)"""
+        return self._by_account_id.get(_account_id(account), default)
+
+    def __getitem__(self, account: Union[str, bytes]) -> RippleKey:
+        """Returns key of the account, raises ``KeyError`` if missing"""
+        return self._by_account_id[_account_id(account)]
+
+    def by_public_key(self, public_key: bytes) -> RippleKey:
+        """
+        Returns key by compressed public key, raises ``KeyError`` if
+        missing
+        """
+        return self._by_public_key[public_key]
+
+    def signers(
+        self, accounts: Optional[Iterable[Union[str, bytes]]] = None
+    ) -> List[RippleKey]:
+        """
+        Returns keys in canonical signer order, all of them or keys of the
+        accounts. Raises ``KeyError`` if an account is missing.
+        """
+        if self._signers is None:
+            self._signers = sorted(
+                self._by_account_id.values(),
+                key=attrgetter('account_id')
+            )
+        if accounts is None:
+            return list(self._signers)
+        keys = [self[account] for account in accounts]
+        return sorted(keys, key=attrgetter('account_id'))
+
+    def __contains__(self, account) -> bool:
+        return _account_id(account) in self._by_account_id
+
+    def __iter__(self) -> Iterator[RippleKey]:
+        return iter(self.signers())
+
+    def __len__(self) -> int:
+        return len(self._by_account_id)
+
+
+def _account_id(account: Union[str, bytes]) -> bytes:
+    if isinstance(account, str):
+        return decode_address(account)
+    return account
@@ -0,0 +1,219 @@
+"""
+Compact records as an alternative to dicts returned by
+:func:`aioxrpy.serializer.deserialize`.
+
+Each transaction type and set of fields gets a record class with
+``__slots__``, so records don't carry a dict of field names. Account IDs
+and amounts are stored in their serialized form and decoded on attribute
+access, which makes records considerably smaller when many deserialized
+objects are kept in memory.
+"""
+from binascii import unhexlify
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from aioxrpy import serializer
+from aioxrpy.address import CACHE_SIZE, encode_address
+from aioxrpy.definitions import (
+    RippleTransactionType, RippleType, RIPPLE_FIELDS
+)
+
+
+# Types kept serialized until accessed
+DEFERRED_TYPES = frozenset((RippleType.AccountID, RippleType.Amount))
+
+_AMOUNT = RIPPLE_FIELDS['Amount'].codec
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _intern_account(account_id: bytes) -> bytes:
+    # the same accounts appear in many objects, records share a single
+    # bytes object for each of them
+    return account_id
+
+
+class RippleRecord:
+    """
+    Base class of record classes, see :func:`record_class`.
+
+    Fields are accessed as attributes, e.g. ``record.Account``.
+    """
+    __slots__ = ()
+
+    # field names in canonical order and slots holding their values
+    _fields = ()  # type: Tuple[str, ...]
+    _slots = ()  # type: Tuple[str, ...]
+    _transaction_type = None  # type: Optional[int]
+
+    def raw(self, name: str) -> Any:
+        """
+        Returns value of the field as stored, which is serialized for
+        account IDs and amounts
+        """
+        return getattr(self, self._slots[self._fields.index(name)])
+
+    def to_dict(self) -> Dict:
+        """
+        Returns dict with all fields decoded, equal to the one returned by
+        :func:`aioxrpy.serializer.deserialize`
+        """
+        return {name: getattr(self, name) for name in self._fields}
+
+    def serialize(self) -> bytes:
+        """
+        Serializes the record, fields stored in serialized form are written
+        as they are
+        """
+        buffer = bytearray()
+        for name, slot in zip(self._fields, self._slots):
+            field = RIPPLE_FIELDS[name]
+            buffer += field.header
+            value = getattr(self, slot)
+            if field.type_ == RippleType.AccountID:
+                serializer.BLOB.write(buffer, value)
+            elif field.type_ == RippleType.Amount:
+                buffer += value
+            else:
+                field.codec.write(buffer, value)
+        return bytes(buffer)
+
+    def __eq__(self, other):
+        if not isinstance(other, RippleRecord):
+            return NotImplemented
+        # classes are compared by their schema, as cached classes may be
+        # evicted and created again
+        return (
+            self._transaction_type == other._transaction_type
+            and self._fields == other._fields
+            and all(
+                getattr(self, slot) == getattr(other, slot)
+                for slot in self._slots
+            )
+        )
+
+    __hash__ = None  # type: ignore
+
+    def __reduce__(self):
+        # record classes are created at runtime, so they can't be pickled
+        # by reference
+        return _make_record, (
+            self._transaction_type,
+            self._fields,
+            tuple(getattr(self, slot) for slot in self._slots)
+        )
+
+    def __repr__(self) -> str:
+        fields = ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in self._fields
+        )
+        return f'{type(self).__name__}({fields})'
+
+
+def _account_property(slot: str) -> property:
+    get_raw = attrgetter(slot)
+    return property(lambda self: encode_address(get_raw(self)))
+
+
+def _amount_property(slot: str) -> property:
+    get_raw = attrgetter(slot)
+    return property(lambda self: _AMOUNT.deserialize(get_raw(self))[1])
+
+
+@lru_cache(maxsize=1024)
+def record_class(
+    transaction_type: Optional[int], fields: Tuple[str, ...]
+) -> Type[RippleRecord]:
+    """
+    Returns record class for transaction type (``None`` for other objects)
+    and field names in canonical order. Classes are cached, so records with
+    the same fields share a class.
+    """
+    namespace = {
+        '_fields': fields, '_transaction_type': transaction_type
+    }  # type: Dict[str, Any]
+    slots = []
+    for name in fields:
+        field = RIPPLE_FIELDS[name]
+        if field.type_ in DEFERRED_TYPES:
+            slot = f'_raw_{name}'
+            namespace[name] = (
+                _account_property(slot)
+                if field.type_ == RippleType.AccountID
+                else _amount_property(slot)
+            )
+        else:
+            slot = name
+        slots.append(slot)
+    namespace['__slots__'] = namespace['_slots'] = tuple(slots)
+    namespace['__init__'] = _make_init(slots)
+
+    try:
+        name = RippleTransactionType(transaction_type).name + 'Record'
+    except ValueError:
+        name = 'RippleObjectRecord'
+    return type(name, (RippleRecord,), namespace)
+
+
+def _make_init(slots: List[str]):
+    """Returns ``__init__`` assigning positional arguments to slots"""
+    source = 'def __init__(self, {}):\n    {}\n'.format(
+        ''.join(f'v{index}, ' for index in range(len(slots))),
+        ''.join(
+            f'self.{slot} = v{index}; ' for index, slot in enumerate(slots)
+        ) or 'pass'
+    )
+    namespace = {}  # type: Dict[str, Any]
+    exec(source, namespace)
+    return namespace['__init__']
+
+
+def _make_record(
+    transaction_type: Optional[int], fields: Tuple[str, ...], values: Tuple
+) -> RippleRecord:
+    return record_class(transaction_type, fields)(*values)
+
+
+def deserialize_record(
+    binary: Union[serializer.Buffer, str]
+) -> RippleRecord:
+    """
+    Deserializes object from binary format into a record.
+    ``record.to_dict()`` is equal to ``deserialize(binary)``.
+    """
+    if isinstance(binary, str):
+        binary = unhexlify(binary)
+    view = memoryview(binary)
+    names = []
+    values = []  # type: List[Any]
+    cursor = 0
+    end = len(view)
+    while cursor < end:
+        length, field = serializer.lookup_field(view, cursor)
+        cursor += length
+        if field is serializer.OBJECT_END_MARKER:
+            break
+        type_ = field.type_
+        value = None  # type: Any
+        if type_ is RippleType.AccountID:
+            prefix_length, length = serializer.BLOB.decode_length(view, cursor)
+            start = cursor + prefix_length
+            value = _intern_account(bytes(view[start:start + length]))
+            cursor = start + length
+        elif type_ is RippleType.Amount:
+            length = _AMOUNT.skip(view, cursor)
+            value = bytes(view[cursor:cursor + length])
+            cursor += length
+        else:
+            length, value = serializer.read_field(field, view, cursor)
+            cursor += length
+            if type_ is RippleType.Vector256:
+                # don't keep the whole blob alive for a single field
+                value = serializer.HashVector(bytes(value.view))
+        names.append(field.name)
+        values.append(value)
+
+    transaction_type = None
+    if 'TransactionType' in names:
+        transaction_type = values[names.index('TransactionType')]
+    return record_class(transaction_type, tuple(names))(*values)
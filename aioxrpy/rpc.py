@@ -1,13 +1,14 @@
+import asyncio
 import binascii
+from concurrent.futures import Executor
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Dict, List
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from aiohttp.client import ClientSession
-
-from aioxrpy import address, exceptions, serializer
+from aioxrpy import exceptions, serializer
 from aioxrpy.definitions import RippleTransactionResultCategory
-from aioxrpy.keys import RippleKey
+from aioxrpy.keys import KeyRing, RippleKey
 
 
 @dataclass
@@ -24,11 +25,151 @@ class RippleFeeInfo:
     open_ledger: int
 
 
+# Transactions of a single key signed by one executor task
+SIGNING_BATCH_SIZE = 100
+
+
+def sign_transaction(tx: Dict, key: RippleKey) -> str:
+    """
+    Serializes and signs the transaction, returns hex-encoded blob.
+
+    Transaction is serialized once, signature is inserted into the
+    serialized data.
+    """
+    binary, offsets = serializer.serialize_with_offsets(tx)
+    return binascii.hexlify(serializer.insert_fields(
+        binary, offsets, {'TxnSignature': key.sign_tx(binary)}
+    )).decode()
+
+
+def multisign_transaction(
+    tx: Dict, keys: Union[List[RippleKey], KeyRing]
+) -> str:
+    """
+    Serializes and signs the transaction using multiple keys, returns
+    hex-encoded blob.
+
+    Transaction is serialized once and signed by every key, ``Signers``
+    are inserted into the serialized data.
+    """
+    tx = {**tx, 'SigningPubKey': b''}
+    binary, offsets = serializer.serialize_with_offsets(tx)
+    # signers are sorted by account ID, key rings keep keys sorted
+    signers = [
+        {
+            'Signer': {
+                'Account': key.to_account(),
+                'TxnSignature': key.sign_tx(binary, multi_sign=True),
+                'SigningPubKey': key.to_public(),
+            }
+        }
+        for key in (
+            keys.signers() if isinstance(keys, KeyRing)
+            else sorted(keys, key=attrgetter('account_id'))
+        )
+    ]
+    return binascii.hexlify(serializer.insert_fields(
+        binary, offsets, {'Signers': signers}
+    )).decode()
+
+
+def _sign_transactions(key: RippleKey, txs: List[Dict]) -> List[Any]:
+    """Signs a batch, returning blobs or exceptions raised for them"""
+    results = []  # type: List[Any]
+    for tx in txs:
+        try:
+            results.append(sign_transaction(tx, key))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class _SigningBatcher:
+    """
+    Signs transactions in an executor. Transactions of the same key queued
+    while the event loop is busy are signed by a single task, so a key is
+    sent to a process pool once per batch rather than per transaction.
+    """
+
+    def __init__(self, executor: Executor):
+        self.executor = executor
+        self._queues = {}  # type: Dict[int, Tuple[RippleKey, List[Tuple]]]
+
+    def sign(self, tx: Dict, key: RippleKey) -> 'asyncio.Future[str]':
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        queue = self._queues.get(id(key))
+        if queue is None:
+            queue = self._queues[id(key)] = (key, [])
+            loop.call_soon(self._flush, id(key))
+        queue[1].append((tx, future))
+        if len(queue[1]) >= SIGNING_BATCH_SIZE:
+            self._flush(id(key))
+        return future
+
+    def _flush(self, key_id: int) -> None:
+        if key_id not in self._queues:
+            # already flushed when the batch filled up
+            return
+        key, items = self._queues.pop(key_id)
+        try:
+            task = asyncio.ensure_future(
+                asyncio.get_event_loop().run_in_executor(
+                    self.executor, _sign_transactions, key,
+                    [tx for tx, _ in items]
+                )
+            )
+        except Exception as e:
+            # e.g. executor already shut down, fail the whole batch
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        def done(task):
+            if task.cancelled():
+                for _, future in items:
+                    future.cancel()
+                return
+            if task.exception() is not None:
+                results = [task.exception()] * len(items)
+            else:
+                results = task.result()
+            for (_, future), result in zip(items, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+        task.add_done_callback(done)
+
+
 class RippleJsonRpc:
-    def __init__(self, url):
+    """
+    JSON-RPC client
+
+    :param url: URL of rippled JSON-RPC endpoint
+    :param executor: thread or process pool serializing and signing
+                     transactions in :meth:`sign_and_submit` and
+                     :meth:`multisign_and_submit`, so that the event loop
+                     isn't blocked while signing; transactions are signed in
+                     the event loop if ``None``
+    """
+
+    def __init__(self, url, *, executor: Optional[Executor] = None):
         self.URL = url
+        self.executor = executor
+        self._batcher = (
+            _SigningBatcher(executor) if executor is not None else None
+        )
 
     async def post(self, method, *args):
+        # aiohttp takes a while to import, so it's only imported once
+        # a request is made
+        from aiohttp.client import ClientSession
+
         async with ClientSession() as session:
             async with session.post(
                 self.URL,
@@ -77,6 +218,20 @@ class RippleJsonRpc:
     async def ledger_closed(self):
         return await self.post('ledger_closed')
 
+    async def ledger_entry(self, index: str, ledger_index='validated'):
+        """
+        Returns ledger entry with given ID. Entry is requested in binary
+        form and deserialized locally into ``node``.
+        """
+        result = await self.post('ledger_entry', {
+            'index': index,
+            'ledger_index': ledger_index,
+            'binary': True
+        })
+        return {
+            **result, 'node': serializer.deserialize(result['node_binary'])
+        }
+
     async def submit(self, tx_blob):
         """
         Submits raw transaction to JSON-RPC and handles `engine_result` value,
@@ -110,7 +265,8 @@ class RippleJsonRpc:
 
     async def sign_and_submit(self, tx: dict, key: RippleKey) -> dict:
         """
-        Signs, serializes and submits the transaction using provided key
+        Signs, serializes and submits the transaction using provided key,
+        see :func:`sign_transaction`
         """
         tx = deepcopy(tx)
 
@@ -123,16 +279,18 @@ class RippleJsonRpc:
             )
             tx['Sequence'] = info['account_data']['Sequence']
 
-        tx['TxnSignature'] = key.sign_tx(tx)
-        tx_blob = binascii.hexlify(serializer.serialize(tx)).decode()
+        if self._batcher is None:
+            tx_blob = sign_transaction(tx, key)
+        else:
+            tx_blob = await self._batcher.sign(tx, key)
         return await self.submit(tx_blob)
 
     async def multisign_and_submit(
-        self, tx: Dict, keys: List[RippleKey]
+        self, tx: Dict, keys: Union[List[RippleKey], KeyRing]
     ) -> dict:
         """
         Signs, serializes and submits the transaction using multiple
-        keys
+        keys, see :func:`multisign_transaction`
         """
         tx = deepcopy(tx)
         assert 'Account' in tx
@@ -143,26 +301,35 @@ class RippleJsonRpc:
             )
             tx['Sequence'] = info['account_data']['Sequence']
 
-        # sort keys by account ID
-        tx['SigningPubKey'] = b''
-        tx['Signers'] = [
-            {
-                'Signer': {
-                    'Account': key.to_account(),
-                    'TxnSignature': key.sign_tx(tx, multi_sign=True),
-                    'SigningPubKey': key.to_public(),
-                }
-            }
-            for key in sorted(
-                keys, key=lambda key: address.decode_address(key.to_account())
+        if self.executor is None:
+            tx_blob = multisign_transaction(tx, keys)
+        else:
+            tx_blob = await asyncio.get_running_loop().run_in_executor(
+                self.executor, multisign_transaction, tx, keys
             )
-        ]
-        tx_blob = binascii.hexlify(serializer.serialize(tx)).decode()
         return await self.submit(tx_blob)
 
     async def server_info(self):
         return (await self.post('server_info'))['info']
 
+    async def tx(self, transaction: str) -> dict:
+        """
+        Returns transaction with given hash along with its metadata.
+        Transaction and metadata are requested in binary form and
+        deserialized locally, which is considerably cheaper than verbose
+        JSON for large metadata.
+        """
+        result = await self.post('tx', {
+            'transaction': transaction,
+            'binary': True
+        })
+        result = {**result, 'tx': serializer.deserialize(result['tx'])}
+        if 'meta' in result:
+            # metadata is not available for transactions not yet in a
+            # closed ledger
+            result['meta'] = serializer.deserialize(result['meta'])
+        return result
+
     async def get_reserve(self) -> RippleReserveInfo:
         result = await self.server_info()
         validated_ledger = result.get('validated_ledger')
@@ -1,28 +1,61 @@
 from binascii import unhexlify
 from abc import ABC, abstractmethod
-from decimal import Decimal as D
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from operator import attrgetter
 import struct
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 from aioxrpy.address import encode_address, decode_address
-from aioxrpy.definitions import RippleType, RIPPLE_FIELDS, RIPPLE_FIELDS_LOOKUP
+from aioxrpy.decimals import (
+    IssuedCurrencyValue, MAX_EXPONENT, MAX_MANTISSA, MIN_EXPONENT,
+    MIN_MANTISSA
+)
+from aioxrpy.definitions import (
+    RippleField, RippleType, RIPPLE_FIELDS, RIPPLE_FIELDS_TABLE
+)
 from aioxrpy.exceptions import RippleSerializerUnsupportedTypeException
 
 
+# Any object supporting the buffer protocol that can be deserialized from
+Buffer = Union[bytes, bytearray, memoryview]
+
+
 class BaseSerializer(ABC):
-    @abstractmethod
     def serialize(self, value: Any) -> bytes:
         """Returns byte-encoded value"""
+        buffer = bytearray()
+        self.write(buffer, value)
+        return bytes(buffer)
+
+    @abstractmethod
+    def write(self, buffer: bytearray, value: Any) -> None:
+        """
+        Appends byte-encoded value to ``buffer``.
+
+        Nested values are written into the same buffer, so serializing an
+        object doesn't allocate intermediate ``bytes`` for its fields.
+        """
         pass  # pragma: no cover
 
     @abstractmethod
-    def deserialize(self, value: bytes) -> Tuple[int, Any]:
+    def deserialize(self, value: Buffer, offset: int = 0) -> Tuple[int, Any]:
         """
         Returns a tuple containing length of original data and deserialized
-        value
+        value.
+
+        Data is read from ``value`` starting at ``offset``, so nested values
+        can be decoded from a single buffer without slicing it.
         """
         pass  # pragma: no cover
 
+    def skip(self, value: Buffer, offset: int = 0) -> int:
+        """
+        Returns length of serialized value starting at ``offset``, without
+        building deserialized value if possible
+        """
+        return self.deserialize(value, offset)[0]
+
 
 class BasicTypeSerializer(BaseSerializer):
     """
@@ -35,14 +68,19 @@ class BasicTypeSerializer(BaseSerializer):
     def __init__(self, fmt: Union[bytes, str] = ''):
         assert fmt, 'provide valid fmt value'
         self.fmt = fmt
+        self._struct = struct.Struct(fmt)
 
     def serialize(self, value: Any) -> bytes:
-        return struct.pack(self.fmt, value)
+        return self._struct.pack(value)
+
+    def write(self, buffer: bytearray, value: Any) -> None:
+        buffer += self._struct.pack(value)
 
-    def deserialize(self, value: bytes) -> Tuple[int, Any]:
-        length = struct.calcsize(self.fmt)
-        values = struct.unpack_from(self.fmt, value)
-        return length, values[0]
+    def deserialize(self, value: Buffer, offset: int = 0) -> Tuple[int, Any]:
+        return self._struct.size, self._struct.unpack_from(value, offset)[0]
+
+    def skip(self, value: Buffer, offset: int = 0) -> int:
+        return self._struct.size
 
 
 class BlobSerializer(BaseSerializer):
@@ -52,34 +90,49 @@ class BlobSerializer(BaseSerializer):
     Reference: https://xrpl.org/serialization.html#length-prefixing
     """
 
-    def serialize(self, value: bytes) -> bytes:
-        length = len(value)
+    def write(self, buffer: bytearray, value: Buffer) -> None:
+        self.write_length(buffer, len(value))
+        buffer += value
+
+    def write_length(self, buffer: bytearray, length: int) -> None:
+        """Appends length prefix to ``buffer``"""
         if length > 918744:
             raise ValueError('Payload too long, should be <= 918744')
 
-        prefix: Tuple = ()
         if length <= 192:
-            prefix = length,
+            buffer.append(length)
         elif length <= 12480:
             length -= 193
-            prefix = (length >> 8) + 193, length & 255
-        elif length <= 918744:
+            buffer.append((length >> 8) + 193)
+            buffer.append(length & 255)
+        else:
             length -= 12481
-            prefix = 241 + (length >> 16), (length >> 8) & 255, length & 255
-        return b''.join((bytes(prefix), value))
+            buffer.append(241 + (length >> 16))
+            buffer.append((length >> 8) & 255)
+            buffer.append(length & 255)
+
+    def deserialize(self, value: Buffer, offset: int = 0) -> Tuple[int, bytes]:
+        prefix_length, length = self.decode_length(value, offset)
+        start = offset + prefix_length
+        return prefix_length + length, bytes(value[start:start + length])
 
-    def deserialize(self, value: bytes) -> Tuple[int, bytes]:
-        byte0, byte1, byte2 = value[:3]
+    def skip(self, value: Buffer, offset: int = 0) -> int:
+        prefix_length, length = self.decode_length(value, offset)
+        return prefix_length + length
+
+    def decode_length(self, value: Buffer, offset: int = 0) -> Tuple[int, int]:
+        """
+        Returns a tuple containing length of the length prefix and length of
+        the payload following it
+        """
+        byte0 = value[offset]
         if byte0 <= 192:
-            offset = 1
-            length = byte0
+            return 1, byte0
         elif byte0 <= 240:
-            offset = 2
-            length = 193 + ((byte0 - 193) * 256) + byte1
-        else:
-            offset = 3
-            length = 12481 + ((byte0 - 241) * 65536) + (byte1 * 256) + byte2
-        return length + offset, value[offset:offset + length]
+            byte1 = value[offset + 1]
+            return 2, 193 + ((byte0 - 193) * 256) + byte1
+        byte1, byte2 = value[offset + 1], value[offset + 2]
+        return 3, 12481 + ((byte0 - 241) * 65536) + (byte1 * 256) + byte2
 
 
 class AccountIDSerializer(BaseSerializer):
@@ -87,13 +140,16 @@ class AccountIDSerializer(BaseSerializer):
     Serializer for AccountID type
     """
 
-    def serialize(self, value: str) -> bytes:
-        return BlobSerializer().serialize(decode_address(value))
+    def write(self, buffer: bytearray, value: str) -> None:
+        BLOB.write(buffer, decode_address(value))
 
-    def deserialize(self, value: bytes) -> Tuple[int, str]:
-        length, value = BlobSerializer().deserialize(value)
+    def deserialize(self, value: Buffer, offset: int = 0) -> Tuple[int, str]:
+        length, value = BLOB.deserialize(value, offset)
         return length, encode_address(value)
 
+    def skip(self, value: Buffer, offset: int = 0) -> int:
+        return BLOB.skip(value, offset)
+
 
 class CurrencySerializer(BaseSerializer):
     """
@@ -102,32 +158,47 @@ class CurrencySerializer(BaseSerializer):
     ``[12 reserved bytes][3-character currency code][5 reserved bytes]``
     """
 
-    def deserialize(self, value: bytes) -> Tuple[int, str]:
-        return 20, value[12:15].decode()
+    def deserialize(self, value: Buffer, offset: int = 0) -> Tuple[int, str]:
+        return 20, bytes(value[offset + 12:offset + 15]).decode()
 
-    def serialize(self, value: str) -> bytes:
-        return value[:3].encode().rjust(15, b'\x00').ljust(20, b'\x00')
+    def skip(self, value: Buffer, offset: int = 0) -> int:
+        return 20
+
+    def write(self, buffer: bytearray, value: str) -> None:
+        buffer += value[:3].encode().rjust(15, b'\x00').ljust(20, b'\x00')
 
 
 class AmountSerializer(BaseSerializer):
+    """
+    Serializer for Amount type.
+
+    XRP amounts are passed as ``int`` (drops), issued currency amounts as
+    dicts with ``value``, ``code`` and ``issuer`` keys. Issued currency
+    values are encoded using integer mantissa and exponent, and deserialized
+    as :class:`aioxrpy.decimals.IssuedCurrencyValue`.
+    """
+
     def __init__(self):
-        self.MIN_MANTISSA = 10**15
-        self.MAX_MANTISSA = 10**16 - 1
-        self.MIN_EXP = -96
-        self.MAX_EXP = 80
+        self.MIN_MANTISSA = MIN_MANTISSA
+        self.MAX_MANTISSA = MAX_MANTISSA
+        self.MIN_EXP = MIN_EXPONENT
+        self.MAX_EXP = MAX_EXPONENT
 
     def scale_to_xrp_amount(self, value):
-        amount = (value * (D(10) ** 15)).normalize()
-        diff = amount.adjusted() - 15
-        exp = -15 + diff
-        mantissa = abs(int(amount / D(10) ** diff))
-        if exp < self.MIN_EXP or mantissa < self.MIN_MANTISSA:
+        normalized = IssuedCurrencyValue.from_value(value).normalized()
+        if not normalized:
             return (False, 0, 0)
-        if exp > self.MAX_EXP or mantissa > self.MAX_MANTISSA:
-            raise ValueError('Amount out of range')
-        return amount.is_signed(), mantissa, exp
+        return bool(normalized.sign), normalized.mantissa, normalized.exponent
+
+    def encode_value(self, value) -> int:
+        """
+        Returns issued currency value encoded as 64-bit integer
+        """
+        if isinstance(value, str):
+            return _encode_value_string(value)
+        return _encode_issued_value(IssuedCurrencyValue.from_value(value))
 
-    def serialize(self, value):
+    def write(self, buffer, value):
         # XRP is passed as int, Issued Currency as dict
         if isinstance(value, int):
             amount = value
@@ -135,122 +206,147 @@ class AmountSerializer(BaseSerializer):
                 amount |= 0x4000000000000000
             else:
                 amount = -amount
-            return BasicTypeSerializer('>Q').serialize(amount)
+            UINT64.write(buffer, amount)
         elif isinstance(value, dict):
             # Issued Currency
-            amount = D(value.get('value'))
-            currency = value.get('code')
-            issuer = value.get('issuer')
-
-            serialized_amount = 0x8000000000000000
-            sign, mantissa, exp = self.scale_to_xrp_amount(amount)
-
-            # When mantissa == 0, it means we're rounding to 0
-            if mantissa != 0:
-                # set "Is positive" bit
-                if sign == 0:
-                    serialized_amount |= 0x4000000000000000
-
-                # next 8 bits are exponent
-                serialized_amount |= ((exp + 97) << 54)
-                # last 54 bits are mantissa
-                serialized_amount |= mantissa
-
-            return b''.join((
-                BasicTypeSerializer('>Q').serialize(serialized_amount),
-                CurrencySerializer().serialize(currency),
-                decode_address(issuer)
-            ))
-        raise ValueError('Unsupported type, expected dict or int')
+            UINT64.write(buffer, self.encode_value(value.get('value')))
+            CURRENCY.write(buffer, value.get('code'))
+            buffer += decode_address(value.get('issuer'))
+        else:
+            raise ValueError('Unsupported type, expected dict or int')
 
-    def deserialize(self, value):
+    def deserialize(self, value, offset=0):
         # 1st bit indicates if this is an Issued Currency
         # 2nd bit indicates if it's a positive value
-        is_issued_currency = value[0] & 0x80
-        is_positive = value[0] & 0x40
+        byte0 = value[offset]
+        is_issued_currency = byte0 & 0x80
+        is_positive = byte0 & 0x40
         if is_issued_currency:
-            exponent = ((value[0] & 0x3F) << 2) + ((value[1] & 0xff) >> 6) - 97
-            length, amount = BasicTypeSerializer('>Q').deserialize(value)
-            amount = (amount & 0x003FFFFFFFFFFFFF) * 10**exponent
+            exponent = (
+                ((byte0 & 0x3F) << 2) + ((value[offset + 1] & 0xff) >> 6) - 97
+            )
+            length, amount = UINT64.deserialize(value, offset)
+            mantissa = amount & 0x003FFFFFFFFFFFFF
+            amount = IssuedCurrencyValue(
+                mantissa,
+                exponent if mantissa else 0,
+                0 if is_positive or not mantissa else 1
+            )
 
             # Currency code is formatted in such a way, that first 12 bytes
             # are reserved and last 5 bytes are also reserved
-            _, currency_code = CurrencySerializer().deserialize(value[8:28])
+            _, currency_code = CURRENCY.deserialize(
+                value, offset + 8
+            )
             return 48, {
-                'issuer': encode_address(value[28:48]),
-                'value': amount if is_positive else -amount,
+                'issuer': encode_address(
+                    bytes(value[offset + 28:offset + 48])
+                ),
+                'value': amount,
                 'code': currency_code
             }
 
-        length, amount = BasicTypeSerializer('>Q').deserialize(value)
+        length, amount = UINT64.deserialize(value, offset)
         amount &= 0x3FFFFFFFFFFFFFFF
         return length, amount if is_positive else -amount
 
+    def skip(self, value, offset=0):
+        return 48 if value[offset] & 0x80 else 8
+
+
+def _encode_issued_value(value: IssuedCurrencyValue) -> int:
+    normalized = value.normalized()
+    serialized_amount = 0x8000000000000000
+
+    # zero has no exponent and mantissa bits set
+    if normalized:
+        # set "Is positive" bit
+        if normalized.sign == 0:
+            serialized_amount |= 0x4000000000000000
+
+        # next 8 bits are exponent
+        serialized_amount |= ((normalized.exponent + 97) << 54)
+        # last 54 bits are mantissa
+        serialized_amount |= normalized.mantissa
+    return serialized_amount
+
+
+@lru_cache(maxsize=4096)
+def _encode_value_string(value: str) -> int:
+    return _encode_issued_value(IssuedCurrencyValue.from_value(value))
+
 
 class ArraySerializer(BaseSerializer):
-    def serialize(self, value):
-        results = []
+    def write(self, buffer, value):
         for obj in value:
-            results.append(serialize(obj))
-            results.append(serialize({'ObjectEndMarker': {}}))
-        return b''.join((*results, b'\xf1'))
+            # array elements are wrapped in a single STObject field, which
+            # writes its own end marker
+            OBJECT.write(buffer, obj)
+        buffer.append(0xf1)
 
-    def deserialize(self, value):
+    def deserialize(self, value, offset=0):
         results = []
-        cursor = 0
+        cursor = offset
         while True:
             if value[cursor] == 0xf1:
                 cursor += 1
                 break
-            length, field = lookup_field(value[cursor:])
+            length, field = lookup_field(value, cursor)
+            cursor += length
+            length, field_value = read_field(field, value, cursor)
             cursor += length
-            values = {}
-            length, values[field.name] = decode(field.name, value[cursor:])
+            results.append({field.name: field_value})
+        return cursor - offset, results
+
+    def skip(self, value, offset=0):
+        cursor = offset
+        while value[cursor] != 0xf1:
+            length, field = lookup_field(value, cursor)
             cursor += length
-            results.append(values)
-        return cursor, results
+            cursor += skip_field(field, value, cursor)
+        return cursor + 1 - offset
 
 
 class HashSerializer(BaseSerializer):
     def __init__(self, length):
         self.length = length
 
-    def serialize(self, value):
+    def write(self, buffer, value):
         assert len(value) == self.length
-        return value
+        buffer += value
 
-    def deserialize(self, value):
-        return self.length, value[:self.length]
+    def deserialize(self, value, offset=0):
+        return self.length, bytes(value[offset:offset + self.length])
+
+    def skip(self, value, offset=0):
+        return self.length
 
 
 class PathSetSerializer(BaseSerializer):
-    def serialize(self, value):
-        ccy_serializer = CurrencySerializer()
-        results = []
-        for path in value:
-            path_data = []
+    def write(self, buffer, value):
+        for index, path in enumerate(value):
+            if index:
+                buffer.append(0xFF)
             for step in path:
                 type_byte = 0
-                data = []
-                if "account" in step.keys():
+                if "account" in step:
                     type_byte |= 0x01
-                    data.append(decode_address(step['account']))
-                if "currency" in step.keys():
+                if "currency" in step:
                     type_byte |= 0x10
-                    data.append(ccy_serializer.serialize(step['currency']))
-                if "issuer" in step.keys():
+                if "issuer" in step:
                     type_byte |= 0x20
-                    data.append(decode_address(step['issuer']))
-                path_data.append(b''.join((
-                    BasicTypeSerializer('>B').serialize(type_byte),
-                    *data
-                )))
-            results.append(b''.join(path_data))
-        return b''.join((b'\xFF'.join(results), b'\x00'))
-
-    def deserialize(self, value):
+                buffer.append(type_byte)
+                if type_byte & 0x01:
+                    buffer += decode_address(step['account'])
+                if type_byte & 0x10:
+                    CURRENCY.write(buffer, step['currency'])
+                if type_byte & 0x20:
+                    buffer += decode_address(step['issuer'])
+        buffer.append(0x00)
+
+    def deserialize(self, value, offset=0):
         results = []
-        cursor = 0
+        cursor = offset
         while True:
             if value[cursor] == 0x00:
                 cursor += 1
@@ -264,64 +360,182 @@ class PathSetSerializer(BaseSerializer):
                 step_type = value[cursor]
                 cursor += 1
                 if step_type & 0x01:
-                    step['account'] = encode_address(value[cursor:cursor + 20])
+                    step['account'] = encode_address(
+                        bytes(value[cursor:cursor + 20])
+                    )
                     cursor += 20
                 if step_type & 0x10:
-                    length, currency_code = CurrencySerializer().deserialize(
-                        value[cursor:]
+                    length, currency_code = CURRENCY.deserialize(
+                        value, cursor
                     )
                     step['currency'] = currency_code
                     cursor += length
                 if step_type & 0x20:
-                    step['issuer'] = encode_address(value[cursor:cursor + 20])
+                    step['issuer'] = encode_address(
+                        bytes(value[cursor:cursor + 20])
+                    )
                     cursor += 20
                 path.append(step)
             results.append(path)
-        return cursor, results
+        return cursor - offset, results
+
+    def skip(self, value, offset=0):
+        cursor = offset
+        while True:
+            step_type = value[cursor]
+            cursor += 1
+            if step_type == 0x00:
+                return cursor - offset
+            if step_type == 0xFF:
+                continue
+            cursor += (
+                (20 if step_type & 0x01 else 0)
+                + (20 if step_type & 0x10 else 0)
+                + (20 if step_type & 0x20 else 0)
+            )
 
 
 class ObjectSerializer(BaseSerializer):
     """
     To serialize an object to Ripple format, we need to follow these steps:
 
-    1. Convert each field data to binary format
-    2. Sort fields in "canonical order"
-    3. Prefix each field with a field ID.
-    4. Concatenate fields (with prefixes) in their sorted order
-    """
-
-    def serialize(self, value: Dict) -> bytes:
-        serialized = {
-            k: encode(k, v)
-            for k, v in value.items()
-        }
-        canonical_order = sorted(
-            serialized.keys(),
-            key=lambda k: (
-                RIPPLE_FIELDS[k].type_, RIPPLE_FIELDS[k].nth
-            )
-        )
-        return b''.join(serialized[k] for k in canonical_order)
+    1. Sort fields in "canonical order"
+    2. Write each field ID followed by field data in binary format
 
-    def deserialize(self, value: bytes) -> Tuple[int, Dict]:
-        cursor = 0
+    :param nested: append object end marker, as done for values of STObject
+                   fields (e.g. ``FinalFields`` in transaction metadata)
+    """
+
+    def __init__(self, nested: bool = False):
+        self.nested = nested
+
+    def write(self, buffer: bytearray, value: Dict) -> None:
+        for field in canonical_order(value):
+            codec = field.codec
+            if codec is None:
+                raise RippleSerializerUnsupportedTypeException(field.type_)
+            buffer += field.header
+            codec.write(buffer, value[field.name])
+        if self.nested:
+            buffer += OBJECT_END_MARKER.header
+
+    def deserialize(self, value: Buffer, offset: int = 0) -> Tuple[int, Dict]:
+        cursor = offset
+        end = len(value)
         values = {}
-        while cursor < len(value):
-            length, field = lookup_field(value[cursor:])
+        while cursor < end:
+            length, field = lookup_field(value, cursor)
             cursor += length
-            if field.name == 'ObjectEndMarker':
+            if field is OBJECT_END_MARKER:
                 break
-            length, values[field.name] = decode(field.name, value[cursor:])
+            length, values[field.name] = read_field(field, value, cursor)
+            cursor += length
+        return cursor - offset, values
+
+    def skip(self, value, offset=0):
+        cursor = offset
+        end = len(value)
+        while cursor < end:
+            length, field = lookup_field(value, cursor)
             cursor += length
-        return cursor, values
+            if field is OBJECT_END_MARKER:
+                break
+            cursor += skip_field(field, value, cursor)
+        return cursor - offset
+
+
+class HashVector(Sequence):
+    """
+    Read-only sequence of 256-bit hashes backed by a view of serialized
+    data, hashes are copied to ``bytes`` only when accessed.
+
+    Compares equal to lists and tuples of the same hashes.
+    """
+    __slots__ = ('view',)
+
+    def __init__(self, view: Buffer):
+        assert len(view) % 32 == 0, 'length must be a multiple of 32'
+        self.view = memoryview(view)
+
+    def __len__(self) -> int:
+        return len(self.view) // 32
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return HashVector(self.view[start * 32:max(start, stop) * 32])
+            return HashVector(b''.join(
+                self[i] for i in range(start, stop, step)
+            ))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('HashVector index out of range')
+        return bytes(self.view[index * 32:(index + 1) * 32])
+
+    def __eq__(self, other):
+        if isinstance(other, HashVector):
+            return self.view == other.view
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __reduce__(self):
+        # memoryviews can't be pickled, e.g. when passed between processes
+        return HashVector, (bytes(self.view),)
 
+    def __repr__(self) -> str:
+        return f'HashVector({[item.hex() for item in self]!r})'
+
+
+class Vector256Serializer(BaseSerializer):
+    """
+    Serializer for Vector256 type, a length-prefixed list of 256-bit hashes.
+
+    Deserialized values are :class:`HashVector` views, so vectors are not
+    copied, which matters for large ledger entries (e.g. ``Hashes`` of
+    ``LedgerHashes``).
+    """
+
+    def write(self, buffer: bytearray, value: Sequence) -> None:
+        if isinstance(value, HashVector):
+            BLOB.write(buffer, value.view)
+            return
+        if any(len(item) != 32 for item in value):
+            raise ValueError('Vector256 items must be 32 bytes long')
+        BLOB.write_length(buffer, len(value) * 32)
+        for item in value:
+            buffer += item
+
+    def deserialize(
+        self, value: Buffer, offset: int = 0
+    ) -> Tuple[int, HashVector]:
+        prefix_length, length = BLOB.decode_length(value, offset)
+        if length % 32:
+            raise ValueError('Vector256 length must be a multiple of 32')
+        start = offset + prefix_length
+        view = memoryview(value)[start:start + length]
+        return prefix_length + length, HashVector(view)
+
+    def skip(self, value: Buffer, offset: int = 0) -> int:
+        return BLOB.skip(value, offset)
+
+
+UINT8 = BasicTypeSerializer('>B')
+UINT64 = BasicTypeSerializer('>Q')
+BLOB = BlobSerializer()
+CURRENCY = CurrencySerializer()
+OBJECT = ObjectSerializer()
 
 TYPE_MAPPING = {
-    RippleType.UInt8: BasicTypeSerializer('>B'),
+    RippleType.UInt8: UINT8,
     RippleType.UInt16: BasicTypeSerializer('>H'),
     RippleType.UInt32: BasicTypeSerializer('>I'),
-    RippleType.UInt64: BasicTypeSerializer('>Q'),
-    RippleType.Blob: BlobSerializer(),
+    RippleType.UInt64: UINT64,
+    RippleType.Blob: BLOB,
     RippleType.AccountID: AccountIDSerializer(),
     RippleType.Amount: AmountSerializer(),
     RippleType.STArray: ArraySerializer(),
@@ -329,70 +543,253 @@ TYPE_MAPPING = {
     RippleType.Hash160: HashSerializer(20),
     RippleType.Hash256: HashSerializer(32),
     RippleType.PathSet: PathSetSerializer(),
-    RippleType.STObject: ObjectSerializer()
+    RippleType.STObject: ObjectSerializer(nested=True),
+    RippleType.Vector256: Vector256Serializer()
 }
 
 
-# TODO:
-# check if we need to support Metadata, Validation, LedgerEntry, Transaction
-# and Vector256 types
+for _field in RIPPLE_FIELDS.values():
+    if _field.is_serialized:
+        _field.codec = TYPE_MAPPING.get(_field.type_)
+
+OBJECT_END_MARKER = RIPPLE_FIELDS['ObjectEndMarker']
+SORT_KEY = attrgetter('sort_key')
+
+# Codecs compiled for transaction types, see aioxrpy.compiler
+COMPILED_CODECS = {}  # type: Dict[Any, Any]
+TRANSACTION_TYPE_HEADER = RIPPLE_FIELDS['TransactionType'].header[0]
+
+
+# Transaction, LedgerEntry, Validation and Metadata types are only used
+# as top-level types by rippled, they never appear as field values.
+# Transaction metadata and ledger entries are serialized as plain objects.
+
+
+def canonical_order(obj: Dict) -> List[RippleField]:
+    """Returns fields of the object sorted in canonical order"""
+    return sorted(map(RIPPLE_FIELDS.__getitem__, obj), key=SORT_KEY)
 
 
 def encode(key, value):
+    buffer = bytearray()
+    write_field(buffer, key, value)
+    return bytes(buffer)
+
+
+def write_field(buffer, key, value):
+    """Appends field ID followed by byte-encoded value to ``buffer``"""
     field = RIPPLE_FIELDS[key]
-    field_id = b''.join(
-        BasicTypeSerializer('>B').serialize(byte) for byte in field.field_id
-    )
+    codec = field.codec
+
+    # if type is not supported, raise an Exception
+    if codec is None:
+        raise RippleSerializerUnsupportedTypeException(field.type_)
 
-    if field.type_ in TYPE_MAPPING:
-        return b''.join((
-            field_id, TYPE_MAPPING.get(field.type_).serialize(value)
-        ))
+    buffer += field.header
+    codec.write(buffer, value)
+
+
+def decode(key, binary, offset=0):
+    return read_field(RIPPLE_FIELDS[key], binary, offset)
+
+
+def read_field(field: RippleField, binary, offset=0):
+    """
+    Returns a tuple containing length of field data and deserialized value
+    """
+    codec = field.codec
 
     # if type is not supported, raise an Exception
-    raise RippleSerializerUnsupportedTypeException(field.type_)
+    if codec is None:
+        raise RippleSerializerUnsupportedTypeException(field.type_)
 
+    return codec.deserialize(binary, offset)
 
-def decode(key, binary):
-    field = RIPPLE_FIELDS[key]
-    if field.type_ in TYPE_MAPPING:
-        return TYPE_MAPPING.get(field.type_).deserialize(binary)
+
+def skip_field(field: RippleField, binary, offset=0) -> int:
+    """Returns length of field data"""
+    codec = field.codec
 
     # if type is not supported, raise an Exception
-    raise RippleSerializerUnsupportedTypeException(field.type_)
+    if codec is None:
+        raise RippleSerializerUnsupportedTypeException(field.type_)
 
+    return codec.skip(binary, offset)
 
-def lookup_field(binary):
+
+def lookup_field(binary, offset=0):
+    """
+    Returns a tuple containing length of field ID at ``offset`` and the
+    field it identifies. Raises ``ValueError`` for unknown field IDs.
+    """
     # Reference: https://xrpl.org/serialization.html#field-ids
-    high = binary[0] >> 4
-    low = binary[0] % 16
+    byte0 = binary[offset]
+    high = byte0 >> 4
+    low = byte0 % 16
 
     if high:
         type_code = high
-        field_code = low if low else binary[1]
+        field_code = low if low else binary[offset + 1]
         length = 1 if low else 2
     else:
-        type_code = binary[1]
-        field_code = low if low else binary[2]
+        type_code = binary[offset + 1]
+        field_code = low if low else binary[offset + 2]
         length = 2 if low else 3
 
-    return length, RIPPLE_FIELDS_LOOKUP[type_code].get(field_code)
+    field = RIPPLE_FIELDS_TABLE[(type_code << 8) | field_code]
+    if field is None:
+        raise ValueError(f'Unknown field ID at offset {offset}')
+    return length, field
 
 
 def serialize(obj: Dict) -> bytes:
     """
     Serializes object to binary format.
     Shorthand for ``ObjectSerializer().serialize(obj)``
+
+    All fields are written into a single growable buffer. Transactions of
+    types registered with :func:`aioxrpy.compiler.register_codec` are
+    serialized by the compiled codec.
     """
-    return ObjectSerializer().serialize(obj)
+    if COMPILED_CODECS:
+        codec = COMPILED_CODECS.get(obj.get('TransactionType'))
+        if codec is not None:
+            return codec.serialize(obj)
+    return OBJECT.serialize(obj)
 
 
-def deserialize(binary: bytes) -> Dict:
+def serialize_with_offsets(
+    obj: Dict
+) -> Tuple[bytes, Dict[str, Tuple[int, int]]]:
+    """
+    Serializes object to binary format and returns it along with a mapping
+    of field names to ``(start, end)`` offsets of fields (including field
+    IDs) in serialized data.
+    """
+    buffer = bytearray()
+    offsets = {}
+    for field in canonical_order(obj):
+        start = len(buffer)
+        write_field(buffer, field.name, obj[field.name])
+        offsets[field.name] = start, len(buffer)
+    return bytes(buffer), offsets
+
+
+def insert_fields(
+    binary: bytes, offsets: Dict[str, Tuple[int, int]], obj: Dict
+) -> bytes:
+    """
+    Inserts fields of the object into data serialized with
+    :func:`serialize_with_offsets` at their canonical positions, without
+    serializing existing fields again.
+
+    Useful for adding signatures to an already serialized transaction.
+    """
+    starts = sorted(
+        (RIPPLE_FIELDS[name].sort_key, start)
+        for name, (start, _) in offsets.items()
+    )
+    buffer = bytearray()
+    cursor = 0
+    for field in canonical_order(obj):
+        if field.name in offsets:
+            raise ValueError(f'{field.name} is already serialized')
+        # new field goes before the first field following it
+        offset = next(
+            (start for key, start in starts if key > field.sort_key),
+            len(binary)
+        )
+        buffer += binary[cursor:offset]
+        write_field(buffer, field.name, obj[field.name])
+        cursor = offset
+    buffer += binary[cursor:]
+    return bytes(buffer)
+
+
+def deserialize(binary: Union[Buffer, str]) -> Dict:
     """
     Deserializes object from binary format.
     Shorthand for ``ObjectSerializer().deserialize(binary)``
+
+    The whole object is decoded from a single ``memoryview`` of ``binary``,
+    data is only copied when leaf values are built. ``Vector256`` values
+    are returned as :class:`HashVector` views of ``binary``, which must not
+    be modified afterwards.
     """
     if isinstance(binary, str):
         binary = unhexlify(binary)
-    _, obj = ObjectSerializer().deserialize(binary)
+    view = memoryview(binary)
+    if COMPILED_CODECS and len(view) > 2 and (
+        view[0] == TRANSACTION_TYPE_HEADER
+    ):
+        codec = COMPILED_CODECS.get((view[1] << 8) | view[2])
+        if codec is not None:
+            _, obj = codec.deserialize(view)
+            return obj
+    _, obj = OBJECT.deserialize(view)
     return obj
+
+
+class LazyRippleObject(Mapping):
+    """
+    Read-only mapping of deserialized object fields.
+
+    Serialized data is scanned once to find offsets of fields, field values
+    are deserialized on first access and memoized. Compares equal to the
+    dict returned by :func:`deserialize`.
+
+    :param binary: serialized object, must not be modified while the
+                   mapping is in use
+    """
+    __slots__ = ('_binary', '_fields', '_values')
+
+    def __init__(self, binary: Buffer):
+        self._binary = view = memoryview(binary)
+        self._fields = {}  # type: Dict[str, Tuple[RippleField, int]]
+        self._values = {}  # type: Dict[str, Any]
+
+        cursor = 0
+        end = len(view)
+        while cursor < end:
+            length, field = lookup_field(view, cursor)
+            cursor += length
+            if field is OBJECT_END_MARKER:
+                break
+            self._fields[field.name] = field, cursor
+            cursor += skip_field(field, view, cursor)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        field, offset = self._fields[key]
+        _, value = read_field(field, self._binary, offset)
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return f'LazyRippleObject({list(self._fields)!r})'
+
+    def to_dict(self) -> Dict:
+        """Returns dict with all fields deserialized"""
+        return dict(self.items())
+
+
+def deserialize_lazy(binary: Union[Buffer, str]) -> LazyRippleObject:
+    """
+    Deserializes object from binary format lazily, decoding only fields that
+    are accessed.
+    """
+    if isinstance(binary, str):
+        binary = unhexlify(binary)
+    return LazyRippleObject(binary)
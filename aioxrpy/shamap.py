@@ -0,0 +1,291 @@
+"""
+SHAMap, the radix-16 Merkle tree rippled uses to hash ledger contents.
+
+Items are keyed by 256-bit keys (transaction IDs or ledger entry IDs) and
+stored in leaves at the shallowest depth where the key prefix is unique.
+``transaction_hash`` of a ledger is the root hash of a map of transactions
+with metadata, ``account_hash`` is the root hash of a map of serialized
+ledger entries.
+
+Hashes of inner nodes are cached and only nodes on paths of changed items
+are hashed again, so updating a map costs time proportional to the number
+of changes rather than to the size of the map.
+"""
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterator, List, Optional, Tuple, Union
+
+from aioxrpy.definitions import (
+    RippleSHAMapHashPrefix, RippleTransactionHashPrefix
+)
+from aioxrpy.hash import first_half_of_sha512, transaction_id
+from aioxrpy.serializer import BLOB
+
+
+ZERO_HASH = b'\x00' * 32
+
+
+class SHAMapLeafType(Enum):
+    # transaction blob keyed by transaction ID, e.g. in proposed sets
+    TRANSACTION = 'transaction'
+    # transaction and metadata blobs, as in ledger transaction trees
+    TRANSACTION_WITH_META = 'transaction_with_meta'
+    # serialized ledger entry, as in ledger state trees
+    ACCOUNT_STATE = 'account_state'
+
+
+def leaf_hash(leaf_type: SHAMapLeafType, key: bytes, data: bytes) -> bytes:
+    """Returns hash of a leaf node"""
+    if leaf_type is SHAMapLeafType.TRANSACTION:
+        return first_half_of_sha512(
+            RippleTransactionHashPrefix.HASH_TX_ID, data
+        )
+    if leaf_type is SHAMapLeafType.TRANSACTION_WITH_META:
+        return first_half_of_sha512(RippleSHAMapHashPrefix.TX_NODE, data, key)
+    return first_half_of_sha512(RippleSHAMapHashPrefix.LEAF_NODE, data, key)
+
+
+def transaction_leaf(tx_blob: bytes, meta_blob: bytes) -> Tuple[bytes, bytes]:
+    """
+    Returns key and data of a transaction tree leaf for signed transaction
+    and its metadata
+    """
+    data = bytearray()
+    BLOB.write(data, tx_blob)
+    BLOB.write(data, meta_blob)
+    return transaction_id(tx_blob), bytes(data)
+
+
+def _nibble(key: bytes, depth: int) -> int:
+    byte = key[depth >> 1]
+    return byte & 0x0f if depth & 1 else byte >> 4
+
+
+class _Leaf:
+    __slots__ = ('key', 'data', 'hash')
+
+    def __init__(self, key: bytes, data: bytes, hash_: bytes):
+        self.key = key
+        self.data = data
+        self.hash = hash_
+
+
+class _Inner:
+    __slots__ = ('children', 'hash')
+
+    def __init__(self) -> None:
+        self.children = [None] * 16  # type: List[Optional[_Node]]
+        # None until computed, reset when a descendant changes
+        self.hash = None  # type: Optional[bytes]
+
+
+_Node = Union[_Leaf, _Inner]
+
+
+def _inner_hash(node: _Inner) -> bytes:
+    """Returns hash of inner node, hashing dirty descendants first"""
+    if node.hash is None:
+        hashes = []
+        for child in node.children:
+            if child is None:
+                hashes.append(ZERO_HASH)
+            elif isinstance(child, _Inner):
+                hashes.append(_inner_hash(child))
+            else:
+                hashes.append(child.hash)
+        if any(child is not None for child in node.children):
+            node.hash = first_half_of_sha512(
+                RippleSHAMapHashPrefix.INNER_NODE, *hashes
+            )
+        else:
+            # only the root of an empty map has no children
+            node.hash = ZERO_HASH
+    return node.hash
+
+
+def _child_hash(node: Optional[_Node]) -> bytes:
+    if node is None:
+        return ZERO_HASH
+    if isinstance(node, _Inner):
+        return _inner_hash(node)
+    return node.hash
+
+
+@dataclass
+class SHAMapProof:
+    """
+    Proof that an item is included in a map with given root hash
+
+    :param key: key of the item
+    :param data: data of the item
+    :param leaf_type: type of map leaves
+    :param branches: child hashes of inner nodes on the path to the item,
+                     starting at the root
+    """
+    key: bytes
+    data: bytes
+    leaf_type: SHAMapLeafType
+    branches: List[List[bytes]]
+
+    def verify(self, root_hash: bytes) -> bool:
+        """Checks whether the proof leads to ``root_hash``"""
+        node_hash = leaf_hash(self.leaf_type, self.key, self.data)
+        for depth in reversed(range(len(self.branches))):
+            hashes = self.branches[depth]
+            if len(hashes) != 16 or (
+                hashes[_nibble(self.key, depth)] != node_hash
+            ):
+                return False
+            node_hash = first_half_of_sha512(
+                RippleSHAMapHashPrefix.INNER_NODE, *hashes
+            )
+        return node_hash == root_hash
+
+
+class SHAMap(MutableMapping):
+    """
+    Mutable mapping of 256-bit keys to item data maintaining SHAMap hash.
+
+    :param leaf_type: type of leaves, which determines how they are hashed
+
+    Example:
+
+    .. code-block:: python
+
+        state = SHAMap(SHAMapLeafType.ACCOUNT_STATE)
+        for index, entry in entries:
+            state[index] = entry
+        assert state.hash == ledger_account_hash
+    """
+
+    def __init__(self, leaf_type: SHAMapLeafType):
+        self.leaf_type = leaf_type
+        self._root = _Inner()
+        self._length = 0
+
+    @property
+    def hash(self) -> bytes:
+        """Root hash, only hashes inner nodes changed since last access"""
+        return _inner_hash(self._root)
+
+    def add_transaction(self, tx_blob: bytes, meta_blob: bytes) -> bytes:
+        """
+        Adds transaction with metadata to a transaction tree and returns
+        its ID
+        """
+        assert self.leaf_type is SHAMapLeafType.TRANSACTION_WITH_META
+        key, data = transaction_leaf(tx_blob, meta_blob)
+        self[key] = data
+        return key
+
+    def _find(self, key: bytes) -> List[Tuple[_Inner, int]]:
+        """Returns path to the key as ``(inner node, branch)`` pairs"""
+        if len(key) != 32:
+            raise KeyError(key)
+        path = []
+        node = self._root
+        depth = 0
+        while True:
+            branch = _nibble(key, depth)
+            path.append((node, branch))
+            child = node.children[branch]
+            if not isinstance(child, _Inner):
+                return path
+            node = child
+            depth += 1
+
+    def _leaf(self, path: List[Tuple[_Inner, int]], key: bytes) -> _Leaf:
+        """Returns leaf the path ends at, raises ``KeyError`` if missing"""
+        node, branch = path[-1]
+        leaf = node.children[branch]
+        if not isinstance(leaf, _Leaf) or leaf.key != key:
+            raise KeyError(key)
+        return leaf
+
+    def __getitem__(self, key: bytes) -> bytes:
+        return self._leaf(self._find(key), key).data
+
+    def __setitem__(self, key: bytes, data: bytes) -> None:
+        path = self._find(key)
+        for inner, _ in path:
+            inner.hash = None
+        node, branch = path[-1]
+        leaf = _Leaf(key, data, leaf_hash(self.leaf_type, key, data))
+        existing = node.children[branch]
+        if existing is None:
+            node.children[branch] = leaf
+            self._length += 1
+            return
+        assert isinstance(existing, _Leaf)
+        if existing.key == key:
+            node.children[branch] = leaf
+            return
+
+        # push the existing leaf down until keys diverge
+        depth = len(path)
+        while True:
+            inner = _Inner()
+            node.children[branch] = inner
+            node = inner
+            branch = _nibble(key, depth)
+            existing_branch = _nibble(existing.key, depth)
+            if branch != existing_branch:
+                break
+            depth += 1
+        node.children[branch] = leaf
+        node.children[existing_branch] = existing
+        self._length += 1
+
+    def __delitem__(self, key: bytes) -> None:
+        path = self._find(key)
+        self._leaf(path, key)
+        node, branch = path[-1]
+        node.children[branch] = None
+        self._length -= 1
+        for inner, _ in path:
+            inner.hash = None
+
+        # inner nodes left with a single leaf (or nothing) are collapsed,
+        # keeping the tree identical to one built without the key
+        for depth in range(len(path) - 1, 0, -1):
+            node = path[depth][0]
+            children = [child for child in node.children if child is not None]
+            if len(children) > 1 or (
+                children and isinstance(children[0], _Inner)
+            ):
+                break
+            parent, branch = path[depth - 1]
+            parent.children[branch] = children[0] if children else None
+
+    def __iter__(self) -> Iterator[bytes]:
+        # branches are visited in order, so keys are yielded sorted
+        stack = [self._root]  # type: List[_Node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _Leaf):
+                yield node.key
+            else:
+                stack.extend(
+                    child for child in reversed(node.children)
+                    if child is not None
+                )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def proof(self, key: bytes) -> SHAMapProof:
+        """
+        Returns inclusion proof of the item, raises ``KeyError`` if the key
+        is not in the map
+        """
+        path = self._find(key)
+        return SHAMapProof(
+            key=key,
+            data=self._leaf(path, key).data,
+            leaf_type=self.leaf_type,
+            branches=[
+                [_child_hash(child) for child in inner.children]
+                for inner, _ in path
+            ]
+        )
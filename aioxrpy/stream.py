@@ -0,0 +1,181 @@
+"""
+Streaming deserializer for serialized transactions and ledger entries
+stored back to back.
+
+Objects don't carry their length, so each object must start with its
+``TransactionType`` or ``LedgerEntryType`` field, which sort before all
+other fields in canonical order and appear only once per object. An object
+ends where the next one starts (or where the stream ends), so it's complete
+once the first field ID of the next one has been read.
+"""
+import asyncio
+import struct
+from typing import (
+    AsyncIterator, BinaryIO, Iterator, List, Mapping, Optional
+)
+
+from aioxrpy import serializer
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_OBJECT_SIZE = 4 * 1024 * 1024
+# fields every object in the stream starts with
+LEADING_FIELDS = frozenset(('TransactionType', 'LedgerEntryType'))
+
+
+class BlobDecoder:
+    """
+    Splits a stream of concatenated serialized objects into separate blobs.
+    Raises ``ValueError`` if an object doesn't start with ``TransactionType``
+    or ``LedgerEntryType`` field.
+
+    Data is passed with :meth:`feed`, which returns blobs completed so far.
+    At most one incomplete object (and one chunk) is buffered at a time.
+
+    :param max_object_size: maximum length of a single object, exceeding it
+                            raises ``ValueError``
+    """
+
+    def __init__(self, max_object_size: int = DEFAULT_MAX_OBJECT_SIZE):
+        self.max_object_size = max_object_size
+        self._buffer = bytearray()
+        # offset the current object starts at
+        self._start = 0
+        # offset the current object is known to extend to
+        self._cursor = 0
+
+    def _scan(self, final: bool) -> Optional[int]:
+        """
+        Returns end offset of the current object or ``None`` if more data
+        is needed to tell
+        """
+        buffer = self._buffer
+        end = len(buffer)
+        while self._cursor < end:
+            try:
+                length, field = serializer.lookup_field(buffer, self._cursor)
+                if self._cursor == self._start:
+                    if field.name not in LEADING_FIELDS:
+                        raise ValueError(
+                            'Objects must start with TransactionType or '
+                            'LedgerEntryType field'
+                        )
+                elif field.name in LEADING_FIELDS:
+                    # this is the next object
+                    return self._cursor
+                cursor = self._cursor + length
+                cursor += serializer.skip_field(field, buffer, cursor)
+            except (IndexError, struct.error):
+                cursor = end + 1
+            if cursor > end:
+                if final:
+                    raise ValueError('Stream ends with a truncated object')
+                return None
+            self._cursor = cursor
+        if final and self._cursor > self._start:
+            return self._cursor
+        return None
+
+    def _take(self, final: bool = False) -> List[bytes]:
+        blobs = []
+        while True:
+            end = self._scan(final)
+            if end is None:
+                break
+            blobs.append(bytes(self._buffer[self._start:end]))
+            self._start = end
+        # drop consumed data once, rather than after every blob
+        del self._buffer[:self._start]
+        self._cursor -= self._start
+        self._start = 0
+        if self._cursor > self.max_object_size:
+            raise ValueError(
+                f'Object exceeds max_object_size ({self.max_object_size})'
+            )
+        return blobs
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Adds data to the buffer and returns completed blobs"""
+        self._buffer += data
+        return self._take()
+
+    def close(self) -> List[bytes]:
+        """
+        Returns remaining blobs once the stream has ended. Raises
+        ``ValueError`` if the stream ends in the middle of an object.
+        """
+        return self._take(final=True)
+
+
+def iter_blobs(
+    fileobj: BinaryIO,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_object_size: int = DEFAULT_MAX_OBJECT_SIZE
+) -> Iterator[bytes]:
+    """
+    Reads concatenated serialized objects from a binary file object and
+    yields them as separate blobs
+    """
+    decoder = BlobDecoder(max_object_size)
+    while True:
+        data = fileobj.read(chunk_size)
+        if not data:
+            break
+        yield from decoder.feed(data)
+    yield from decoder.close()
+
+
+def iter_objects(
+    fileobj: BinaryIO, *, lazy: bool = False, **kwargs
+) -> Iterator[Mapping]:
+    """
+    Reads concatenated serialized objects from a binary file object and
+    yields them deserialized.
+
+    :param lazy: yield :class:`aioxrpy.serializer.LazyRippleObject` instead
+                 of dicts
+    """
+    deserialize = (
+        serializer.deserialize_lazy if lazy else serializer.deserialize
+    )
+    for blob in iter_blobs(fileobj, **kwargs):
+        yield deserialize(blob)
+
+
+async def aiter_blobs(
+    reader: asyncio.StreamReader,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_object_size: int = DEFAULT_MAX_OBJECT_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Reads concatenated serialized objects from ``asyncio.StreamReader`` and
+    yields them as separate blobs
+    """
+    decoder = BlobDecoder(max_object_size)
+    while True:
+        data = await reader.read(chunk_size)
+        if not data:
+            break
+        for blob in decoder.feed(data):
+            yield blob
+    for blob in decoder.close():
+        yield blob
+
+
+async def aiter_objects(
+    reader: asyncio.StreamReader, *, lazy: bool = False, **kwargs
+) -> AsyncIterator[Mapping]:
+    """
+    Reads concatenated serialized objects from ``asyncio.StreamReader`` and
+    yields them deserialized.
+
+    :param lazy: yield :class:`aioxrpy.serializer.LazyRippleObject` instead
+                 of dicts
+    """
+    deserialize = (
+        serializer.deserialize_lazy if lazy else serializer.deserialize
+    )
+    async for blob in aiter_blobs(reader, **kwargs):
+        yield deserialize(blob)
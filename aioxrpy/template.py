@@ -0,0 +1,94 @@
+"""
+Transaction templates for sending many similar transactions.
+
+Invariant fields are serialized once, variable fields are patched in place
+in the serialized template, so producing a signing payload doesn't require
+serializing the whole transaction again.
+"""
+from typing import Dict, Iterable, Tuple
+
+from aioxrpy import serializer
+from aioxrpy.definitions import RippleType, RIPPLE_FIELDS
+from aioxrpy.keys import RippleKey
+
+
+# Types that are always serialized to the same number of bytes. Amounts
+# are fixed-width as long as they stay either XRP or issued currency.
+FIXED_WIDTH_TYPES = frozenset((
+    RippleType.UInt8, RippleType.UInt16, RippleType.UInt32,
+    RippleType.UInt64, RippleType.Hash128, RippleType.Hash160,
+    RippleType.Hash256, RippleType.AccountID, RippleType.Amount
+))
+
+DEFAULT_SLOTS = (
+    'Sequence', 'Amount', 'Destination', 'DestinationTag', 'Fee'
+)
+
+
+class TransactionTemplate:
+    """
+    Serialized transaction with patchable slots
+
+    :param tx: transaction, must contain all slot fields (values are used
+               as placeholders)
+    :param slots: names of fixed-width fields that can be patched
+
+    Example:
+
+    .. code-block:: python
+
+        template = TransactionTemplate(payment)
+        blob = template.sign(key, Sequence=2, Amount=1000)
+    """
+
+    def __init__(self, tx: Dict, slots: Iterable[str] = DEFAULT_SLOTS):
+        assert 'TxnSignature' not in tx, 'Pass an unsigned transaction'
+        self.binary, self.offsets = serializer.serialize_with_offsets(tx)
+
+        self.slots = {}  # type: Dict[str, Tuple[int, int]]
+        for name in slots:
+            field = RIPPLE_FIELDS[name]
+            if field.type_ not in FIXED_WIDTH_TYPES:
+                raise ValueError(f'{name} is not a fixed-width field')
+            if name not in self.offsets:
+                raise ValueError(f'{name} is missing in the transaction')
+            start, end = self.offsets[name]
+            self.slots[name] = start + len(field.header), end
+
+    def render(self, **values) -> bytes:
+        """
+        Returns serialized transaction with slots replaced by passed values,
+        which can be used as a signing payload
+        """
+        buffer = bytearray(self.binary)
+        for name, value in values.items():
+            if name not in self.slots:
+                raise ValueError(f'{name} is not a slot')
+            start, end = self.slots[name]
+            codec = RIPPLE_FIELDS[name].codec
+            encoded = codec.serialize(value)
+            if len(encoded) != end - start:
+                raise ValueError(
+                    f'{name} value has different width than the template'
+                )
+            buffer[start:end] = encoded
+        return bytes(buffer)
+
+    def blob(self, payload: bytes, signature: bytes) -> bytes:
+        """
+        Returns signed transaction blob, inserting ``TxnSignature`` into
+        rendered payload at its canonical position
+        """
+        # patching slots doesn't move any fields, so template offsets
+        # are valid for rendered payloads
+        return serializer.insert_fields(
+            payload, self.offsets, {'TxnSignature': signature}
+        )
+
+    def sign(self, key: RippleKey, **values) -> bytes:
+        """
+        Renders the template, signs it with the key and returns signed
+        transaction blob
+        """
+        payload = self.render(**values)
+        return self.blob(payload, key.sign_tx(payload))
@@ -0,0 +1,37 @@
+"""
+Measures issued currency Amount encoding and decoding throughput.
+
+Usage: ``python -m benchmarks.amount``
+"""
+import timeit
+
+from aioxrpy.serializer import AmountSerializer
+
+
+ISSUER = 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'
+
+
+def main(number: int = 100000):
+    serializer = AmountSerializer()
+    values = ['1.2345', '0.000001', '-987654.321', '100']
+    encoded = [
+        serializer.serialize({'value': v, 'code': 'USD', 'issuer': ISSUER})
+        for v in values
+    ]
+
+    def encode():
+        for value in values:
+            serializer.encode_value(value)
+
+    def decode():
+        for binary in encoded:
+            serializer.deserialize(binary)
+
+    print(f'{"operation":>10} {"values/s":>10}')
+    for name, func in (('encode', encode), ('decode', decode)):
+        elapsed = timeit.timeit(func, number=number // len(values))
+        print(f'{name:>10} {number / elapsed:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
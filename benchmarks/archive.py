@@ -0,0 +1,85 @@
+"""
+Measures appending to an archive and random lookups of blobs by hash and
+account, compared with reading a JSON file of hex blobs.
+
+Usage: ``python -m benchmarks.archive``
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+from aioxrpy import serializer
+from aioxrpy.archive import Archive, ArchiveWriter
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.hash import transaction_id
+
+
+ACCOUNTS = [
+    'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+    'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+    'rGWrZyQqhTp9Xu7G5Pkayo7bXjH4k4QYpf'
+]
+
+
+def main(size: int = 100000, lookups: int = 10000):
+    blobs = [
+        serializer.serialize({
+            'TransactionType': RippleTransactionType.Payment,
+            'Account': ACCOUNTS[i % 2],
+            'Destination': ACCOUNTS[2],
+            'Amount': 1000000 + i,
+            'Sequence': i,
+            'Fee': 10
+        })
+        for i in range(size)
+    ]
+    hashes = [transaction_id(blob) for blob in blobs]
+    sample = random.Random(0).sample(hashes, lookups)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'transactions.bin')
+        start = time.perf_counter()
+        with ArchiveWriter(path) as writer:
+            for number, (blob, tx_hash) in enumerate(zip(blobs, hashes)):
+                writer.append(blob, number // 100, tx_hash)
+        elapsed = time.perf_counter() - start
+        print(f'append {size} blobs: {elapsed * 1000:.0f} ms')
+
+        json_path = os.path.join(directory, 'transactions.json')
+        with open(json_path, 'w') as fileobj:
+            json.dump(
+                {h.hex(): b.hex() for h, b in zip(hashes, blobs)}, fileobj
+            )
+
+        start = time.perf_counter()
+        with open(json_path) as fileobj:
+            stored = json.load(fileobj)
+        for tx_hash in sample:
+            serializer.deserialize(stored[tx_hash.hex()])
+        elapsed = time.perf_counter() - start
+        print(f'json: load and {lookups} lookups: {elapsed * 1000:.0f} ms')
+
+        start = time.perf_counter()
+        with Archive(path) as archive:
+            for tx_hash in sample:
+                serializer.deserialize(archive.get(tx_hash))
+            elapsed = time.perf_counter() - start
+            print(
+                f'archive: open and {lookups} lookups: '
+                f'{elapsed * 1000:.0f} ms'
+            )
+
+            start = time.perf_counter()
+            blobs = archive.by_account(ACCOUNTS[0])
+            elapsed = time.perf_counter() - start
+            print(
+                f'archive: {len(blobs)} blobs of an account: '
+                f'{elapsed * 1000:.0f} ms'
+            )
+            del blobs
+
+
+if __name__ == '__main__':
+    main()
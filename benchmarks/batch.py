@@ -0,0 +1,38 @@
+"""
+Measures ``batch.serialize_many`` and ``batch.deserialize_many`` throughput
+against the number of worker processes.
+
+Usage: ``python -m benchmarks.batch [count]``
+"""
+import os
+import sys
+import time
+
+from aioxrpy import batch
+from benchmarks.serialize import TRANSACTIONS
+
+
+def measure(func, items, **kwargs):
+    start = time.perf_counter()
+    for _ in func(items, **kwargs):
+        pass
+    return len(items) / (time.perf_counter() - start)
+
+
+def main(count: int = 100000):
+    objects = list(TRANSACTIONS.values()) * (count // len(TRANSACTIONS))
+    blobs = list(batch.serialize_many(objects))
+
+    print(f'{"workers":>8} {"serialize/s":>12} {"deserialize/s":>14}')
+    for workers in range(0, (os.cpu_count() or 1) + 1):
+        serialized = measure(
+            batch.serialize_many, objects, max_workers=workers
+        )
+        deserialized = measure(
+            batch.deserialize_many, blobs, max_workers=workers
+        )
+        print(f'{workers:>8} {serialized:>12.0f} {deserialized:>14.0f}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
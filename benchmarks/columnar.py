@@ -0,0 +1,44 @@
+"""
+Compares extracting a table of transaction fields into NumPy arrays with
+deserializing transactions into dicts and building rows in Python.
+
+Usage: ``python -m benchmarks.columnar``
+"""
+import time
+
+from aioxrpy import serializer
+from aioxrpy.columnar import extract_columns
+
+from benchmarks.serialize import TRANSACTIONS
+
+
+FIELDS = ['Account', 'Destination', 'Amount', 'Fee', 'Sequence', 'Flags']
+
+
+def rows(blobs):
+    table = []
+    for blob in blobs:
+        tx = serializer.deserialize(blob)
+        table.append(tuple(tx.get(name) for name in FIELDS))
+    return table
+
+
+def main(number: int = 100000):
+    blobs = [
+        serializer.serialize({**tx, 'Sequence': sequence})
+        for sequence in range(number // len(TRANSACTIONS))
+        for tx in TRANSACTIONS.values()
+    ]
+    print(f'{"method":>10} {"tx/s":>10}')
+    for name, func in (
+        ('dicts', rows),
+        ('columnar', lambda blobs: extract_columns(blobs, FIELDS))
+    ):
+        start = time.perf_counter()
+        func(blobs)
+        elapsed = time.perf_counter() - start
+        print(f'{name:>10} {len(blobs) / elapsed:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Compares throughput of crypto backends of both key types signing,
+verifying and deriving public keys. secp256k1 backends sign 32-byte
+digests, Ed25519 backends sign whole messages of a typical transaction size.
+
+Usage: ``python -m benchmarks.crypto``
+"""
+import hashlib
+import time
+
+from aioxrpy import crypto
+
+
+def rate(func, number):
+    start = time.perf_counter()
+    for index in range(number):
+        func(index)
+    return number / (time.perf_counter() - start)
+
+
+def main(number: int = 500):
+    secrets = [
+        hashlib.sha256(bytes([index % 256, index // 256])).digest()
+        for index in range(number)
+    ]
+    data = {
+        crypto.KeyType.SECP256K1: [
+            hashlib.sha512(secret).digest()[:32] for secret in secrets
+        ],
+        crypto.KeyType.ED25519: [
+            hashlib.sha512(secret).digest() * 3 for secret in secrets
+        ],
+    }
+
+    print(
+        f'{"key type":>10} {"backend":>13} '
+        f'{"sign/s":>10} {"verify/s":>10} {"derive/s":>10}'
+    )
+    for key_type, messages in data.items():
+        for name in crypto.available_backends(key_type):
+            backend = crypto.get_backend(name, key_type)
+            private_key = backend.load_private_key(secrets[0])
+            public_key = backend.get_public_key(private_key)
+            signatures = [
+                backend.sign(private_key, message) for message in messages
+            ]
+
+            signs = rate(
+                lambda i: backend.sign(private_key, messages[i]), number
+            )
+            verifies = rate(
+                lambda i: backend.verify(
+                    public_key, messages[i], signatures[i]
+                ),
+                number
+            )
+            derives = rate(
+                lambda i: backend.derive_public_key(secrets[i]), number
+            )
+            print(
+                f'{key_type.value:>10} {name:>13} '
+                f'{signs:>10.0f} {verifies:>10.0f} {derives:>10.0f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Measures ``serializer.deserialize`` throughput for growing blobs.
+
+Time spent per byte should stay roughly constant as the blob grows, as the
+deserializer walks a single buffer instead of slicing it for every field.
+
+Usage: ``python -m benchmarks.deserialize``
+"""
+import timeit
+
+from aioxrpy import serializer
+from aioxrpy.definitions import RippleTransactionType
+
+
+def make_blob(memos: int) -> bytes:
+    return serializer.serialize({
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000,
+        'Fee': 10,
+        'Sequence': 1,
+        'Memos': [
+            {
+                'Memo': {
+                    'MemoType': b'text/plain',
+                    'MemoData': b'memo %d' % i
+                }
+            }
+            for i in range(memos)
+        ]
+    })
+
+
+def main():
+    print(f'{"memos":>8} {"bytes":>10} {"ms":>10} {"ns/byte":>10}')
+    for memos in (10, 100, 1000, 10000):
+        blob = make_blob(memos)
+        number = max(1, 10000 // memos)
+        elapsed = timeit.timeit(
+            lambda: serializer.deserialize(blob), number=number
+        ) / number
+        print(
+            f'{memos:>8} {len(blob):>10} {elapsed * 1e3:>10.3f} '
+            f'{elapsed * 1e9 / len(blob):>10.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Compares batch drops/XRP conversions with the scalar functions.
+
+Usage: ``python -m benchmarks.drops``
+"""
+from decimal import Decimal
+import random
+import time
+
+from aioxrpy import decimals
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(number: int = 200000):
+    rng = random.Random(0)
+    drops = [rng.randint(0, 10**15) for _ in range(number)]
+    amounts = [Decimal(value) / 1000000 for value in drops]
+
+    results = [
+        ('xrp_to_drops', timed(
+            lambda: [decimals.xrp_to_drops(a) for a in amounts]
+        )),
+        ('xrp_to_drops_many', timed(decimals.xrp_to_drops_many, amounts)),
+        ('drops_to_xrp', timed(
+            lambda: [str(decimals.drops_to_xrp(d)) for d in drops]
+        )),
+        ('drops_to_xrp_strings', timed(
+            decimals.drops_to_xrp_strings, drops
+        )),
+    ]
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        array = numpy.array(drops, dtype=numpy.int64)
+        results.append((
+            'drops_to_xrp_strings (numpy)',
+            timed(decimals.drops_to_xrp_strings, array)
+        ))
+
+    print(f'{"function":>30} {"values/s":>12}')
+    for name, elapsed in results:
+        print(f'{name:>30} {number / elapsed:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""
+Measures transaction ID hashing throughput, in the current thread and in
+a thread pool.
+
+Usage: ``python -m benchmarks.hash``
+"""
+import time
+
+from aioxrpy import serializer
+from aioxrpy.hash import transaction_ids
+
+from benchmarks.serialize import TRANSACTIONS
+
+
+def main(number: int = 100000):
+    print(f'{"blob size":>10} {"workers":>8} {"tx/s":>10}')
+    for padding in (0, 4096):
+        # large blobs are padded with a memo, as multisigned transactions
+        tx = {**TRANSACTIONS['Payment'], 'MemoData': b'\x00' * padding}
+        blobs = [
+            serializer.serialize({**tx, 'Sequence': sequence})
+            for sequence in range(number // 10)
+        ]
+        for max_workers in (0, 4):
+            start = time.perf_counter()
+            for _ in range(10):
+                transaction_ids(blobs, max_workers=max_workers)
+            elapsed = time.perf_counter() - start
+            print(
+                f'{len(blobs[0]):>10} {max_workers:>8} '
+                f'{number / elapsed:>10.0f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Compares deriving keys from seeds one ``RippleKey`` at a time with
+``batch.derive_keys_many``, in the current process and in a process pool.
+
+Usage: ``python -m benchmarks.keygen``
+"""
+import os
+import time
+
+from aioxrpy import batch
+from aioxrpy.crypto import available_backends
+from aioxrpy.keys import generate_seed, RippleKey
+
+
+def main(number: int = 2000):
+    workers = os.cpu_count() or 1
+    seeds = [generate_seed() for _ in range(number)]
+    print(f'{"backend":>10} {"method":>28} {"keys/s":>8}')
+    for backend in available_backends():
+        for name, func in (
+            ('RippleKey', lambda: [
+                (key.to_public(), key.to_account()) for key in (
+                    RippleKey(private_key=seed, backend=backend)
+                    for seed in seeds
+                )
+            ]),
+            ('derive_keys_many', lambda: list(
+                batch.derive_keys_many(seeds, backend=backend)
+            )),
+            (f'derive_keys_many ({workers} proc)', lambda: list(
+                batch.derive_keys_many(
+                    seeds, backend=backend, chunk_size=200,
+                    max_workers=workers
+                )
+            )),
+        ):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            print(f'{backend:>10} {name:>28} {number / elapsed:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
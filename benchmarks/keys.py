@@ -0,0 +1,49 @@
+"""
+Measures repeated access to derived key values and ordering signers of
+multi-signed transactions, for a pool of keys kept in a ``KeyRing``.
+
+Usage: ``python -m benchmarks.keys``
+"""
+from operator import attrgetter
+import time
+
+from aioxrpy import address
+from aioxrpy.keys import KeyRing, RippleKey
+
+
+def timed(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+def main(size: int = 2000, signers: int = 8, number: int = 200):
+    keys = [RippleKey() for _ in range(size)]
+    ring = KeyRing(keys)
+    accounts = [key.to_account() for key in keys[:signers]]
+
+    # the first call computes values, the rest is cached
+    elapsed = timed(lambda: [key.to_account() for key in keys], number)
+    print(f'to_account of {size} keys: {elapsed * 1000:.2f} ms')
+
+    elapsed = timed(lambda: sorted(
+        keys[:signers],
+        key=lambda key: address.decode_address(key.to_account())
+    ), number)
+    print(f'sort {signers} signers by address: {elapsed * 1e6:.1f} us')
+
+    elapsed = timed(lambda: sorted(
+        keys[:signers], key=attrgetter('account_id')
+    ), number)
+    print(f'sort {signers} signers by account ID: {elapsed * 1e6:.1f} us')
+
+    elapsed = timed(lambda: ring.signers(accounts), number)
+    print(f'KeyRing.signers of {signers} accounts: {elapsed * 1e6:.1f} us')
+
+    elapsed = timed(lambda: ring.signers(), number)
+    print(f'KeyRing.signers of {size} keys: {elapsed * 1e6:.1f} us')
+
+
+if __name__ == '__main__':
+    main()
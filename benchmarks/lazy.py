@@ -0,0 +1,37 @@
+"""
+Compares filtering transaction blobs by a few fields using eager
+``deserialize`` and ``deserialize_lazy``.
+
+Usage: ``python -m benchmarks.lazy``
+"""
+import timeit
+
+from aioxrpy import serializer
+from benchmarks.serialize import TRANSACTIONS
+
+
+def main(number: int = 20000):
+    blobs = [
+        serializer.serialize({
+            **tx,
+            'Memos': [{'Memo': {'MemoData': b'x' * 64}}] * 4
+        })
+        for tx in TRANSACTIONS.values()
+    ]
+
+    def scan(deserialize):
+        for blob in blobs:
+            obj = deserialize(blob)
+            obj.get('Account'), obj.get('Destination'), obj.get('Amount')
+
+    print(f'{"method":>10} {"blobs/s":>10}')
+    for name, func in (
+        ('eager', serializer.deserialize),
+        ('lazy', serializer.deserialize_lazy)
+    ):
+        elapsed = timeit.timeit(lambda: scan(func), number=number)
+        print(f'{name:>10} {number * len(blobs) / elapsed:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
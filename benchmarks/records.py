@@ -0,0 +1,52 @@
+"""
+Compares memory used by deserialized transactions held as dicts and as
+records, along with deserialization throughput.
+
+Usage: ``python -m benchmarks.records``
+"""
+import gc
+import time
+import tracemalloc
+
+from aioxrpy import serializer
+from aioxrpy.records import deserialize_record
+
+from benchmarks.serialize import TRANSACTIONS
+
+
+def measure(deserialize, blobs):
+    start = time.perf_counter()
+    for blob in blobs:
+        deserialize(blob)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    objects = [deserialize(blob) for blob in blobs]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size, elapsed
+
+
+def main(number: int = 100000):
+    # distinct sequences, so that values are not shared between objects
+    blobs = [
+        serializer.serialize({**tx, 'Sequence': sequence})
+        for sequence in range(number // len(TRANSACTIONS))
+        for tx in TRANSACTIONS.values()
+    ]
+    print(f'{"output":>8} {"bytes/tx":>10} {"tx/s":>10}')
+    for name, deserialize in (
+        ('dict', serializer.deserialize),
+        ('record', deserialize_record)
+    ):
+        size, elapsed = measure(deserialize, blobs)
+        print(
+            f'{name:>8} {size / len(blobs):>10.0f} '
+            f'{len(blobs) / elapsed:>10.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
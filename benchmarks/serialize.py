@@ -0,0 +1,82 @@
+"""
+Measures ``serializer.serialize`` throughput for common transaction shapes.
+
+Usage: ``python -m benchmarks.serialize``
+"""
+import timeit
+
+from aioxrpy import compiler, serializer
+from aioxrpy.definitions import RippleTransactionType
+
+
+ACCOUNT = 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi'
+ISSUER = 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'
+
+TRANSACTIONS = {
+    'Payment': {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': ACCOUNT,
+        'Destination': ISSUER,
+        'DestinationTag': 12345,
+        'Amount': 1000000,
+        'Fee': 10,
+        'Flags': 0x80000000,
+        'Sequence': 1,
+        'SigningPubKey': bytes(33)
+    },
+    'OfferCreate': {
+        'TransactionType': RippleTransactionType.OfferCreate,
+        'Account': ACCOUNT,
+        'TakerGets': 1000000,
+        'TakerPays': {'value': '1.2345', 'code': 'USD', 'issuer': ISSUER},
+        'Fee': 10,
+        'Flags': 0,
+        'Sequence': 1,
+        'SigningPubKey': bytes(33)
+    },
+    'TrustSet': {
+        'TransactionType': RippleTransactionType.TrustSet,
+        'Account': ACCOUNT,
+        'LimitAmount': {'value': '100', 'code': 'USD', 'issuer': ISSUER},
+        'Fee': 10,
+        'Flags': 0,
+        'Sequence': 1,
+        'SigningPubKey': bytes(33)
+    },
+    'EscrowFinish': {
+        'TransactionType': RippleTransactionType.EscrowFinish,
+        'Account': ACCOUNT,
+        'Owner': ISSUER,
+        'OfferSequence': 7,
+        'Fee': 10,
+        'Flags': 0,
+        'Sequence': 1,
+        'SigningPubKey': bytes(33)
+    }
+}
+
+
+def measure(func, number):
+    return number / timeit.timeit(func, number=number)
+
+
+def main(number: int = 20000):
+    print(
+        f'{"transaction":>14} {"tx/s":>10} {"compiled":>10} '
+        f'{"decode":>10} {"compiled":>10}'
+    )
+    generic = serializer.ObjectSerializer()
+    for name, tx in TRANSACTIONS.items():
+        codec = compiler.compile_codec(tx['TransactionType'])
+        blob = generic.serialize(tx)
+        print(
+            f'{name:>14} '
+            f'{measure(lambda: generic.serialize(tx), number):>10.0f} '
+            f'{measure(lambda: codec.serialize(tx), number):>10.0f} '
+            f'{measure(lambda: generic.deserialize(blob), number):>10.0f} '
+            f'{measure(lambda: codec.deserialize(blob), number):>10.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""
+Measures SHAMap build time and cost of re-hashing after a batch of updates,
+as when verifying state after a ledger close.
+
+Usage: ``python -m benchmarks.shamap``
+"""
+import os
+import time
+
+from aioxrpy.shamap import SHAMap, SHAMapLeafType
+
+
+def main(size: int = 100000, changes: int = 100):
+    items = {os.urandom(32): os.urandom(100) for _ in range(size)}
+    tree = SHAMap(SHAMapLeafType.ACCOUNT_STATE)
+
+    start = time.perf_counter()
+    for key, data in items.items():
+        tree[key] = data
+    tree.hash
+    elapsed = time.perf_counter() - start
+    print(f'build {size} items: {elapsed * 1000:.0f} ms')
+
+    keys = list(items)[:changes]
+    start = time.perf_counter()
+    for key in keys:
+        tree[key] = os.urandom(100)
+    tree.hash
+    elapsed = time.perf_counter() - start
+    print(f'update {changes} items: {elapsed * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Measures event loop lag while thousands of transactions are signed
+concurrently by ``RippleJsonRpc.sign_and_submit``, with signing in the
+event loop and in thread and process pools. Submission is stubbed out,
+keys use the ``ecdsa`` backend.
+
+Usage: ``python -m benchmarks.signing``
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import statistics
+import time
+
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.keys import RippleKey
+from aioxrpy.rpc import RippleJsonRpc
+
+
+class OfflineRpc(RippleJsonRpc):
+    async def submit(self, tx_blob):
+        return {'engine_result': 'tesSUCCESS'}
+
+
+async def measure(executor, key, number):
+    rpc = OfflineRpc('http://localhost', executor=executor)
+    txs = [
+        {
+            'Account': key.to_account(),
+            'TransactionType': RippleTransactionType.Payment,
+            'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+            'Amount': 1000000 + i,
+            'Sequence': i,
+            'Fee': 10
+        }
+        for i in range(number)
+    ]
+    lags = []
+    finished = False
+
+    async def ticker():
+        # a task waking up every millisecond, as other RPCs would
+        while not finished:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    tick = asyncio.ensure_future(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(rpc.sign_and_submit(tx, key) for tx in txs))
+    elapsed = time.perf_counter() - start
+    finished = True
+    await tick
+    lags.sort()
+    return (
+        number / elapsed,
+        statistics.median(lags) * 1000,
+        lags[int(len(lags) * 0.99)] * 1000,
+        lags[-1] * 1000
+    )
+
+
+def main(number: int = 2000):
+    key = RippleKey(
+        private_key='ssq55ueDob4yV3kPVnNQLHB6icwpC', backend='ecdsa'
+    )
+    print(
+        f'{"executor":>10} {"tx/s":>8} {"lag p50 ms":>11} '
+        f'{"lag p99 ms":>11} {"lag max ms":>11}'
+    )
+    for name, executor in (
+        ('none', None),
+        ('thread', ThreadPoolExecutor(max_workers=2)),
+        ('process', ProcessPoolExecutor()),
+    ):
+        result = asyncio.run(measure(executor, key, number))
+        if executor is not None:
+            executor.shutdown()
+        print('{:>10} {:>8.0f} {:>11.2f} {:>11.2f} {:>11.2f}'.format(
+            name, *result
+        ))
+
+
+if __name__ == '__main__':
+    main()
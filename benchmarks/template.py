@@ -0,0 +1,67 @@
+"""
+Compares producing signed Payment blobs by serializing every transaction
+against patching a ``TransactionTemplate``.
+
+Signature is fixed in the serialization-only columns, so they measure the
+cost of building signing payloads and blobs; ``signed`` columns include
+ECDSA signing.
+
+Usage: ``python -m benchmarks.template``
+"""
+import timeit
+
+from aioxrpy import serializer
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.keys import RippleKey
+from aioxrpy.template import TransactionTemplate
+
+
+KEY = RippleKey(private_key='ssq55ueDob4yV3kPVnNQLHB6icwpC')
+PAYMENT = {
+    'TransactionType': RippleTransactionType.Payment,
+    'Account': KEY.to_account(),
+    'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+    'DestinationTag': 0,
+    'Amount': 0,
+    'Fee': 10,
+    'Flags': 0x80000000,
+    'Sequence': 0,
+    'SigningPubKey': KEY.to_public()
+}
+SIGNATURE = KEY.sign_tx(PAYMENT)
+TEMPLATE = TransactionTemplate(PAYMENT)
+
+
+def serialize_payment(i, sign=False):
+    tx = {**PAYMENT, 'Sequence': i, 'Amount': i, 'DestinationTag': i}
+    signature = KEY.sign_tx(tx) if sign else SIGNATURE
+    return serializer.serialize({**tx, 'TxnSignature': signature})
+
+
+def patch_payment(i, sign=False):
+    if sign:
+        return TEMPLATE.sign(KEY, Sequence=i, Amount=i, DestinationTag=i)
+    payload = TEMPLATE.render(Sequence=i, Amount=i, DestinationTag=i)
+    return TEMPLATE.blob(payload, SIGNATURE)
+
+
+def measure(func, number, **kwargs):
+    elapsed = timeit.timeit(
+        lambda: [func(i, **kwargs) for i in range(number)], number=1
+    )
+    return number / elapsed
+
+
+def main():
+    print(f'{"method":>10} {"blobs/s":>10} {"signed/s":>10}')
+    for name, func in (
+        ('serialize', serialize_payment), ('template', patch_payment)
+    ):
+        print(
+            f'{name:>10} {measure(func, 20000):>10.0f} '
+            f'{measure(func, 200, sign=True):>10.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
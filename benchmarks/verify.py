@@ -0,0 +1,69 @@
+"""
+Compares verifying signatures of signed blobs one by one with
+``RippleKey.verify_tx`` against ``batch.verify_many``, in the current
+process and in a process pool.
+
+Usage: ``python -m benchmarks.verify``
+"""
+import os
+import time
+
+from aioxrpy import batch, serializer
+from aioxrpy.crypto import available_backends
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.keys import RippleKey
+
+
+def signed_items(keys, number):
+    items = []
+    for i in range(number):
+        key = keys[i % len(keys)]
+        tx = {
+            'TransactionType': RippleTransactionType.Payment,
+            'Account': key.to_account(),
+            'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+            'Amount': 1000000 + i,
+            'Sequence': i,
+            'Fee': 10,
+            'SigningPubKey': key.to_public()
+        }
+        signature = key.sign_tx(tx)
+        blob = serializer.serialize({**tx, 'TxnSignature': signature})
+        items.append((blob, signature, key.to_public()))
+    return items
+
+
+def verify_one_by_one(items, backend):
+    for blob, signature, public_key in items:
+        tx = serializer.deserialize(blob)
+        del tx['TxnSignature']
+        key = RippleKey(public_key=public_key, backend=backend)
+        assert key.verify_tx(tx, signature)
+
+
+def main(number: int = 2000, accounts: int = 20):
+    workers = os.cpu_count() or 1
+    print(f'{"backend":>10} {"method":>24} {"tx/s":>8}')
+    for backend in available_backends():
+        keys = [RippleKey(backend=backend) for _ in range(accounts)]
+        items = signed_items(keys, number)
+        for name, func in (
+            ('verify_tx', lambda: verify_one_by_one(items, backend)),
+            ('verify_many', lambda: all(
+                batch.verify_many(items, backend=backend)
+            )),
+            (f'verify_many ({workers} proc)', lambda: all(
+                batch.verify_many(
+                    items, backend=backend, chunk_size=100,
+                    max_workers=workers
+                )
+            )),
+        ):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            print(f'{backend:>10} {name:>24} {number / elapsed:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
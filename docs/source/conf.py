@@ -35,6 +35,9 @@ extensions = [
     'sphinx_autodoc_typehints'
 ]
 
+# Optional dependencies, not installed when building docs
+autodoc_mock_imports = ['numpy']
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
 
@@ -26,3 +26,33 @@ def test_encode_address():
     )
     base58 = 'rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh'
     assert address.encode_address(binary) == base58
+
+
+def test_bulk_addresses():
+    addresses = [
+        'rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh',
+        'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh'
+    ]
+    decoded = address.decode_addresses(addresses)
+    assert decoded == [address.decode_address(a) for a in addresses]
+    assert address.encode_addresses(decoded) == addresses
+    assert address.encode_addresses(map(memoryview, decoded)) == addresses
+
+    with pytest.raises(ValueError):
+        address.decode_addresses(addresses + ['shitcoin1234'])
+
+
+def test_address_cache():
+    address.cache_clear()
+    binary = (
+        b'\xb5\xf7by\x8aS\xd5C\xa0\x14\xca\xf8\xb2\x97\xcf\xf8\xf2\xf97\xe8'
+    )
+    for _ in range(3):
+        address.encode_address(binary)
+        address.decode_address('rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh')
+
+    info = address.cache_info()
+    assert (info['encode'].hits, info['encode'].misses) == (2, 1)
+    assert (info['decode'].hits, info['decode'].misses) == (2, 1)
+    assert info['decode'].currsize == 1
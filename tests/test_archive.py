@@ -0,0 +1,184 @@
+import os
+
+import pytest
+
+from aioxrpy import archive, serializer
+from aioxrpy.address import decode_address, encode_address
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.hash import transaction_id
+
+
+ACCOUNTS = [
+    'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+    'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+    'rGWrZyQqhTp9Xu7G5Pkayo7bXjH4k4QYpf'
+]
+TRANSACTIONS = [
+    {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': ACCOUNTS[i % 2],
+        'Destination': ACCOUNTS[2],
+        'Amount': 1000000 + i,
+        'Sequence': i,
+        'Fee': 10
+    }
+    for i in range(10)
+]
+BLOBS = [serializer.serialize(tx) for tx in TRANSACTIONS]
+# two transactions per ledger, starting at ledger 100
+LEDGERS = [100 + i // 2 for i in range(len(BLOBS))]
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / 'transactions.bin')
+    with archive.ArchiveWriter(path) as writer:
+        for blob, ledger_index in zip(BLOBS, LEDGERS):
+            writer.append(blob, ledger_index)
+    return path
+
+
+def test_blob_accounts():
+    assert archive.blob_accounts(BLOBS[1]) == [
+        decode_address(ACCOUNTS[1]), decode_address(ACCOUNTS[2])
+    ]
+
+
+def test_archive(path):
+    with open(path, 'rb') as fileobj:
+        assert fileobj.read() == b''.join(BLOBS)
+
+    with archive.Archive(path) as reader:
+        assert len(reader) == len(BLOBS)
+        assert list(reader) == BLOBS
+        assert reader[-1] == BLOBS[-1]
+        with pytest.raises(IndexError):
+            reader[len(BLOBS)]
+        assert serializer.deserialize(reader[3]) == TRANSACTIONS[3]
+
+        entry = reader.entry(3)
+        assert entry.hash == transaction_id(BLOBS[3])
+        assert entry.ledger_index == 101
+
+        assert reader.get(transaction_id(BLOBS[5])) == BLOBS[5]
+        assert reader.get(transaction_id(BLOBS[5]).hex()) == BLOBS[5]
+        assert reader.get(b'\x00' * 32) is None
+
+        assert reader.by_account(ACCOUNTS[0]) == BLOBS[::2]
+        assert reader.by_account(decode_address(ACCOUNTS[1])) == BLOBS[1::2]
+        assert reader.by_account(ACCOUNTS[2]) == BLOBS
+        assert reader.by_account('rrrrrrrrrrrrrrrrrrrrBZbvji') == []
+
+        assert reader.by_ledger(102) == BLOBS[4:6]
+        assert reader.by_ledger(99) == []
+        assert reader.ledger_range(101, 103) == BLOBS[2:6]
+        assert reader.ledger_range(0, 1000) == BLOBS
+
+
+def test_archive_append_and_refresh(path):
+    reader = archive.Archive(path)
+    blob = reader[0]
+    assert reader.by_account(ACCOUNTS[0]) == BLOBS[::2]
+
+    with archive.ArchiveWriter(path) as writer:
+        assert len(writer) == len(BLOBS)
+        with pytest.raises(ValueError):
+            writer.append(BLOBS[0], 99)
+        tx_hash = writer.append(BLOBS[0], 200, b'\x01' * 32)
+    assert tx_hash == b'\x01' * 32
+
+    assert len(reader) == len(BLOBS)
+    reader.refresh()
+    assert len(reader) == len(BLOBS) + 1
+    assert reader.get(tx_hash) == BLOBS[0]
+    assert reader.by_account(ACCOUNTS[0]) == BLOBS[::2] + [BLOBS[0]]
+    assert reader.by_ledger(200) == [BLOBS[0]]
+    # blobs handed out stay valid
+    assert blob == BLOBS[0]
+    reader.close()
+    assert blob == BLOBS[0]
+
+
+def test_archive_recovery(path):
+    # interrupted writer: a blob without its record and a partial record
+    with open(path, 'ab') as fileobj:
+        fileobj.write(BLOBS[0])
+    with open(path + archive.ACCOUNTS_SUFFIX, 'ab') as fileobj:
+        fileobj.write(b'\x00' * 20 + bytes([len(BLOBS), 0, 0, 0]) + b'\x00')
+    with open(path + archive.INDEX_SUFFIX, 'ab') as fileobj:
+        fileobj.write(b'\x00' * 10)
+
+    with archive.Archive(path) as reader:
+        assert list(reader) == BLOBS
+
+    with archive.ArchiveWriter(path) as writer:
+        writer.append(BLOBS[1], 200)
+    with archive.Archive(path) as reader:
+        assert list(reader) == BLOBS + [BLOBS[1]]
+        assert reader.by_account(ACCOUNTS[1]) == BLOBS[1::2] + [BLOBS[1]]
+        assert reader.by_account(b'\x00' * 20) == []
+    assert os.path.getsize(path) == len(b''.join(BLOBS + [BLOBS[1]]))
+
+
+def test_archive_missing_index(path):
+    size = os.path.getsize(path)
+    os.rename(path + archive.INDEX_SUFFIX, path + '.bak')
+    with pytest.raises(ValueError):
+        archive.ArchiveWriter(path)
+    # blobs are kept and the index isn't created
+    assert os.path.getsize(path) == size
+    assert not os.path.exists(path + archive.INDEX_SUFFIX)
+
+    os.rename(path + '.bak', path + archive.INDEX_SUFFIX)
+    with open(path, 'r+b') as fileobj:
+        fileobj.truncate(size - 1)
+    with pytest.raises(ValueError):
+        archive.ArchiveWriter(path)
+    assert os.path.getsize(path) == size - 1
+
+
+def test_archive_tables(tmp_path):
+    # enough hashes and accounts to grow the tables past their initial size
+    path = str(tmp_path / 'transactions.bin')
+    accounts = [encode_address(i.to_bytes(20, 'big')) for i in range(1, 801)]
+    blobs = [
+        serializer.serialize(dict(
+            TRANSACTIONS[0], Account=account, Sequence=i
+        ))
+        for i, account in enumerate(accounts)
+    ]
+    with archive.ArchiveWriter(path) as writer:
+        for blob in blobs:
+            writer.append(blob, 100)
+    assert os.path.getsize(path + archive.HASHES_SUFFIX) > 1024 * 4
+
+    for suffix in (archive.HASHES_SUFFIX, archive.HEADS_SUFFIX):
+        os.remove(path + suffix)
+        with pytest.raises(ValueError):
+            archive.Archive(path)
+        # missing tables are rebuilt by the writer
+        archive.ArchiveWriter(path).close()
+
+    with archive.Archive(path) as reader:
+        for blob, account in zip(blobs[::50], accounts[::50]):
+            assert reader.get(transaction_id(blob)) == blob
+            assert reader.by_account(account) == [blob]
+        assert len(reader.by_account(ACCOUNTS[2])) == len(blobs)
+
+
+def test_empty_archive(tmp_path):
+    path = str(tmp_path / 'empty.bin')
+    archive.ArchiveWriter(path).close()
+    with archive.Archive(path) as reader:
+        assert len(reader) == 0
+        assert list(reader) == []
+        assert reader.get(b'\x00' * 32) is None
+        assert reader.by_account(ACCOUNTS[0]) == []
+        assert reader.by_ledger(1) == []
+
+    with open(path + archive.INDEX_SUFFIX, 'wb') as fileobj:
+        fileobj.write(b'invalid!')
+    with pytest.raises(ValueError):
+        archive.Archive(path)
+    with pytest.raises(ValueError):
+        archive.ArchiveWriter(path)
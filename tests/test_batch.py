@@ -0,0 +1,166 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import io
+
+import pytest
+
+from aioxrpy import batch, serializer
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.keys import generate_seed, RippleKey
+
+
+TRANSACTIONS = [
+    {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000 + i,
+        'Sequence': i,
+        'Fee': 10
+    }
+    for i in range(50)
+]
+BLOBS = [serializer.serialize(tx) for tx in TRANSACTIONS]
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'chunk_size': 7},
+    {'chunk_size': 7, 'max_workers': 2},
+    {'chunk_size': 3, 'executor': ThreadPoolExecutor(2), 'max_pending': 1}
+])
+def test_batch(kwargs):
+    assert list(batch.serialize_many(TRANSACTIONS, **kwargs)) == BLOBS
+    assert list(batch.deserialize_many(BLOBS, **kwargs)) == TRANSACTIONS
+    assert list(batch.deserialize_many(
+        (blob.hex() for blob in BLOBS), **kwargs
+    )) == TRANSACTIONS
+
+
+def test_batch_lazy():
+    consumed = []
+
+    def blobs():
+        for blob in BLOBS:
+            consumed.append(blob)
+            yield blob
+
+    results = batch.deserialize_many(blobs(), chunk_size=5)
+    assert next(results) == TRANSACTIONS[0]
+    assert len(consumed) == 5
+
+
+def signed_items(keys, multi_sign=False):
+    items = []
+    for i, tx in enumerate(TRANSACTIONS[:10]):
+        key = keys[i % len(keys)]
+        tx = {**tx, 'SigningPubKey': b'' if multi_sign else key.to_public()}
+        signature = key.sign_tx(tx, multi_sign=multi_sign)
+        if multi_sign:
+            signed = {**tx, 'Signers': [{'Signer': {
+                'Account': key.to_account(),
+                'TxnSignature': signature,
+                'SigningPubKey': key.to_public()
+            }}]}
+        else:
+            signed = {**tx, 'TxnSignature': signature}
+        # blobs, hex blobs and dicts, with or without signatures
+        blob = serializer.serialize(signed)
+        signed_tx = (blob, blob.hex(), signed, tx)[i % 4]
+        items.append((signed_tx, signature, key.to_public()))
+    return items
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'chunk_size': 3, 'max_workers': 2},
+    {'backend': 'ecdsa'}
+])
+def test_verify_many(kwargs):
+    keys = [RippleKey(), RippleKey(key_type='ed25519')]
+    items = signed_items(keys)
+    # wrong key, tampered signature and invalid public key
+    items.append((items[0][0], items[0][1], keys[1].to_public()))
+    items.append((
+        items[1][0], items[1][1][:-1] + bytes([items[1][1][-1] ^ 1]),
+        items[1][2]
+    ))
+    items.append((items[2][0], items[2][1], b'\x02' + b'\xff' * 32))
+    assert list(batch.verify_many(items, **kwargs)) == [True] * 10 + [
+        False
+    ] * 3
+    assert not any(batch.verify_many(items[:3], multi_sign=True, **kwargs))
+
+    items = signed_items(keys, multi_sign=True)
+    assert all(batch.verify_many(items, multi_sign=True, **kwargs))
+    assert not any(batch.verify_many(items, **kwargs))
+
+
+SEEDS = [
+    'ssq55ueDob4yV3kPVnNQLHB6icwpC',
+    'shHM53KPZ87Gwdqarm1bAmPeXg8Tn',
+    'snoPBrXtMeMyMHUVTgbuqAfg1SUTb',
+    'sEdSKaCy2JT7JaM7v95H9SxkhP9wS2r'
+]
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'chunk_size': 2, 'max_workers': 2},
+    {'backend': 'ecdsa'}
+])
+def test_derive_keys_many(kwargs):
+    seeds = SEEDS + [generate_seed() for _ in range(3)] + [
+        generate_seed('ed25519') for _ in range(2)
+    ]
+    records = list(batch.derive_keys_many(seeds, **kwargs))
+    for seed, record in zip(seeds, records):
+        key = RippleKey(private_key=seed)
+        assert record == (seed, key.to_public(), key.to_account())
+    assert records[1].account == 'rhcfR9Cg98qCxHpCcPBmMonbDBXo84wyTn'
+    assert records[3].account == 'rLUEXYuLiQptky37CqLcm9USQpPiz5rkpD'
+
+    keys = list(batch.derive_keys_many(seeds, as_keys=True, **kwargs))
+    assert [key.to_private() for key in keys] == [
+        RippleKey(private_key=seed).to_private() for seed in seeds
+    ]
+
+
+def test_generate_keys_many():
+    records = list(batch.generate_keys_many(
+        7, chunk_size=3, max_workers=2
+    ))
+    assert len(records) == 7
+    assert len({record.seed for record in records}) == 7
+    for record in records:
+        assert record.seed[0] == 's'
+        assert RippleKey(private_key=record.seed).to_account() == (
+            record.account
+        )
+
+    ed25519_records = batch.generate_keys_many(3, key_type='ed25519')
+    for record in ed25519_records:
+        assert record.seed.startswith('sEd')
+        assert record.public_key[:1] == b'\xed'
+        assert RippleKey(private_key=record.seed).to_account() == (
+            record.account
+        )
+
+    fileobj = io.StringIO()
+    assert batch.write_key_records(records, fileobj) == 7
+    lines = fileobj.getvalue().splitlines()
+    assert lines[0] == '{},{},{}'.format(
+        records[0].seed, records[0].public_key.hex().upper(),
+        records[0].account
+    )
+
+
+def test_aiter_many():
+    async def collect():
+        return [
+            record async for record in batch.aiter_many(
+                batch.derive_keys_many(SEEDS), chunk_size=2
+            )
+        ]
+
+    assert asyncio.run(collect()) == list(batch.derive_keys_many(SEEDS))
@@ -0,0 +1,107 @@
+import pytest
+
+from aioxrpy import serializer
+from aioxrpy.address import decode_address
+from aioxrpy.definitions import RippleTransactionType
+
+numpy = pytest.importorskip('numpy')
+
+from aioxrpy.columnar import (  # noqa: E402
+    column_dtype, extract_columns, null_mask_dtype
+)
+
+
+ACCOUNT = 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi'
+ISSUER = 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'
+FIELDS = [
+    'Account', 'Destination', 'Amount', 'Fee', 'Sequence', 'Flags',
+    'AccountTxnID'
+]
+TRANSACTIONS = [
+    {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': ACCOUNT,
+        'Destination': ISSUER,
+        'Amount': 1000000,
+        'Fee': 10,
+        'Sequence': 1,
+        'Flags': 0x80000000,
+        'Memos': [{'Memo': {'MemoData': b'rent'}}],
+        'AccountTxnID': b'\x01' * 32
+    },
+    {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': ISSUER,
+        'Destination': ACCOUNT,
+        'Amount': {'value': '1.5', 'code': 'USD', 'issuer': ISSUER},
+        'Fee': 12,
+        'Sequence': 2
+    },
+    {
+        'TransactionType': RippleTransactionType.OfferCreate,
+        'Account': ACCOUNT,
+        'TakerGets': 5,
+        'TakerPays': {'value': '1', 'code': 'USD', 'issuer': ISSUER},
+        'Fee': 15,
+        'Sequence': 3,
+        'Flags': 0
+    }
+]
+
+
+def test_extract_columns():
+    blobs = [serializer.serialize(tx) for tx in TRANSACTIONS]
+    blobs[1] = blobs[1].hex()
+    values, null_mask = extract_columns(blobs, FIELDS)
+    assert values.dtype == column_dtype(FIELDS)
+    assert null_mask.dtype == null_mask_dtype(FIELDS)
+    assert len(values) == len(null_mask) == 3
+
+    assert bytes(values['Account'][0]) == decode_address(ACCOUNT)
+    assert bytes(values['Destination'][1]) == decode_address(ACCOUNT)
+    assert values['Amount'][0] == 1000000
+    assert values['Fee'].tolist() == [10, 12, 15]
+    assert values['Sequence'].tolist() == [1, 2, 3]
+    assert values['Flags'][0] == 0x80000000
+    assert bytes(values['AccountTxnID'][0]) == b'\x01' * 32
+
+    assert null_mask.tolist() == [
+        (False, False, False, False, False, False, False),
+        # issued currency amount
+        (False, False, True, False, False, True, True),
+        (False, True, True, False, False, False, True),
+    ]
+
+
+def test_extract_columns_preallocated():
+    blobs = [serializer.serialize(tx) for tx in TRANSACTIONS]
+    out = numpy.zeros(10, column_dtype(['Sequence']))
+    null_mask = numpy.zeros(10, null_mask_dtype(['Sequence']))
+    values, mask = extract_columns(
+        iter(blobs), ['Sequence'], out=out, null_mask=null_mask
+    )
+    assert values.base is out
+    assert out['Sequence'][:4].tolist() == [1, 2, 3, 0]
+    assert not mask['Sequence'].any()
+
+    with pytest.raises(ValueError):
+        extract_columns(blobs, ['Sequence'], out=out[:2])
+    with pytest.raises(ValueError):
+        extract_columns(blobs, ['Fee'], out=out)
+    values, mask = extract_columns([], ['Sequence'], out=out)
+    assert len(values) == len(mask) == 0
+
+
+def test_negative_drops():
+    blob = serializer.serialize({'Amount': 100})
+    # metadata balance changes can be negative
+    negative = blob[:1] + bytes([blob[1] & 0xbf]) + blob[2:]
+    values, _ = extract_columns([blob, negative], ['Amount'])
+    assert values['Amount'].tolist() == [100, -100]
+
+
+def test_unsupported_field():
+    with pytest.raises(ValueError):
+        column_dtype(['Memos'])
+    with pytest.raises(ValueError):
+        extract_columns([], ['TxnSignature'])
@@ -0,0 +1,74 @@
+from aioxrpy import compiler, serializer
+from aioxrpy.definitions import RippleTransactionType
+
+
+PAYMENT = {
+    'TransactionType': RippleTransactionType.Payment,
+    'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+    'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+    'DestinationTag': 1337,
+    'Amount': {
+        'value': 200000000,
+        'issuer': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'code': 'USD'
+    },
+    'Fee': 10,
+    'Sequence': 1,
+    'SigningPubKey': b'\x02' * 33,
+    'Memos': [{'Memo': {'MemoData': b'rent'}}]
+}
+
+
+def test_compiled_codec():
+    codec = compiler.compile_codec(RippleTransactionType.Payment)
+    binary = serializer.ObjectSerializer().serialize(PAYMENT)
+    assert codec.serialize(PAYMENT) == binary
+    assert codec.deserialize(binary) == (len(binary), PAYMENT)
+
+    # optional fields can be omitted
+    tx = {k: v for k, v in PAYMENT.items() if k != 'DestinationTag'}
+    binary = serializer.ObjectSerializer().serialize(tx)
+    assert codec.serialize(tx) == binary
+    assert codec.deserialize(binary) == (len(binary), tx)
+
+
+def test_compiled_codec_fallback():
+    codec = compiler.compile_codec(
+        RippleTransactionType.Payment, ['Account', 'Amount', 'Fee']
+    )
+    tx = {**PAYMENT, 'SourceTag': 1}
+    binary = serializer.ObjectSerializer().serialize(tx)
+    assert codec.serialize(tx) == binary
+    assert codec.deserialize(binary) == (len(binary), tx)
+
+
+def test_compiled_codec_cache():
+    codec = compiler.compile_codec(
+        RippleTransactionType.TrustSet, ['Account', 'LimitAmount']
+    )
+    assert codec is compiler.compile_codec(
+        RippleTransactionType.TrustSet,
+        ['LimitAmount', 'Account', 'TransactionType']
+    )
+    assert codec is not compiler.compile_codec(
+        RippleTransactionType.TrustSet, ['Account', 'LimitAmount', 'Fee']
+    )
+
+
+def test_register_codec(mocker):
+    codec = compiler.register_codec(RippleTransactionType.Payment)
+    try:
+        spy_serialize = mocker.spy(codec, 'serialize')
+        spy_deserialize = mocker.spy(codec, 'deserialize')
+        binary = serializer.serialize(PAYMENT)
+        assert serializer.deserialize(binary) == PAYMENT
+        spy_serialize.assert_called_once_with(PAYMENT)
+        spy_deserialize.assert_called_once()
+
+        # other transaction types use generic serializer
+        tx = {**PAYMENT, 'TransactionType': RippleTransactionType.CheckCash}
+        assert serializer.deserialize(serializer.serialize(tx)) == tx
+        assert spy_serialize.call_count == 1
+    finally:
+        compiler.unregister_codec(RippleTransactionType.Payment)
+    assert not serializer.COMPILED_CODECS
@@ -0,0 +1,164 @@
+import hashlib
+import random
+
+import pytest
+
+from aioxrpy import crypto
+from aioxrpy.keys import RippleKey, secret_from_seed
+
+
+BACKENDS = [
+    'ecdsa',
+    pytest.param('coincurve', marks=pytest.mark.skipif(
+        'coincurve' not in crypto.available_backends(),
+        reason='coincurve is not installed'
+    ))
+]
+
+ED25519_BACKENDS = [
+    'ecdsa',
+    pytest.param('cryptography', marks=pytest.mark.skipif(
+        'cryptography' not in crypto.available_backends('ed25519'),
+        reason='cryptography is not installed'
+    ))
+]
+
+
+def random_secrets(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        (rng.randrange(1, crypto.SECP256K1_ORDER)).to_bytes(32, 'big')
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize('name', BACKENDS)
+def test_backend_matches_ecdsa(name):
+    reference = crypto.get_backend('ecdsa')
+    backend = crypto.get_backend(name)
+    assert backend.name == name
+    assert isinstance(backend, crypto.Secp256k1Backend)
+
+    for index, secret in enumerate(random_secrets(20)):
+        public_key = backend.derive_public_key(secret)
+        assert public_key == reference.derive_public_key(secret)
+
+        digest = hashlib.sha512(bytes([index])).digest()[:32]
+        signature = backend.sign(backend.load_private_key(secret), digest)
+        assert signature == reference.sign(
+            reference.load_private_key(secret), digest
+        )
+        assert backend.verify(
+            backend.load_public_key(public_key), digest, signature
+        )
+        assert not backend.verify(
+            backend.load_public_key(public_key), digest[::-1], signature
+        )
+
+        point = backend.multiply(
+            backend.load_public_key(public_key), index + 2
+        )
+        assert backend.encode_public_key(point) == (
+            reference.encode_public_key(reference.multiply(
+                reference.load_public_key(public_key), index + 2
+            ))
+        )
+
+
+@pytest.mark.parametrize('name', BACKENDS)
+def test_backend_verify_encodings(name):
+    from ecdsa.util import sigdecode_der, sigencode_der
+
+    backend = crypto.get_backend(name)
+    secret = random_secrets(1, seed=1)[0]
+    public_key = backend.load_public_key(backend.derive_public_key(secret))
+    digest = bytes(range(32))
+    signature = backend.sign(backend.load_private_key(secret), digest)
+
+    # non-canonical (high S) signatures are valid, as with ecdsa
+    order = crypto.SECP256K1_ORDER
+    r, s = sigdecode_der(signature, order)
+    assert backend.verify(
+        public_key, digest, sigencode_der(r, order - s, order)
+    )
+    assert not backend.verify(public_key, digest, b'\x30\x00')
+    assert not backend.verify(public_key, digest, b'invalid')
+
+
+@pytest.mark.parametrize('name', BACKENDS)
+def test_ripple_key_backends(name):
+    seed = 'ssq55ueDob4yV3kPVnNQLHB6icwpC'
+    key = RippleKey(private_key=seed, backend=name)
+    reference = RippleKey(private_key=seed, backend='ecdsa')
+    assert key.backend.name == name
+    assert key.to_private() == reference.to_private()
+    assert key.to_private() == secret_from_seed(seed, name)
+    assert key.to_public() == reference.to_public()
+    assert key.to_account() == reference.to_account()
+
+    data = {'Account': key.to_account()}
+    signature = key.sign_tx(data)
+    assert signature == reference.sign_tx(data)
+    assert reference.verify_tx(data, signature)
+    # ecdsa signing options fall back to ecdsa
+    assert key.sign_tx(data, k=3) == reference.sign_tx(data, k=3)
+
+    public = RippleKey(public_key=key.to_public(), backend=name)
+    assert public.verify_tx(data, signature)
+    assert not public.verify_tx({**data, 'Fee': 1}, signature)
+
+
+def test_default_backend():
+    assert crypto.get_backend() is crypto.get_backend(
+        'coincurve' if 'coincurve' in crypto.available_backends() else 'ecdsa'
+    )
+    crypto.set_default_backend('ecdsa')
+    try:
+        assert RippleKey().backend.name == 'ecdsa'
+    finally:
+        crypto.set_default_backend(None)
+    with pytest.raises(ValueError):
+        crypto.set_default_backend('unknown')
+    with pytest.raises(ValueError):
+        crypto.get_backend('unknown')
+
+
+@pytest.mark.parametrize('name', ED25519_BACKENDS)
+def test_ed25519_backend_matches_ecdsa(name):
+    reference = crypto.get_backend('ecdsa', 'ed25519')
+    backend = crypto.get_backend(name, 'ed25519')
+    assert backend.key_type is crypto.KeyType.ED25519
+    assert not isinstance(backend, crypto.Secp256k1Backend)
+    for secret in random_secrets(5):
+        public_key = backend.derive_public_key(secret)
+        assert public_key == reference.derive_public_key(secret)
+        assert public_key[:1] == crypto.ED25519_PREFIX
+
+        message = secret * 3
+        signature = backend.sign(backend.load_private_key(secret), message)
+        assert signature == reference.sign(
+            reference.load_private_key(secret), message
+        )
+        key = backend.load_public_key(public_key)
+        assert backend.verify(key, message, signature)
+        assert not backend.verify(key, message + b'\x00', signature)
+        assert not backend.verify(
+            key, message, bytes([signature[0] ^ 1]) + signature[1:]
+        )
+        assert not backend.verify(key, message, signature[:10])
+
+    with pytest.raises(ValueError):
+        backend.load_public_key(public_key[1:])
+
+
+def test_backend_key_types():
+    assert crypto.get_backend(key_type='ed25519').key_type is (
+        crypto.KeyType.ED25519
+    )
+    assert crypto.get_backend('ecdsa', 'ed25519') is not (
+        crypto.get_backend('ecdsa')
+    )
+    with pytest.raises(ValueError):
+        crypto.get_backend('coincurve', 'ed25519')
+    with pytest.raises(ValueError):
+        crypto.get_backend(crypto.get_backend(), 'ed25519')
@@ -1,4 +1,11 @@
-from decimal import Decimal
+from decimal import (
+    Decimal, InvalidOperation, localcontext, ROUND_05UP, ROUND_CEILING,
+    ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP,
+    ROUND_UP
+)
+import random
+
+import pytest
 
 from aioxrpy import decimals
 
@@ -9,3 +16,140 @@ def test_xrp_to_drops():
 
 def test_drops_to_xrp():
     assert decimals.drops_to_xrp(123456789) == Decimal('123.456789')
+
+
+def test_issued_currency_value():
+    value = decimals.IssuedCurrencyValue.from_value('-1234.5600')
+    assert (value.mantissa, value.exponent, value.sign) == (12345600, -4, 1)
+    assert value.to_decimal() == Decimal('-1234.56')
+    assert value == Decimal('-1234.56')
+    assert value != -1234.56
+    assert float(value) == -1234.56
+    assert -value == decimals.IssuedCurrencyValue(123456, -2)
+    assert str(value) == '-1234.56'
+    assert hash(value) == hash(Decimal('-1234.56'))
+    # equal values hash equally
+    assert {decimals.IssuedCurrencyValue.from_value('0.1'), 0.1} == {
+        Decimal('0.1'), 0.1
+    }
+    assert hash(decimals.IssuedCurrencyValue(5, 1)) == hash(50)
+
+    for number in ('1e-3', '.5', '5.', '+7E+2', '0', 12, Decimal('0.1')):
+        value = decimals.IssuedCurrencyValue.from_value(number)
+        assert value.to_decimal() == Decimal(number)
+
+    for number in ('', '.', '1.2.3', 'abc', Decimal('NaN'), None):
+        with pytest.raises(ValueError):
+            decimals.IssuedCurrencyValue.from_value(number)
+
+
+def test_issued_currency_value_normalized():
+    value = decimals.IssuedCurrencyValue.from_value('0.1').normalized()
+    assert (value.mantissa, value.exponent) == (10**15, -16)
+
+    # digits that don't fit are truncated
+    value = decimals.IssuedCurrencyValue(12345678901234567891, 0).normalized()
+    assert (value.mantissa, value.exponent) == (1234567890123456, 4)
+
+    assert not decimals.IssuedCurrencyValue(1, -200).normalized()
+    with pytest.raises(ValueError):
+        decimals.IssuedCurrencyValue(1, 200).normalized()
+
+
+def random_amounts(count, seed=0):
+    rng = random.Random(seed)
+    amounts = []
+    for _ in range(count):
+        digits = rng.randint(1, 24)
+        coefficient = rng.randrange(10 ** digits)
+        if rng.random() < 0.3:
+            # force ties in the 7th decimal place
+            coefficient = coefficient // 10 * 10 + 5
+            exponent = -7
+        else:
+            # keep drops within Decimal precision
+            exponent = rng.randint(-12, min(4, 21 - digits))
+        sign = rng.choice(('', '-'))
+        amounts.append(Decimal(f'{sign}{coefficient}E{exponent}'))
+    return amounts
+
+
+def test_xrp_to_drops_many():
+    amounts = random_amounts(5000)
+    expected = [decimals.xrp_to_drops(amount) for amount in amounts]
+    assert decimals.xrp_to_drops_many(iter(amounts)) == expected
+
+    integers = [0, 1, -7, 10**21, -10**21]
+    assert decimals.xrp_to_drops_many(integers) == [
+        decimals.xrp_to_drops(amount) for amount in integers
+    ]
+    # amounts exceeding Decimal precision fail the same way
+    for amount in (10**22, Decimal('1E+22')):
+        with pytest.raises(InvalidOperation):
+            decimals.xrp_to_drops_many([amount])
+
+
+@pytest.mark.parametrize('rounding', [
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP
+])
+def test_xrp_to_drops_many_context(rounding):
+    amounts = random_amounts(1000, seed=1)
+    with localcontext() as context:
+        context.rounding = rounding
+        expected = [decimals.xrp_to_drops(amount) for amount in amounts]
+        assert decimals.xrp_to_drops_many(amounts) == expected
+
+        # drops exceeding context precision fail the same way
+        context.prec = 10
+        amounts = [Decimal('1234.5678'), Decimal('12345.678')]
+        assert decimals.xrp_to_drops_many(amounts[:1]) == [1234567800]
+        with pytest.raises(InvalidOperation):
+            decimals.xrp_to_drops_many(amounts[1:])
+
+
+def test_drops_to_xrp_many():
+    rng = random.Random(2)
+    drops = [rng.randint(-10**19, 10**19) for _ in range(5000)]
+    drops += [0, 1, -1, 1000000, -1500000, 10**30, '-42']
+    expected = [decimals.drops_to_xrp(value) for value in drops]
+    assert decimals.drops_to_xrp_strings(drops) == list(map(str, expected))
+    converted = decimals.drops_to_xrp_many(drops)
+    assert converted == expected
+    # exponents match as well
+    assert list(map(str, converted)) == list(map(str, expected))
+
+
+def test_numpy_conversions():
+    numpy = pytest.importorskip('numpy')
+    rng = random.Random(3)
+    drops = numpy.array(
+        [rng.randint(-2**63, 2**63 - 1) for _ in range(5000)] + [-2**63, 0],
+        dtype=numpy.int64
+    )
+    strings = decimals.drops_to_xrp_strings(drops)
+    assert isinstance(strings, numpy.ndarray)
+    assert strings.tolist() == [
+        str(decimals.drops_to_xrp(value)) for value in drops.tolist()
+    ]
+    assert decimals.drops_to_xrp_many(drops[:10]) == [
+        decimals.drops_to_xrp(value) for value in drops[:10].tolist()
+    ]
+
+    xrp = numpy.array([0, 5, -3], dtype=numpy.int32)
+    result = decimals.xrp_to_drops_many(xrp)
+    assert result.dtype == numpy.int64
+    assert result.tolist() == [0, 5000000, -3000000]
+    for amounts in ([2**62], [-2**63], [0, -2**63]):
+        with pytest.raises(OverflowError):
+            decimals.xrp_to_drops_many(numpy.array(amounts, dtype=numpy.int64))
+    with pytest.raises(OverflowError):
+        decimals.xrp_to_drops_many(
+            numpy.array([2**64 - 1], dtype=numpy.uint64)
+        )
+
+    amounts = random_amounts(100)[:50]
+    result = decimals.xrp_to_drops_many(
+        [a for a in amounts if abs(a) < 10**12], as_array=True
+    )
+    assert result.dtype == numpy.int64
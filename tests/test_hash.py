@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from aioxrpy import serializer
+from aioxrpy.definitions import (
+    RippleTransactionHashPrefix, RippleTransactionType
+)
+from aioxrpy.hash import hash_transaction, transaction_id, transaction_ids
+
+
+def make_blob(sequence):
+    return serializer.serialize({
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000,
+        'Sequence': sequence,
+        'Fee': 10,
+        'TxnSignature': b'\x01' * 70
+    })
+
+
+def test_transaction_id():
+    blob = make_blob(1)
+    expected = hash_transaction(
+        RippleTransactionHashPrefix.HASH_TX_ID, blob, b''
+    )
+    assert transaction_id(blob) == expected
+    assert transaction_id(blob.hex().upper()) == expected
+    assert transaction_id(make_blob(2)) != expected
+
+
+def test_transaction_ids():
+    blobs = [make_blob(sequence) for sequence in range(25)]
+    expected = [transaction_id(blob) for blob in blobs]
+
+    assert transaction_ids(iter(blobs)) == expected
+    assert transaction_ids(blobs, chunk_size=4, max_workers=2) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert transaction_ids(
+            blobs, chunk_size=4, executor=executor
+        ) == expected
+    assert transaction_ids([]) == []
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+
+from aioxrpy import definitions
+
+
+# Time budget for importing aioxrpy modules themselves, excluding standard
+# library and third-party dependencies
+IMPORT_TIME_BUDGET_US = 100000
+
+
+def run_import(module):
+    code = (
+        f'import sys, {module}\n'
+        'print(",".join(sorted(sys.modules)))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, check=True, text=True
+    )
+    return result.stdout.strip().split(','), result.stderr
+
+
+def test_heavy_dependencies_are_imported_lazily():
+    for module in ('aioxrpy.rpc', 'aioxrpy.keys', 'aioxrpy.serializer'):
+        modules, _ = run_import(module)
+        assert 'aiohttp' not in modules
+        assert 'ecdsa' not in modules
+
+
+def test_import_time():
+    _, importtime = run_import('aioxrpy.rpc')
+    self_time = 0
+    for line in importtime.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        _, self_us, _, name = line.replace('|', ':').split(':')
+        if name.strip().startswith('aioxrpy'):
+            self_time += int(self_us)
+    assert 0 < self_time < IMPORT_TIME_BUDGET_US
+
+
+def test_definitions_cache(tmp_path, monkeypatch):
+    path = tmp_path / 'definitions.json'
+    cache_path = tmp_path / '__pycache__' / 'definitions.marshal'
+    monkeypatch.setattr(definitions, 'DEFINITIONS_PATH', str(path))
+    monkeypatch.setattr(definitions, 'DEFINITIONS_CACHE_PATH', str(cache_path))
+    monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+
+    path.write_text(json.dumps({'TYPES': {'UInt8': 16}}))
+    assert definitions._load_definitions() == {'TYPES': {'UInt8': 16}}
+    assert cache_path.exists()
+    assert definitions._load_definitions() == {'TYPES': {'UInt8': 16}}
+
+    # cache is invalidated once definitions change
+    path.write_text(json.dumps({'TYPES': {'UInt16': 1}}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert definitions._load_definitions() == {'TYPES': {'UInt16': 1}}
+
+    # corrupted cache is ignored
+    cache_path.write_bytes(b'garbage')
+    assert definitions._load_definitions() == {'TYPES': {'UInt16': 1}}
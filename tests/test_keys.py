@@ -1,8 +1,13 @@
+import asyncio
 import binascii
+import pickle
 
 import pytest
 
-from aioxrpy.keys import RippleKey, signing_key_from_seed
+from aioxrpy import keys, serializer
+from aioxrpy.address import decode_address
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.keys import KeyRing, RippleKey, signing_key_from_seed
 
 
 def test_key_derivation():
@@ -22,13 +27,13 @@ def test_xrp_key_from_hex():
         '42aa52b7da6fc94b8ee8946aeccafb6a03b1f62de2095834e3dcf26d55e0d458'
     )
     key = RippleKey(private_key=hex_key)
-    assert key._sk.to_string() == hex_key
+    assert key.to_private() == hex_key
 
 
 def test_xrp_key_creating():
     key1 = RippleKey()
     key2 = RippleKey()
-    assert key1._sk.to_string() != key2._sk.to_string()
+    assert key1.to_private() != key2.to_private()
 
 
 def test_xrp_key_to_public():
@@ -68,3 +73,124 @@ def test_xrp_public_key_signature():
 
     with pytest.raises(AssertionError):
         key.sign_tx(data)
+
+
+def test_xrp_key_pickle():
+    key = RippleKey(private_key='ssq55ueDob4yV3kPVnNQLHB6icwpC')
+    restored = pickle.loads(pickle.dumps(key))
+    assert restored.to_private() == key.to_private()
+    assert restored.backend is key.backend
+
+    public_key = RippleKey(public_key=key.to_public())
+    restored = pickle.loads(pickle.dumps(public_key))
+    assert restored.to_public() == key.to_public()
+
+
+def test_xrp_key_sign_tx_async():
+    key = RippleKey(private_key='ssq55ueDob4yV3kPVnNQLHB6icwpC')
+    data = {'Account': key.to_account()}
+    signature = asyncio.run(key.sign_tx_async(data, multi_sign=True))
+    assert signature == key.sign_tx(data, multi_sign=True)
+
+
+def test_xrp_key_derived_values_cached(mocker):
+    key = RippleKey(private_key='shHM53KPZ87Gwdqarm1bAmPeXg8Tn')
+    encode = mocker.spy(key.backend, 'encode_public_key')
+    account_id = mocker.spy(keys, 'account_id')
+    for _ in range(3):
+        assert key.to_account() == 'rhcfR9Cg98qCxHpCcPBmMonbDBXo84wyTn'
+        assert key.account_id == decode_address(key.to_account())
+        key.to_public()
+    assert encode.call_count == 1
+    assert account_id.call_count == 1
+
+
+def test_key_ring():
+    ring_keys = [RippleKey() for _ in range(20)]
+    ring = KeyRing(ring_keys)
+    assert len(ring) == 20
+    signers = ring.signers()
+    assert [key.account_id for key in signers] == sorted(
+        key.account_id for key in ring_keys
+    )
+    assert list(ring) == signers
+
+    key = ring_keys[5]
+    assert ring[key.to_account()] is key
+    assert ring[key.account_id] is key
+    assert ring.by_public_key(key.to_public()) is key
+    assert key.to_account() in ring
+    assert ring.get('rhcfR9Cg98qCxHpCcPBmMonbDBXo84wyTn') is None
+    with pytest.raises(KeyError):
+        ring.by_public_key(b'\x02' * 33)
+
+    subset = [ring_keys[3].to_account(), ring_keys[1].account_id]
+    assert ring.signers(subset) == sorted(
+        [ring_keys[1], ring_keys[3]], key=lambda key: key.account_id
+    )
+
+    ring.discard(key.to_account())
+    assert key.to_account() not in ring
+    assert key not in ring.signers()
+    assert len(ring) == 19
+    with pytest.raises(KeyError):
+        ring.by_public_key(key.to_public())
+
+    # keys of the same account replace each other
+    ring.add(RippleKey(public_key=ring_keys[0].to_public()))
+    assert len(ring) == 19
+    assert ring[ring_keys[0].account_id] is not ring_keys[0]
+
+
+def test_encode_seed():
+    entropy = binascii.unhexlify('523290e636d6cd4145f3f03f8549577a')
+    assert keys.encode_seed(entropy) == 'ssq55ueDob4yV3kPVnNQLHB6icwpC'
+    assert keys.generate_seed() != keys.generate_seed()
+    assert keys.decode_seed(keys.encode_seed(entropy, 'ed25519')) == (
+        entropy, keys.KeyType.ED25519
+    )
+    assert keys.generate_seed('ed25519').startswith('sEd')
+    with pytest.raises(ValueError):
+        keys.decode_seed('rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh')
+
+
+def test_ed25519_key():
+    key = RippleKey(private_key='sEdSKaCy2JT7JaM7v95H9SxkhP9wS2r')
+    assert key.key_type is keys.KeyType.ED25519
+    assert key.to_private() == binascii.unhexlify(
+        'B4C4E046826BD26190D09715FC31F4E6A728204EADD112905B08B14B7F15C4F3'
+    )
+    assert key.to_public() == binascii.unhexlify(
+        'ED01FA53FA5A7E77798F882ECE20B1ABC00BB358A9E55A202D0D0676BD0CE37A63'
+    )
+    assert key.to_account() == 'rLUEXYuLiQptky37CqLcm9USQpPiz5rkpD'
+
+    public_key = RippleKey(public_key=key.to_public())
+    assert public_key.key_type is keys.KeyType.ED25519
+    assert RippleKey(key_type='ed25519').to_public()[:1] == b'\xed'
+    assert pickle.loads(pickle.dumps(key)).key_type is keys.KeyType.ED25519
+    with pytest.raises(ValueError):
+        RippleKey(
+            private_key='sEdSKaCy2JT7JaM7v95H9SxkhP9wS2r',
+            key_type='secp256k1'
+        )
+
+    tx = {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': key.to_account(),
+        'Destination': 'rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh',
+        'Amount': 1000000,
+        'Fee': 10,
+        'Sequence': 1,
+        'SigningPubKey': key.to_public()
+    }
+    signature = key.sign_tx(tx)
+    assert len(signature) == 64
+    assert key.sign_tx(serializer.serialize(tx)) == signature
+    assert public_key.verify_tx(tx, signature)
+    assert not public_key.verify_tx(tx, signature, multi_sign=True)
+    assert public_key.verify_tx(
+        tx, key.sign_tx(tx, multi_sign=True), multi_sign=True
+    )
+    with pytest.raises(AssertionError):
+        key.sign(b'data', k=1)
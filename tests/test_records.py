@@ -0,0 +1,87 @@
+import pickle
+
+from aioxrpy import serializer
+from aioxrpy.address import decode_address
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.records import RippleRecord, deserialize_record, record_class
+from aioxrpy.serializer import HashVector
+
+
+PAYMENT = {
+    'TransactionType': RippleTransactionType.Payment,
+    'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+    'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+    'Amount': {
+        'value': '1.5',
+        'code': 'USD',
+        'issuer': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'
+    },
+    'SendMax': 1000000,
+    'Fee': 10,
+    'Sequence': 1,
+    'Memos': [{'Memo': {'MemoData': b'rent'}}],
+    'TxnSignature': b'\x01' * 70
+}
+
+
+def test_deserialize_record():
+    binary = serializer.serialize(PAYMENT)
+    record = deserialize_record(binary)
+    assert type(record).__name__ == 'PaymentRecord'
+    assert isinstance(record, RippleRecord)
+    assert not hasattr(record, '__dict__')
+
+    assert record.Account == PAYMENT['Account']
+    assert record.raw('Account') == decode_address(PAYMENT['Account'])
+    assert record.Amount == serializer.deserialize(binary)['Amount']
+    assert record.SendMax == 1000000
+    assert record.Sequence == 1
+
+    assert record.to_dict() == serializer.deserialize(binary)
+    assert serializer.serialize(record.to_dict()) == binary
+    assert record.serialize() == binary
+    assert deserialize_record(binary.hex()) == record
+
+
+def test_record_class_cache():
+    binary = serializer.serialize(PAYMENT)
+    other = serializer.serialize({**PAYMENT, 'Sequence': 2})
+    payment_class = record_class(
+        RippleTransactionType.Payment, tuple(
+            field.name for field in serializer.canonical_order(PAYMENT)
+        )
+    )
+    assert deserialize_record(binary).__class__ is payment_class
+    assert deserialize_record(other).__class__ is payment_class
+    assert deserialize_record(binary) != deserialize_record(other)
+
+    without_memos = {k: v for k, v in PAYMENT.items() if k != 'Memos'}
+    assert deserialize_record(
+        serializer.serialize(without_memos)
+    ).__class__ is not payment_class
+
+    # records of evicted classes are still equal to new ones
+    record = deserialize_record(binary)
+    record_class.cache_clear()
+    assert deserialize_record(binary) == record
+    assert record_class(None, ('Flags',)).__name__ == 'RippleObjectRecord'
+
+
+def test_record_pickle():
+    record = deserialize_record(serializer.serialize(PAYMENT))
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_ledger_entry_record():
+    entry = {
+        'LedgerEntryType': 0x64,
+        'Owner': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'RootIndex': b'\x01' * 32,
+        'Indexes': [b'\x02' * 32, b'\x03' * 32]
+    }
+    binary = bytearray(serializer.serialize(entry))
+    record = deserialize_record(binary)
+    # vectors are copied, so the blob can be reused
+    binary[:] = b'\x00' * len(binary)
+    assert isinstance(record.Indexes, HashVector)
+    assert record.to_dict() == entry
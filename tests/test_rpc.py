@@ -1,9 +1,13 @@
 import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from aioresponses import aioresponses
 import pytest
 
-from aioxrpy import exceptions
+from aioxrpy import address, exceptions, serializer
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.keys import KeyRing, RippleKey
+from aioxrpy import rpc as rpc_module
 from aioxrpy.rpc import RippleJsonRpc, RippleFeeInfo, RippleReserveInfo
 
 
@@ -95,6 +99,173 @@ async def test_submit_error_mapping(rpc, mock_post):
     mock_post.assert_called_with('submit', {'tx_blob': '0123ffc'})
 
 
+async def test_sign_and_submit(rpc, mock_post):
+    response = {
+        'engine_result': 'tesSUCCESS'
+    }
+    mock_post.side_effect = asyncio.coroutine(lambda *args, **kwargs: response)
+    key = RippleKey(private_key='ssq55ueDob4yV3kPVnNQLHB6icwpC')
+    tx = {
+        'Account': key.to_account(),
+        'TransactionType': RippleTransactionType.Payment,
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000,
+        'Sequence': 1,
+        'Fee': 10
+    }
+    assert await rpc.sign_and_submit(tx, key) == response
+
+    method, params = mock_post.call_args[0]
+    assert method == 'submit'
+    signed_tx = serializer.deserialize(params['tx_blob'])
+    signature = signed_tx.pop('TxnSignature')
+    assert signed_tx == {**tx, 'SigningPubKey': key.to_public()}
+    assert key.verify_tx(signed_tx, signature)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.tasks = 0
+
+    def submit(self, *args, **kwargs):
+        self.tasks += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.parametrize('executor_class', [
+    CountingExecutor, lambda: ProcessPoolExecutor(max_workers=1)
+])
+async def test_sign_and_submit_executor(mocker, executor_class):
+    executor = executor_class()
+    rpc = RippleJsonRpc('http://mock.rpc.url', executor=executor)
+    submit = mocker.patch.object(
+        rpc, 'submit', side_effect=asyncio.coroutine(lambda blob: blob)
+    )
+    keys = [
+        RippleKey(private_key='ssq55ueDob4yV3kPVnNQLHB6icwpC'), RippleKey()
+    ]
+    txs = [
+        {
+            'Account': keys[i % 2].to_account(),
+            'TransactionType': RippleTransactionType.Payment,
+            'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+            'Amount': 1000000 + i,
+            'Sequence': i,
+            'Fee': 10
+        }
+        for i in range(10)
+    ]
+    # invalid transaction fails without affecting the rest of its batch
+    invalid = {**txs[0], 'Fee': 'invalid'}
+    with executor:
+        results = await asyncio.gather(
+            *(
+                rpc.sign_and_submit(tx, keys[i % 2])
+                for i, tx in enumerate(txs)
+            ),
+            rpc.sign_and_submit(invalid, keys[0]),
+            return_exceptions=True
+        )
+        assert isinstance(results[-1], Exception)
+        assert submit.call_count == len(txs)
+        for i, (tx, blob) in enumerate(zip(txs, results)):
+            assert blob == rpc_module.sign_transaction(
+                {**tx, 'SigningPubKey': keys[i % 2].to_public()}, keys[i % 2]
+            )
+        if isinstance(executor, CountingExecutor):
+            # a task per key
+            assert executor.tasks == 2
+
+            await rpc.multisign_and_submit(txs[0], keys)
+            assert executor.tasks == 3
+            assert submit.call_args[0][0] == rpc_module.multisign_transaction(
+                txs[0], keys
+            )
+
+
+async def test_sign_and_submit_executor_failure(mocker):
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    rpc = RippleJsonRpc('http://mock.rpc.url', executor=executor)
+    mocker.patch.object(
+        rpc, 'submit', side_effect=asyncio.coroutine(lambda blob: blob)
+    )
+    key = RippleKey()
+    tx = {
+        'Account': key.to_account(),
+        'TransactionType': RippleTransactionType.Payment,
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000,
+        'Sequence': 1,
+        'Fee': 10
+    }
+    # submitting to a shut down executor fails every queued transaction
+    results = await asyncio.wait_for(asyncio.gather(
+        rpc.sign_and_submit(tx, key), rpc.sign_and_submit(tx, key),
+        return_exceptions=True
+    ), 1)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_signing_batcher_cancelled(mocker):
+    loop = asyncio.get_event_loop()
+    cancelled = loop.create_future()
+    cancelled.cancel()
+    mocker.patch.object(loop, 'run_in_executor', return_value=cancelled)
+    batcher = rpc_module._SigningBatcher(ThreadPoolExecutor(max_workers=1))
+    future = batcher.sign({}, RippleKey())
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(future, 1)
+
+
+async def test_multisign_and_submit(rpc, mock_post):
+    response = {
+        'engine_result': 'tesSUCCESS'
+    }
+    mock_post.side_effect = asyncio.coroutine(lambda *args, **kwargs: response)
+    keys = [RippleKey(), RippleKey(), RippleKey()]
+    tx = {
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'TransactionType': RippleTransactionType.Payment,
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000,
+        'Sequence': 1,
+        'Fee': 40
+    }
+    assert await rpc.multisign_and_submit(tx, keys) == response
+
+    method, params = mock_post.call_args[0]
+    signed_tx = serializer.deserialize(params['tx_blob'])
+    signers = signed_tx.pop('Signers')
+    assert signed_tx == {**tx, 'SigningPubKey': b''}
+    assert len(signers) == len(keys)
+
+    accounts = [signer['Signer']['Account'] for signer in signers]
+    assert accounts == sorted(
+        accounts, key=lambda account: address.decode_address(account)
+    )
+    for signer in signers:
+        key = RippleKey(public_key=signer['Signer']['SigningPubKey'])
+        assert key.to_account() == signer['Signer']['Account']
+        assert key.verify_tx(
+            signed_tx, signer['Signer']['TxnSignature'], multi_sign=True
+        )
+
+
+def test_multisign_transaction_key_ring():
+    keys = [RippleKey() for _ in range(5)]
+    tx = {
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'TransactionType': RippleTransactionType.Payment,
+        'Sequence': 1,
+        'Fee': 40
+    }
+    assert rpc_module.multisign_transaction(tx, KeyRing(keys)) == (
+        rpc_module.multisign_transaction(tx, keys)
+    )
+
+
 async def test_server_info(rpc, mock_post):
     response = {
         'info': {
@@ -106,6 +277,51 @@ async def test_server_info(rpc, mock_post):
     mock_post.assert_called_with('server_info')
 
 
+async def test_tx(rpc, mock_post):
+    tx = {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000,
+        'Sequence': 1,
+        'Fee': 10
+    }
+    meta = {
+        'TransactionIndex': 0,
+        'TransactionResult': 0,
+        'AffectedNodes': [
+            {'ModifiedNode': {'FinalFields': {'Balance': 1}}}
+        ]
+    }
+    response = {
+        'tx': serializer.serialize(tx).hex(),
+        'meta': serializer.serialize(meta).hex(),
+        'validated': True
+    }
+    mock_post.side_effect = asyncio.coroutine(lambda *args, **kwargs: response)
+    assert await rpc.tx('ABCD') == {
+        'tx': tx, 'meta': meta, 'validated': True
+    }
+    mock_post.assert_called_with(
+        'tx', {'transaction': 'ABCD', 'binary': True}
+    )
+
+
+async def test_ledger_entry(rpc, mock_post):
+    node = {
+        'LedgerEntryType': 0x64,
+        'Owner': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'RootIndex': b'\x01' * 32,
+        'Indexes': [b'\x02' * 32]
+    }
+    response = {'index': 'AB', 'node_binary': serializer.serialize(node).hex()}
+    mock_post.side_effect = asyncio.coroutine(lambda *args, **kwargs: response)
+    assert await rpc.ledger_entry('AB') == {**response, 'node': node}
+    mock_post.assert_called_with('ledger_entry', {
+        'index': 'AB', 'ledger_index': 'validated', 'binary': True
+    })
+
+
 async def test_get_reserve(rpc, mock_post):
     response = {
         'info': {
@@ -1,12 +1,16 @@
 from decimal import Decimal as D
+import pickle
 import secrets
 
 import pytest
 
 from aioxrpy.serializer import (
-    serialize, deserialize, lookup_field, BlobSerializer, AmountSerializer,
-    PathSetSerializer, ArraySerializer
+    serialize, deserialize, deserialize_lazy, lookup_field, insert_fields,
+    serialize_with_offsets, BlobSerializer, AmountSerializer,
+    PathSetSerializer, ArraySerializer, ObjectSerializer, HashVector,
+    Vector256Serializer
 )
+from aioxrpy.decimals import IssuedCurrencyValue
 from aioxrpy.definitions import RippleTransactionType, RIPPLE_FIELDS
 
 
@@ -43,8 +47,17 @@ def test_field_lookup():
 
         field_id = field.field_id
         length, looked_up_field = lookup_field(field_id)
-        assert looked_up_field == field
+        assert looked_up_field is field
         assert len(field_id) == length
+        assert field.header == bytes(field_id)
+
+
+def test_field_sort_key():
+    fields = sorted(
+        (field for field in RIPPLE_FIELDS.values() if field.is_serialized),
+        key=lambda field: field.sort_key
+    )
+    assert fields == sorted(fields, key=lambda field: (field.type_, field.nth))
 
 
 def test_simple_test():
@@ -145,7 +158,7 @@ def test_amount_serializer_issued_currency():
 
     # fraction
     expected_binary = None
-    expected_value = {**issued_currency, 'value': 21.37}
+    expected_value = {**issued_currency, 'value': D('21.37')}
     serialized = serializer.serialize(expected_value)
     # assert serialized == expected_binary
     length, deserialized = serializer.deserialize(serialized)
@@ -277,3 +290,209 @@ def test_array_serializer():
     length, deserialized = serializer.deserialize(serialized)
     assert length == len(serialized)
     assert deserialized == expected_array
+
+
+def test_deserialize_with_offset():
+    expected_dict = {
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Memos': [
+            {
+                'Memo': {
+                    'MemoType': b'text/plain',
+                    'MemoData': b'memo'
+                }
+            }
+        ],
+        'Fee': 10
+    }
+    serialized = serialize(expected_dict)
+    padded = memoryview(b'\xff' * 5 + serialized)
+    length, deserialized = ObjectSerializer().deserialize(padded, 5)
+    assert length == len(serialized)
+    assert deserialized == expected_dict
+    assert deserialize(bytearray(serialized)) == expected_dict
+
+
+def test_serializer_write():
+    buffer = bytearray(b'\xff')
+    ArraySerializer().write(buffer, [{'Memo': {'MemoData': b'rent'}}])
+    assert buffer == b'\xff\xea}\x04rent\xe1\xf1'
+
+
+def test_insert_fields():
+    tx = {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Sequence': 1,
+        'Fee': 10
+    }
+    binary, offsets = serialize_with_offsets(tx)
+    assert binary == serialize(tx)
+    for name, (start, end) in offsets.items():
+        assert binary[start:end] == serialize({name: tx[name]})
+
+    fields = {
+        'TxnSignature': b'signature',
+        'Signers': [{'Signer': {'Account': tx['Account']}}],
+        'Flags': 0
+    }
+    assert insert_fields(binary, offsets, fields) == serialize(
+        {**tx, **fields}
+    )
+
+    with pytest.raises(ValueError):
+        insert_fields(binary, offsets, {'Fee': 12})
+
+
+def test_skip():
+    tx = {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Amount': {
+            'value': 200000000,
+            'issuer': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+            'code': 'USD'
+        },
+        'Fee': 10,
+        'Memos': [{'Memo': {'MemoData': b'rent'}}],
+        'Paths': [
+            [{'account': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'}],
+            [
+                {
+                    'currency': 'USD',
+                    'issuer': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'
+                },
+                {'account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi'}
+            ]
+        ]
+    }
+    for name, value in tx.items():
+        field = RIPPLE_FIELDS[name]
+        binary = field.codec.serialize(value)
+        assert field.codec.skip(binary) == len(binary)
+
+    binary = serialize(tx)
+    assert ObjectSerializer().skip(binary) == len(binary)
+
+
+def test_deserialize_lazy():
+    tx = {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000,
+        'Memos': [{'Memo': {'MemoData': b'rent'}}],
+        'Fee': 10
+    }
+    binary = serialize(tx)
+    lazy = deserialize_lazy(binary.hex())
+    assert len(lazy) == len(tx)
+    assert set(lazy) == set(tx)
+    assert 'Account' in lazy
+    assert 'Sequence' not in lazy
+    assert not lazy._values
+
+    assert lazy['Destination'] == tx['Destination']
+    assert lazy.get('Sequence') is None
+    assert list(lazy._values) == ['Destination']
+    assert lazy['Destination'] is lazy['Destination']
+
+    assert lazy == tx
+    assert tx == lazy
+    assert lazy == deserialize(binary)
+    assert lazy.to_dict() == tx
+
+
+def test_amount_serializer_exact_values():
+    serializer = AmountSerializer()
+    issued_currency = {
+        'issuer': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'code': 'USD'
+    }
+    for value in ('0.1', '-1234567890.123456', '1e-81', '9999999999999999e80'):
+        serialized = serializer.serialize({**issued_currency, 'value': value})
+        length, deserialized = serializer.deserialize(serialized)
+        assert isinstance(deserialized['value'], IssuedCurrencyValue)
+        assert deserialized['value'].to_decimal() == D(value)
+        assert serializer.serialize(deserialized) == serialized
+
+
+def test_vector256_serializer():
+    serializer = Vector256Serializer()
+    hashes = [bytes([i]) * 32 for i in range(3)]
+    serialized = serializer.serialize(hashes)
+    assert serialized == b'\x60' + b''.join(hashes)
+
+    length, deserialized = serializer.deserialize(b'\xff' + serialized, 1)
+    assert length == len(serialized)
+    assert isinstance(deserialized, HashVector)
+    assert deserialized == hashes
+    assert deserialized[-1] == hashes[2]
+    assert deserialized[1:] == hashes[1:]
+    assert deserialized[::2] == hashes[::2]
+    assert serializer.serialize(deserialized) == serialized
+    assert serializer.skip(serialized) == len(serialized)
+
+    assert serializer.serialize([]) == b'\x00'
+    with pytest.raises(ValueError):
+        serializer.serialize([b'\x00' * 31])
+    with pytest.raises(ValueError):
+        serializer.deserialize(b'\x1f' + b'\x00' * 31)
+
+
+def test_hash_vector_pickle():
+    vector = HashVector(memoryview(b'\x01' * 64))
+    assert pickle.loads(pickle.dumps(vector)) == vector
+
+
+def test_transaction_metadata():
+    account = 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi'
+    meta = {
+        'TransactionIndex': 3,
+        'TransactionResult': 0,
+        'DeliveredAmount': 1000,
+        'AffectedNodes': [
+            {
+                'ModifiedNode': {
+                    'LedgerEntryType': 0x61,
+                    'LedgerIndex': b'\x01' * 32,
+                    'PreviousTxnID': b'\x02' * 32,
+                    'PreviousTxnLgrSeq': 5,
+                    'FinalFields': {
+                        'Account': account,
+                        'Balance': 999,
+                        'Flags': 0,
+                        'OwnerCount': 1,
+                        'Sequence': 2
+                    },
+                    'PreviousFields': {
+                        'Balance': 1000,
+                        'Sequence': 1
+                    }
+                }
+            },
+            {
+                'CreatedNode': {
+                    'LedgerEntryType': 0x64,
+                    'LedgerIndex': b'\x03' * 32,
+                    'NewFields': {
+                        'Owner': account,
+                        'RootIndex': b'\x03' * 32,
+                        'Indexes': [b'\x04' * 32, b'\x05' * 32]
+                    }
+                }
+            }
+        ]
+    }
+    binary = serialize(meta)
+    # nested objects are terminated with object end marker
+    final_fields = binary.index(b'\xe7')
+    assert binary[final_fields:].startswith(
+        b'\xe7' + serialize(meta['AffectedNodes'][0]['ModifiedNode'][
+            'FinalFields'
+        ]) + b'\xe1'
+    )
+    assert deserialize(binary) == meta
+    assert deserialize_lazy(binary) == meta
+    assert serialize(deserialize(binary)) == binary
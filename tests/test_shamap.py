@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from aioxrpy import shamap
+from aioxrpy.definitions import RippleSHAMapHashPrefix
+from aioxrpy.hash import first_half_of_sha512, transaction_id
+from aioxrpy.shamap import (
+    SHAMap, SHAMapLeafType, ZERO_HASH, leaf_hash, transaction_leaf
+)
+
+
+def random_items(count, seed=0):
+    rng = random.Random(seed)
+    items = {}
+    while len(items) < count:
+        key = bytes(rng.getrandbits(8) for _ in range(32))
+        items[key] = bytes(rng.getrandbits(8) for _ in range(20))
+    # keys sharing long prefixes force deep branches
+    items[b'\xab' * 31 + b'\x01'] = b'deep1'
+    items[b'\xab' * 31 + b'\x02'] = b'deep2'
+    return items
+
+
+def build(items):
+    tree = SHAMap(SHAMapLeafType.ACCOUNT_STATE)
+    for key, data in items.items():
+        tree[key] = data
+    return tree
+
+
+def test_empty():
+    tree = SHAMap(SHAMapLeafType.ACCOUNT_STATE)
+    assert tree.hash == ZERO_HASH
+    assert len(tree) == 0
+    assert list(tree) == []
+
+
+def test_single_item():
+    key = b'\x30' + b'\x00' * 31
+    tree = build({key: b'data'})
+    hashes = [ZERO_HASH] * 16
+    hashes[3] = first_half_of_sha512(
+        RippleSHAMapHashPrefix.LEAF_NODE, b'data', key
+    )
+    assert tree.hash == first_half_of_sha512(
+        RippleSHAMapHashPrefix.INNER_NODE, *hashes
+    )
+
+
+def test_insertion_order():
+    items = random_items(200)
+    keys = list(items)
+    random.Random(1).shuffle(keys)
+    shuffled = build({key: items[key] for key in keys})
+    assert shuffled.hash == build(items).hash
+    assert list(shuffled) == sorted(items)
+    assert len(shuffled) == len(items)
+    assert dict(shuffled) == items
+
+
+def test_update_and_delete():
+    items = random_items(200)
+    tree = build(items)
+    expected = tree.hash
+
+    key = next(iter(items))
+    tree[key] = b'changed'
+    assert tree.hash != expected
+    tree[key] = items[key]
+    assert tree.hash == expected
+    assert len(tree) == len(items)
+
+    extra = random_items(50, seed=2)
+    extra_only = {k: v for k, v in extra.items() if k not in items}
+    tree.update(extra_only)
+    assert tree.hash == build({**items, **extra_only}).hash
+    for key in extra_only:
+        del tree[key]
+    # deleted branches are collapsed
+    assert tree.hash == expected
+    assert len(tree) == len(items)
+
+    with pytest.raises(KeyError):
+        del tree[b'\x00' * 32]
+    with pytest.raises(KeyError):
+        tree[b'\x00' * 32]
+    for key in list(items):
+        del tree[key]
+    assert tree.hash == ZERO_HASH
+
+
+def test_incremental_hashing(mocker):
+    tree = build(random_items(1000))
+    tree.hash
+    key = random.choice(list(tree))
+    spy = mocker.spy(shamap, 'first_half_of_sha512')
+    tree[key] = b'changed'
+    tree.hash
+    # one leaf plus inner nodes on its path
+    assert spy.call_count == 1 + len(tree.proof(key).branches)
+
+
+def test_proof():
+    items = random_items(100)
+    tree = build(items)
+    for key, data in items.items():
+        proof = tree.proof(key)
+        assert proof.data == data
+        assert proof.verify(tree.hash)
+
+    proof = tree.proof(b'\xab' * 31 + b'\x02')
+    assert len(proof.branches) == 64
+    proof.data = b'forged'
+    assert not proof.verify(tree.hash)
+    with pytest.raises(KeyError):
+        tree.proof(b'\x00' * 32)
+
+
+def test_transaction_tree():
+    tree = SHAMap(SHAMapLeafType.TRANSACTION_WITH_META)
+    tx_blob, meta_blob = b'\x12\x00\x00' * 10, b'\x20\x1c\x00\x00\x00\x00'
+    key = tree.add_transaction(tx_blob, meta_blob)
+    assert key == transaction_id(tx_blob)
+    assert transaction_leaf(tx_blob, meta_blob) == (
+        key, b'\x1e' + tx_blob + b'\x06' + meta_blob
+    )
+    assert tree.proof(key).verify(tree.hash)
+    assert tree.proof(key).branches[0][key[0] >> 4] == first_half_of_sha512(
+        RippleSHAMapHashPrefix.TX_NODE, tree[key], key
+    )
+    assert leaf_hash(SHAMapLeafType.TRANSACTION, key, tx_blob) == key
@@ -0,0 +1,84 @@
+import asyncio
+import io
+
+import pytest
+
+from aioxrpy import serializer, stream
+from aioxrpy.definitions import RippleTransactionType
+
+
+TRANSACTIONS = [
+    {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'Amount': 1000000 + i,
+        'Sequence': i,
+        'Fee': 10,
+        'Memos': [{'Memo': {'MemoData': b'x' * i}}]
+    }
+    for i in range(1, 20)
+] + [
+    {
+        'LedgerEntryType': 0x61,
+        'Account': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'Balance': 10
+    },
+    {
+        'LedgerEntryType': 0x61,
+        'Account': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'
+    }
+]
+BLOBS = [serializer.serialize(tx) for tx in TRANSACTIONS]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+def test_iter_blobs(chunk_size):
+    fileobj = io.BytesIO(b''.join(BLOBS))
+    assert list(stream.iter_blobs(fileobj, chunk_size=chunk_size)) == BLOBS
+
+
+def test_iter_objects():
+    fileobj = io.BytesIO(b''.join(BLOBS))
+    assert list(stream.iter_objects(fileobj, chunk_size=5)) == TRANSACTIONS
+
+    fileobj = io.BytesIO(b''.join(BLOBS))
+    assert list(stream.iter_objects(fileobj, lazy=True)) == TRANSACTIONS
+
+    assert list(stream.iter_objects(io.BytesIO())) == []
+
+
+def test_blob_decoder_errors():
+    # truncated object
+    decoder = stream.BlobDecoder()
+    assert decoder.feed(b''.join(BLOBS)[:-1]) == BLOBS[:-1]
+    with pytest.raises(ValueError):
+        decoder.close()
+
+    # object without TransactionType or LedgerEntryType
+    decoder = stream.BlobDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(
+            serializer.serialize({'Fee': 10})
+            + serializer.serialize({
+                'Account': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'
+            })
+        )
+
+    # unknown nested field ID
+    decoder = stream.BlobDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(BLOBS[0][:-1] + b'\xe0\xff\xff')
+
+    # object too long
+    decoder = stream.BlobDecoder(max_object_size=32)
+    with pytest.raises(ValueError):
+        decoder.feed(BLOBS[-3])
+
+
+async def test_aiter_objects():
+    reader = asyncio.StreamReader()
+    reader.feed_data(b''.join(BLOBS))
+    reader.feed_eof()
+    objects = [obj async for obj in stream.aiter_objects(reader, chunk_size=3)]
+    assert objects == TRANSACTIONS
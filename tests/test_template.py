@@ -0,0 +1,86 @@
+import pytest
+
+from aioxrpy import serializer
+from aioxrpy.definitions import RippleTransactionType
+from aioxrpy.hash import hash_transaction
+from aioxrpy.keys import RippleKey
+from aioxrpy.template import TransactionTemplate
+
+
+@pytest.fixture
+def key():
+    return RippleKey(private_key='ssq55ueDob4yV3kPVnNQLHB6icwpC')
+
+
+@pytest.fixture
+def payment(key):
+    return {
+        'TransactionType': RippleTransactionType.Payment,
+        'Account': key.to_account(),
+        'Destination': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV',
+        'DestinationTag': 0,
+        'Amount': 0,
+        'Fee': 10,
+        'Flags': 0x80000000,
+        'Sequence': 0,
+        'SigningPubKey': key.to_public(),
+        'Memos': [{'Memo': {'MemoData': b'payout'}}]
+    }
+
+
+def test_template_render(payment):
+    template = TransactionTemplate(payment)
+    assert template.render() == serializer.serialize(payment)
+
+    values = {
+        'Sequence': 42,
+        'Amount': 1000000,
+        'Destination': 'r3P9vH81KBayazSTrQj6S25jW6kDb779Gi',
+        'DestinationTag': 1337,
+        'Fee': 12
+    }
+    assert template.render(**values) == serializer.serialize(
+        {**payment, **values}
+    )
+
+
+def test_template_sign(key, payment):
+    template = TransactionTemplate(payment)
+    values = {'Sequence': 7, 'Amount': 5000000}
+    tx = {**payment, **values}
+
+    payload = template.render(**values)
+    signature = key.sign_tx(payload, k=3)
+    assert signature == key.sign_tx(tx, k=3)
+    assert key.verify_tx(payload, signature)
+    assert hash_transaction(b'', payload, b'') == hash_transaction(
+        b'', tx, b''
+    )
+
+    blob = template.blob(payload, signature)
+    assert blob == serializer.serialize({**tx, 'TxnSignature': signature})
+
+    signed = serializer.deserialize(template.sign(key, **values))
+    assert key.verify_tx(
+        {k: v for k, v in signed.items() if k != 'TxnSignature'},
+        signed['TxnSignature']
+    )
+
+
+def test_template_invalid_slots(payment):
+    with pytest.raises(ValueError):
+        TransactionTemplate(payment, slots=['Memos'])
+
+    with pytest.raises(ValueError):
+        TransactionTemplate(payment, slots=['SourceTag'])
+
+    template = TransactionTemplate(payment)
+    with pytest.raises(ValueError):
+        template.render(Flags=0)
+
+    with pytest.raises(ValueError):
+        template.render(Amount={
+            'value': 1,
+            'code': 'USD',
+            'issuer': 'r3kmLJN5D28dHuH8vZNUZpMC43pEHpaocV'
+        })
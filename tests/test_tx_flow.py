@@ -6,6 +6,7 @@ from aioxrpy import decimals, serializer
 from aioxrpy.definitions import RippleTransactionType, RippleTransactionFlags
 from aioxrpy.keys import RippleKey
 from aioxrpy.rpc import RippleJsonRpc
+from aioxrpy.shamap import SHAMap, SHAMapLeafType
 
 
 @pytest.fixture
@@ -123,3 +124,56 @@ async def test_tx_flow_multi_sign(master):
         [account_key_1, account_key_2]
     )
     assert result['engine_result'] == 'tesSUCCESS'
+
+
+async def test_ledger_hashes(master):
+    """
+    Tests that transaction and state trees of a closed ledger hash to
+    ``transaction_hash`` and ``account_hash`` published by rippled
+    """
+    rpc = RippleJsonRpc('http://localhost:5005')
+    reserve = await rpc.get_reserve()
+    fee = await rpc.fee()
+
+    for _ in range(3):
+        await rpc.sign_and_submit(
+            {
+                'Account': master.to_account(),
+                'Amount': decimals.xrp_to_drops(reserve.base),
+                'Flags': RippleTransactionFlags.FullyCanonicalSig,
+                'TransactionType': RippleTransactionType.Payment,
+                'Destination': RippleKey().to_account(),
+                'Fee': fee.minimum
+            },
+            master
+        )
+    await rpc.ledger_accept()
+    ledger_index = (await rpc.ledger_closed())['ledger_index']
+    header = (await rpc.ledger(ledger_index))['ledger']
+
+    # transaction tree, built from signed transaction and metadata blobs
+    ledger = await rpc.ledger(
+        ledger_index, transactions=True, expand=True, binary=True
+    )
+    transactions = ledger['ledger']['transactions']
+    assert len(transactions) >= 3
+    tx_tree = SHAMap(SHAMapLeafType.TRANSACTION_WITH_META)
+    for tx in transactions:
+        tx_tree.add_transaction(
+            binascii.unhexlify(tx['tx_blob']), binascii.unhexlify(tx['meta'])
+        )
+    assert tx_tree.hash.hex().upper() == header['transaction_hash']
+
+    # state tree, built from serialized ledger entries
+    state_tree = SHAMap(SHAMapLeafType.ACCOUNT_STATE)
+    params = {'ledger_index': ledger_index, 'binary': True}
+    while True:
+        result = await rpc.post('ledger_data', params)
+        for entry in result['state']:
+            state_tree[binascii.unhexlify(entry['index'])] = (
+                binascii.unhexlify(entry['data'])
+            )
+        if 'marker' not in result:
+            break
+        params['marker'] = result['marker']
+    assert state_tree.hash.hex().upper() == header['account_hash']